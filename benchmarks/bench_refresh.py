@@ -0,0 +1,340 @@
+"""Synthetic-load benchmarks for the Strava Bike Maintenance refresh pipeline.
+
+Runs the hot path of a refresh against generated ``/athlete`` payloads inside a
+minimal in-process Home Assistant, with storage kept in memory:
+
+- ``extract_bike_distances_km``: converting the payload into per-bike totals.
+- ``process_bikes``: ``WearCounterManager.async_process_bikes`` plus the save.
+- ``update_data``: ``StravaDataUpdateCoordinator._async_update_data``.
+- ``update_data_unchanged``: the same when no bike changed since the last poll.
+- ``entity_setup``: creating sensor entities in ``sensor.async_setup_entry``.
+- ``entity_setup_fleet``: the same with the fleet sensor mode.
+
+Results are printed (or written with ``--output``) as JSON so they can be
+compared between commits. Requires Home Assistant to be installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components"))
+
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    device_registry as dr,
+    entity_registry as er,
+)
+
+from strava_bike_maintenance import (  # noqa: E402
+    coordinator as coordinator_module,
+    history,
+    sensor,
+    wear,
+)
+from strava_bike_maintenance.api import StravaApiClient  # noqa: E402
+from strava_bike_maintenance.breaker import CircuitBreaker  # noqa: E402
+from strava_bike_maintenance.components import ComponentRegistry  # noqa: E402
+from strava_bike_maintenance.const import (  # noqa: E402
+    CONF_SENSOR_MODE,
+    DOMAIN,
+    SENSOR_MODE_FLEET,
+)
+from strava_bike_maintenance.coordinator import (  # noqa: E402
+    StravaDataUpdateCoordinator,
+)
+from strava_bike_maintenance.metrics import RefreshMetrics  # noqa: E402
+from strava_bike_maintenance.scheduler import AdaptivePollScheduler  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+BENCH_ENTRY_ID = "bench"
+
+
+class InMemoryStore:
+    """Stand-in for ``Store`` that serialises to memory instead of disk."""
+
+    def __init__(self, hass: HomeAssistant, version: int, key: str, **_: Any) -> None:
+        self.key = key
+        self.data: Any = None
+        self._pending: Callable[[], Any] | None = None
+
+    def __class_getitem__(cls, _: Any) -> type[InMemoryStore]:
+        return cls
+
+    async def async_load(self) -> Any:
+        return self.data
+
+    async def async_save(self, data: Any) -> None:
+        self._pending = None
+        # Serialise like the real store so the cost of the payload is measured.
+        self.data = json.loads(json.dumps(data))
+
+    def async_delay_save(self, data_func: Callable[[], Any], delay: float = 0) -> None:
+        self._pending = data_func
+
+
+class FakeApiClient:
+    """Returns a prepared athlete payload instead of calling Strava."""
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.payload = payload
+        self.breaker = CircuitBreaker()
+
+    async def async_get_bikes(self) -> Dict[str, Any]:
+        return self.payload
+
+    async def async_get_bikes_if_modified(
+        self, etag: str | None
+    ) -> tuple[Dict[str, Any] | None, str | None]:
+        # No ETag, so unchanged payloads are caught by the fingerprint.
+        return self.payload, None
+
+
+def generate_athlete_payload(bike_count: int, seed: int = 0) -> Dict[str, Any]:
+    """Build an /athlete document with the given number of bikes."""
+    rng = random.Random(seed)
+    return {
+        "id": 1,
+        "firstname": "Bench",
+        "lastname": "Mark",
+        "bikes": [
+            {
+                "id": f"b{index:09d}",
+                "name": f"Bike {index}",
+                "brand_name": rng.choice(["Canyon", "Specialized", "Trek", None]),
+                "model_name": f"Model {rng.randint(1, 50)}",
+                "frame_type": rng.randint(1, 5),
+                "distance": rng.uniform(0, 50_000_000),
+            }
+            for index in range(bike_count)
+        ],
+        "shoes": [],
+    }
+
+
+def advance_payload(payload: Dict[str, Any], seed: int) -> Dict[str, Any]:
+    """Return a copy of the payload where every bike was ridden a little."""
+    rng = random.Random(seed)
+    return {
+        **payload,
+        "bikes": [
+            {**bike, "distance": bike["distance"] + rng.uniform(1_000, 80_000)}
+            for bike in payload["bikes"]
+        ],
+    }
+
+
+async def _time_async(
+    runs: int, setup: Callable[[], Awaitable[Any]], body: Callable[[Any], Awaitable[None]]
+) -> List[float]:
+    """Time ``body`` in milliseconds, running ``setup`` untimed before each run."""
+    timings: List[float] = []
+    for _ in range(runs):
+        context = await setup()
+        start = time.perf_counter()
+        await body(context)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _result(name: str, bikes: int, timings: List[float]) -> Dict[str, Any]:
+    return {
+        "benchmark": name,
+        "bikes": bikes,
+        "runs": len(timings),
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "max_ms": round(max(timings), 4),
+    }
+
+
+async def _async_create_hass(config_dir: str) -> HomeAssistant:
+    """Create a bare Home Assistant instance without loading any integration."""
+    try:
+        hass = HomeAssistant(config_dir)  # type: ignore[call-arg]
+    except TypeError:
+        # Older releases take no arguments and expose config_dir on the config.
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    hass.data[DOMAIN] = {
+        "entries": {},
+        "bike_index": {},
+        "apps": {},
+        "service_registered": False,
+    }
+    return hass
+
+
+def _new_coordinator(
+    hass: HomeAssistant, payload: Dict[str, Any]
+) -> StravaDataUpdateCoordinator:
+    metrics = RefreshMetrics()
+    return StravaDataUpdateCoordinator(
+        hass,
+        BENCH_ENTRY_ID,
+        FakeApiClient(payload),  # type: ignore[arg-type]
+        wear.WearCounterManager(hass, BENCH_ENTRY_ID, metrics),
+        AdaptivePollScheduler(),
+        metrics,
+        ComponentRegistry.from_options({}),
+    )
+
+
+async def async_run(sizes: List[int], runs: int) -> Dict[str, Any]:
+    """Run every benchmark for every fleet size."""
+    results: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory() as config_dir, patch.object(
+        wear, "WearStore", InMemoryStore
+    ), patch.object(history, "Store", InMemoryStore), patch.object(
+        coordinator_module, "Store", InMemoryStore
+    ):
+        hass = await _async_create_hass(config_dir)
+        # The sensor platform prunes entities of unassigned components.
+        await dr.async_load(hass)
+        await er.async_load(hass)
+
+        for size in sizes:
+            payload = generate_athlete_payload(size)
+            ridden = advance_payload(payload, seed=size)
+
+            timings: List[float] = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                StravaApiClient.extract_bike_distances_km(payload)
+                timings.append((time.perf_counter() - start) * 1000)
+            results.append(_result("extract_bike_distances_km", size, timings))
+
+            async def _baselined_manager() -> wear.WearCounterManager:
+                manager = wear.WearCounterManager(hass, BENCH_ENTRY_ID)
+                await manager.async_process_bikes(
+                    StravaApiClient.extract_bike_distances_km(payload)
+                )
+                await manager.async_flush()
+                return manager
+
+            ridden_km = StravaApiClient.extract_bike_distances_km(ridden)
+
+            async def _process(manager: wear.WearCounterManager) -> None:
+                await manager.async_process_bikes(ridden_km)
+                await manager.async_flush()
+
+            results.append(
+                _result(
+                    "process_bikes",
+                    size,
+                    await _time_async(runs, _baselined_manager, _process),
+                )
+            )
+
+            async def _baselined_coordinator() -> StravaDataUpdateCoordinator:
+                coordinator = _new_coordinator(hass, payload)
+                coordinator.data = await coordinator._async_update_data()
+                coordinator._api_client.payload = ridden  # type: ignore[attr-defined]
+                return coordinator
+
+            async def _update(coordinator: StravaDataUpdateCoordinator) -> None:
+                await coordinator._async_update_data()
+
+            results.append(
+                _result(
+                    "update_data",
+                    size,
+                    await _time_async(runs, _baselined_coordinator, _update),
+                )
+            )
+
+            async def _unchanged_coordinator() -> StravaDataUpdateCoordinator:
+                coordinator = _new_coordinator(hass, payload)
+                coordinator.data = await coordinator._async_update_data()
+                return coordinator
+
+            results.append(
+                _result(
+                    "update_data_unchanged",
+                    size,
+                    await _time_async(runs, _unchanged_coordinator, _update),
+                )
+            )
+
+            def _entity_setup(
+                options: Dict[str, Any]
+            ) -> Callable[[StravaDataUpdateCoordinator], Awaitable[None]]:
+                async def _setup(coordinator: StravaDataUpdateCoordinator) -> None:
+                    entry = SimpleNamespace(
+                        entry_id=f"bench_{size}",
+                        options=options,
+                        async_on_unload=lambda _: None,
+                    )
+                    hass.data[DOMAIN]["entries"][entry.entry_id] = {
+                        "coordinator": coordinator,
+                        "wear_manager": coordinator.wear_manager,
+                    }
+                    created: List[Any] = []
+                    await sensor.async_setup_entry(hass, entry, created.extend)
+                    # Stop the refresh timer scheduled by the platform's listener.
+                    await coordinator.async_shutdown()
+
+                return _setup
+
+            for name, options in (
+                ("entity_setup", {}),
+                ("entity_setup_fleet", {CONF_SENSOR_MODE: SENSOR_MODE_FLEET}),
+            ):
+                results.append(
+                    _result(
+                        name,
+                        size,
+                        await _time_async(
+                            runs, _baselined_coordinator, _entity_setup(options)
+                        ),
+                    )
+                )
+
+        await hass.async_stop(force=True)
+
+    return {
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+        "runs": runs,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="fleet sizes (number of bikes) to benchmark",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--output", type=Path, help="write JSON results to a file")
+    args = parser.parse_args()
+
+    report = asyncio.run(async_run(args.sizes, args.runs))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,44 +2,127 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from functools import partial
 import logging
+import secrets
 from typing import Any, Dict
 
+from aiohttp import ClientError
+from aiohttp.hdrs import METH_GET, METH_POST
+import voluptuous as vol
+
+from homeassistant.components import webhook
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.const import CONF_WEBHOOK_ID, Platform
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_entry_oauth2_flow
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.network import NoURLAvailableError
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
+from .alerts import ServiceAlerts
 from .api import StravaApiClient
+from .auth import TokenRefreshScheduler
+from .backfill import HistoryBackfill
+from .components import ComponentRegistry
 from .const import (
     API_AUTHORIZE_URL,
     API_TOKEN_URL,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    CONF_CLIMBING_KM_PER_1000M,
+    CONF_GEAR_DETAILS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PUSH_UPDATES,
+    CONF_SERVICE_NOTIFICATIONS,
+    CONF_SPORT_TYPE_FACTORS_PREFIX,
+    CONF_SYNC_MODE,
+    CONF_VERIFY_TOKEN,
+    CONF_WEAR_JOURNAL,
+    DEFAULT_SYNC_MODE,
     DOMAIN,
-    WEAR_PARTS,
+    GEAR_STORAGE_KEY,
+    HISTORY_STORAGE_KEY,
+    PUSH_FALLBACK_INTERVAL_SECONDS,
+    SNAPSHOT_STORAGE_KEY,
+    STORAGE_KEY,
+)
+from .coordinator import CONTEXT_FLEET, StravaDataUpdateCoordinator
+from .gear import GearDetailCache
+from .metrics import RefreshMetrics
+from .push import (
+    StravaPushHandler,
+    StravaPushTarget,
+    async_delete_push_subscription,
+    async_ensure_push_subscription,
 )
-from .coordinator import StravaDataUpdateCoordinator
+from .scheduler import AdaptivePollScheduler, RateLimitBudget
+from .statistics import WearStatistics
 from .wear import WearCounterManager
+from .weighting import WearWeighting, parse_sport_type_factors
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+# Stores that were shared by the whole domain before entries had their own;
+# all of them were at version 1 then and are migrated when next loaded.
+LEGACY_STORAGE_VERSION = 1
+LEGACY_STORAGE_KEYS = (
+    STORAGE_KEY,
+    HISTORY_STORAGE_KEY,
+    SNAPSHOT_STORAGE_KEY,
+    GEAR_STORAGE_KEY,
+)
+
+RESET_WEAR_COUNTER_SCHEMA = vol.Schema(
+    {
+        vol.Required("bike_id"): cv.string,
+        vol.Required("part"): cv.string,
+        vol.Optional("serviced_at"): cv.datetime,
+    }
+)
+
+RESET_WEAR_COUNTERS_SCHEMA = vol.Schema(
+    {
+        vol.Required("bike_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required("parts"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("serviced_at"): cv.datetime,
+    }
+)
+
+BACKFILL_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional("force", default=False): cv.boolean,
+    }
+)
+
 
 async def async_setup(hass: HomeAssistant, _: Dict[str, Any]) -> bool:
     """Set up the Strava Bike Maintenance domain."""
-    hass.data.setdefault(DOMAIN, {"entries": {}, "service_registered": False})
+    hass.data.setdefault(DOMAIN, _new_domain_data())
     return True
 
 
+def _new_domain_data() -> Dict[str, Any]:
+    """Return the initial shared data of the integration."""
+    # "bike_index" maps each known gear id to the entry that owns it and
+    # "apps" holds the rate-limit budget shared by entries of one Strava app.
+    return {
+        "entries": {},
+        "bike_index": {},
+        "apps": {},
+        "service_registered": False,
+    }
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Strava Bike Maintenance from a config entry."""
-    domain_data = hass.data.setdefault(
-        DOMAIN, {"entries": {}, "service_registered": False}
-    )
+    domain_data = hass.data.setdefault(DOMAIN, _new_domain_data())
 
     client_id = entry.data[CONF_CLIENT_ID]
     client_secret = entry.data[CONF_CLIENT_SECRET]
@@ -56,78 +139,457 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     session = config_entry_oauth2_flow.OAuth2Session(hass, entry, implementation)
 
-    wear_manager = WearCounterManager(hass)
+    if entry.unique_id == DOMAIN:
+        await _async_migrate_legacy_storage(hass, entry)
+
+    # Strava rate limits apply per API application, so every account set up
+    # with the same client id draws from one budget and polls in turn.
+    budget: RateLimitBudget = domain_data["apps"].setdefault(
+        client_id, RateLimitBudget()
+    )
+    budget.add_entry(entry.entry_id)
+    entry.async_on_unload(
+        partial(_async_release_budget, hass, client_id, entry.entry_id)
+    )
+
+    metrics = RefreshMetrics()
+    components = ComponentRegistry.from_options(entry.options)
+    wear_manager = WearCounterManager(
+        hass,
+        entry.entry_id,
+        metrics,
+        _weighting_from_options(entry, components),
+        entry.options.get(CONF_WEAR_JOURNAL, False),
+        components.keys,
+        ServiceAlerts(
+            hass,
+            entry.entry_id,
+            components,
+            entry.options.get(CONF_SERVICE_NOTIFICATIONS, False),
+        ),
+    )
+    push_updates = entry.options.get(CONF_PUSH_UPDATES, False)
+    if push_updates:
+        # Rides arrive by webhook; polling only remains as a slow safety net.
+        scheduler = AdaptivePollScheduler(
+            PUSH_FALLBACK_INTERVAL_SECONDS,
+            boost_on_activity=False,
+            budget=budget,
+            entry_id=entry.entry_id,
+        )
+    else:
+        scheduler = AdaptivePollScheduler(budget=budget, entry_id=entry.entry_id)
+    api_client = StravaApiClient(session, scheduler, metrics)
+    gear_details = (
+        GearDetailCache(hass, entry.entry_id, api_client)
+        if entry.options.get(CONF_GEAR_DETAILS, False)
+        else None
+    )
     coordinator = StravaDataUpdateCoordinator(
         hass,
-        StravaApiClient(session),
+        entry.entry_id,
+        api_client,
         wear_manager,
+        scheduler,
+        metrics,
+        components,
+        entry.options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE),
+        gear_details,
     )
 
-    # Fetch initial data so entities are created with real state on first load.
-    await coordinator.async_config_entry_first_refresh()
+    # Renew the token ahead of expiry so refreshes never wait for it.
+    entry.async_on_unload(TokenRefreshScheduler(hass, entry, api_client).async_start())
+
+    if await coordinator.async_restore_snapshot():
+        # Entities come up from the cached snapshot; Strava is asked in the
+        # background so startup does not depend on its latency.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        # Nothing cached yet, so fetch data for entities to start from.
+        await coordinator.async_config_entry_first_refresh()
+
+    if entry.unique_id == DOMAIN:
+        _async_migrate_legacy_unique_id(hass, entry, coordinator)
+
+    statistics: WearStatistics | None = None
+    if entry.options.get(CONF_LONG_TERM_STATISTICS, False):
+        statistics = WearStatistics(hass, components)
+
+        @callback
+        def _async_record_statistics() -> None:
+            """Import a data point for each bike the update changed."""
+            if not coordinator.last_update_success or not coordinator.data:
+                return
+            changed = coordinator.changed_bike_ids
+            statistics.async_record(
+                {
+                    gear_id: bike
+                    for gear_id, bike in coordinator.data.items()
+                    if changed is None or gear_id in changed
+                }
+            )
 
+        entry.async_on_unload(
+            coordinator.async_add_listener(_async_record_statistics, CONTEXT_FLEET)
+        )
+
+    backfill = HistoryBackfill(hass, entry, api_client, coordinator, statistics)
     domain_data["entries"][entry.entry_id] = {
         "coordinator": coordinator,
         "wear_manager": wear_manager,
+        "backfill": backfill,
+        # Token renewals also update the entry; only option changes reload it.
+        "options": dict(entry.options),
     }
 
+    @callback
+    def _async_index_bikes() -> None:
+        """Point the shared bike index at this entry's current bikes."""
+        bike_index: Dict[str, str] = domain_data["bike_index"]
+        bikes = coordinator.data or {}
+        for gear_id, entry_id in list(bike_index.items()):
+            if entry_id == entry.entry_id and gear_id not in bikes:
+                del bike_index[gear_id]
+        for gear_id in bikes:
+            bike_index[gear_id] = entry.entry_id
+
+    _async_index_bikes()
+    entry.async_on_unload(coordinator.async_add_listener(_async_index_bikes))
+
     if not domain_data["service_registered"]:
-        # Register the reset service once; it operates across all entry instances.
+        # Register the reset services once; they operate across all entry instances.
         hass.services.async_register(
             DOMAIN,
             "reset_wear_counter",
             partial(_async_handle_reset_service, hass),
+            schema=RESET_WEAR_COUNTER_SCHEMA,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "reset_wear_counters",
+            partial(_async_handle_batch_reset_service, hass),
+            schema=RESET_WEAR_COUNTERS_SCHEMA,
+        )
+        hass.services.async_register(
+            DOMAIN,
+            "backfill_history",
+            partial(_async_handle_backfill_service, hass),
+            schema=BACKFILL_HISTORY_SCHEMA,
         )
         domain_data["service_registered"] = True
 
+    if push_updates:
+        _async_setup_push(hass, entry)
+
+    if wear_manager.backfill_pending:
+        # Pick up a backfill that was interrupted by a restart.
+        backfill.async_start()
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_migrate_legacy_storage(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
+    """Move the stores of the single-account era to this entry's keys."""
+    for key in LEGACY_STORAGE_KEYS:
+        legacy_store = Store[dict[str, Any]](
+            hass, LEGACY_STORAGE_VERSION, key, private=True
+        )
+        if (data := await legacy_store.async_load()) is None:
+            continue
+        entry_store = Store[dict[str, Any]](
+            hass, LEGACY_STORAGE_VERSION, f"{key}.{entry.entry_id}", private=True
+        )
+        if await entry_store.async_load() is None:
+            await entry_store.async_save(data)
+        await legacy_store.async_remove()
+        _LOGGER.debug("Moved %s to %s.%s", key, key, entry.entry_id)
+
+
+@callback
+def _async_migrate_legacy_unique_id(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: StravaDataUpdateCoordinator,
+) -> None:
+    """Identify an entry created before multi-account support by its athlete."""
+    athlete = entry.data.get("token", {}).get("athlete") or coordinator.athlete or {}
+    if (athlete_id := athlete.get("id")) is None:
+        return
+    hass.config_entries.async_update_entry(entry, unique_id=str(athlete_id))
+
+
+@callback
+def _async_release_budget(hass: HomeAssistant, client_id: str, entry_id: str) -> None:
+    """Give up the entry's polling slot in its app's rate-limit budget."""
+    apps: Dict[str, RateLimitBudget] = hass.data[DOMAIN]["apps"]
+    if (budget := apps.get(client_id)) is None:
+        return
+    budget.remove_entry(entry_id)
+    if not budget.entry_ids:
+        del apps[client_id]
+
+
+def _weighting_from_options(
+    entry: ConfigEntry, components: ComponentRegistry
+) -> WearWeighting:
+    """Build the wear weighting configured in the entry options."""
+    return WearWeighting(
+        {
+            part: parse_sport_type_factors(
+                entry.options.get(f"{CONF_SPORT_TYPE_FACTORS_PREFIX}{part}", "")
+            )
+            for part in components.keys
+        },
+        entry.options.get(CONF_CLIMBING_KM_PER_1000M, 0.0),
+        components.keys,
+    )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the entry's Strava push subscription.
+
+    The app's single subscription also delivers the events of the other entries
+    using it, so it moves to the webhook of one of them that pushes.
+    """
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    if webhook_id is None:
+        return
+    others = _async_app_entries(hass, entry) if DOMAIN in hass.data else []
+    successor = next(
+        (
+            other
+            for other in others
+            if other.options.get(CONF_PUSH_UPDATES, False)
+            and other.data.get(CONF_WEBHOOK_ID) is not None
+            and other.data.get(CONF_VERIFY_TOKEN) is not None
+        ),
+        None,
+    )
+    try:
+        deleted = await async_delete_push_subscription(
+            hass,
+            entry.data[CONF_CLIENT_ID],
+            entry.data[CONF_CLIENT_SECRET],
+            webhook.async_generate_url(hass, webhook_id),
+        )
+        if deleted and successor is not None:
+            await async_ensure_push_subscription(
+                hass,
+                successor.data[CONF_CLIENT_ID],
+                successor.data[CONF_CLIENT_SECRET],
+                webhook.async_generate_url(hass, successor.data[CONF_WEBHOOK_ID]),
+                successor.data[CONF_VERIFY_TOKEN],
+            )
+    except (ClientError, NoURLAvailableError) as err:
+        _LOGGER.warning("Could not move Strava push subscription: %s", err)
+
+
+def _async_setup_push(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Register the webhook and make sure Strava pushes events to it."""
+    webhook_id = entry.data.get(CONF_WEBHOOK_ID)
+    verify_token = entry.data.get(CONF_VERIFY_TOKEN)
+    if webhook_id is None or verify_token is None:
+        webhook_id = webhook.async_generate_id()
+        verify_token = secrets.token_urlsafe(16)
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                CONF_WEBHOOK_ID: webhook_id,
+                CONF_VERIFY_TOKEN: verify_token,
+            },
+        )
+
+    handler = StravaPushHandler(
+        hass, verify_token, partial(_async_resolve_push_target, hass, entry)
+    )
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        "Strava Bike Maintenance",
+        webhook_id,
+        handler.async_handle_webhook,
+        allowed_methods=[METH_GET, METH_POST],
+    )
+    entry.async_on_unload(partial(webhook.async_unregister, hass, webhook_id))
+
+    async def _async_subscribe(_: HomeAssistant) -> None:
+        # Strava calls back immediately, so wait until the HTTP server is up.
+        try:
+            await async_ensure_push_subscription(
+                hass,
+                entry.data[CONF_CLIENT_ID],
+                entry.data[CONF_CLIENT_SECRET],
+                webhook.async_generate_url(hass, webhook_id),
+                verify_token,
+                [
+                    webhook.async_generate_url(hass, other.data[CONF_WEBHOOK_ID])
+                    for other in _async_app_entries(hass, entry)
+                    if other.data.get(CONF_WEBHOOK_ID) is not None
+                ],
+            )
+        except (ClientError, NoURLAvailableError) as err:
+            _LOGGER.warning(
+                "Could not subscribe to Strava push updates, polling only: %s", err
+            )
+
+    entry.async_on_unload(async_at_started(hass, _async_subscribe))
+
+
+@callback
+def _async_app_entries(hass: HomeAssistant, entry: ConfigEntry) -> list[ConfigEntry]:
+    """Return the other loaded entries that use the same Strava app."""
+    entries: Dict[str, Dict[str, Any]] = hass.data[DOMAIN]["entries"]
+    return [
+        other
+        for entry_id in entries
+        if entry_id != entry.entry_id
+        and (other := hass.config_entries.async_get_entry(entry_id)) is not None
+        and other.data[CONF_CLIENT_ID] == entry.data[CONF_CLIENT_ID]
+    ]
+
+
+@callback
+def _async_resolve_push_target(
+    hass: HomeAssistant, entry: ConfigEntry, owner_id: int
+) -> StravaPushTarget | None:
+    """Return the entry of the athlete a push event belongs to.
+
+    Strava sends events of every athlete using the app to its single
+    subscription, so the entry owning the webhook forwards them.
+    """
+    entries: Dict[str, Dict[str, Any]] = hass.data[DOMAIN]["entries"]
+    for candidate in (entry, *_async_app_entries(hass, entry)):
+        if (entry_data := entries.get(candidate.entry_id)) is None:
+            continue
+        coordinator: StravaDataUpdateCoordinator = entry_data["coordinator"]
+        athlete = coordinator.athlete or {}
+        if athlete.get("id") == owner_id or (
+            # Until the athlete is known, the webhook's own entry is assumed.
+            candidate is entry and athlete.get("id") is None
+        ):
+            return StravaPushTarget(
+                coordinator, partial(candidate.async_start_reauth, hass)
+            )
+    return None
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed options take effect."""
+    entry_data = hass.data[DOMAIN]["entries"].get(entry.entry_id)
+    if entry_data is not None and entry_data["options"] == entry.options:
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a Strava Bike Maintenance config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         domain_data = hass.data.get(DOMAIN)
         if domain_data:
-            domain_data["entries"].pop(entry.entry_id, None)
+            entry_data = domain_data["entries"].pop(entry.entry_id, None)
+            bike_index: Dict[str, str] = domain_data["bike_index"]
+            for gear_id, entry_id in list(bike_index.items()):
+                if entry_id == entry.entry_id:
+                    del bike_index[gear_id]
+            if entry_data is not None:
+                # A reload creates a new manager that reads from disk, so any
+                # delayed write must land first.
+                await entry_data["wear_manager"].async_flush()
+                await entry_data["coordinator"].async_flush_snapshot()
     return unload_ok
 
 
 async def _async_handle_reset_service(hass: HomeAssistant, call: ServiceCall) -> None:
     """Handle the reset_wear_counter service call."""
-    bike_id: str = call.data["bike_id"]
-    part: str = call.data["part"]
+    await _async_reset_counters(
+        hass,
+        [call.data["bike_id"]],
+        [call.data["part"]],
+        call.data.get("serviced_at"),
+    )
 
-    if part not in WEAR_PARTS:
-        raise HomeAssistantError(f"Unknown wear part '{part}'.")
 
-    domain_data = hass.data.get(DOMAIN, {})
-    entries: Dict[str, Dict[str, Any]] = domain_data.get("entries", {})
+async def _async_handle_batch_reset_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the reset_wear_counters service call."""
+    await _async_reset_counters(
+        hass, call.data["bike_ids"], call.data["parts"], call.data.get("serviced_at")
+    )
 
+
+async def _async_handle_backfill_service(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Handle the backfill_history service call.
+
+    The backfill runs in the background; the call returns once it has started.
+    ``force`` runs a completed backfill again.
+    """
+    entries: Dict[str, Dict[str, Any]] = hass.data.get(DOMAIN, {}).get("entries", {})
     if not entries:
         raise HomeAssistantError("Strava Bike Maintenance is not configured.")
+    for entry_data in entries.values():
+        backfill: HistoryBackfill = entry_data["backfill"]
+        backfill.async_start(call.data["force"])
 
-    handled = False
 
-    for entry_data in entries.values():
-        coordinator: StravaDataUpdateCoordinator = entry_data["coordinator"]
-        wear_manager: WearCounterManager = entry_data["wear_manager"]
+async def _async_reset_counters(
+    hass: HomeAssistant,
+    bike_ids: list[str],
+    parts: list[str],
+    serviced_at: datetime | None = None,
+) -> None:
+    """Reset every given part on every given bike.
 
-        if bike_id not in coordinator.data:
-            continue
+    Resets are grouped per config entry so each entry persists once and
+    publishes a single coordinator update. A ``serviced_at`` date sets the
+    counters to the distance ridden since then; naive dates are local time.
+    """
+    serviced_ts: float | None = None
+    if serviced_at is not None:
+        serviced_ts = dt_util.as_utc(serviced_at).timestamp()
+        if serviced_ts > dt_util.utcnow().timestamp():
+            raise HomeAssistantError("The service date cannot be in the future.")
+
+    domain_data = hass.data.get(DOMAIN, {})
+    entries: Dict[str, Dict[str, Any]] = domain_data.get("entries", {})
+
+    if not entries:
+        raise HomeAssistantError("Strava Bike Maintenance is not configured.")
 
-        await wear_manager.async_reset_counter(bike_id, part)
-        wear_snapshot = await wear_manager.async_get_wear_snapshot(bike_id)
+    bike_index: Dict[str, str] = domain_data["bike_index"]
+    bikes_by_entry: Dict[str, list[str]] = {}
+    for bike_id in bike_ids:
+        entry_id = bike_index.get(bike_id)
+        if entry_id is None or entry_id not in entries:
+            raise HomeAssistantError(
+                f"Bike with id '{bike_id}' is not known to this integration."
+            )
+        # Components are configured per bike, so check each one carries them.
+        components = entries[entry_id]["coordinator"].components
+        for part in parts:
+            if part not in components.for_bike(bike_id):
+                raise HomeAssistantError(
+                    f"Bike '{bike_id}' has no wear component '{part}'."
+                )
+        bikes_by_entry.setdefault(entry_id, []).append(bike_id)
 
-        updated_data = dict(coordinator.data)
-        bike_data = dict(updated_data[bike_id])
-        bike_data["wear_counters"] = wear_snapshot
-        updated_data[bike_id] = bike_data
-        coordinator.async_set_updated_data(updated_data)
-        handled = True
+    for entry_id, entry_bike_ids in bikes_by_entry.items():
+        coordinator: StravaDataUpdateCoordinator = entries[entry_id]["coordinator"]
+        wear_manager: WearCounterManager = entries[entry_id]["wear_manager"]
 
-    if not handled:
-        raise HomeAssistantError(
-            f"Bike with id '{bike_id}' is not known to this integration."
+        await wear_manager.async_reset_counters(
+            ((bike_id, part) for bike_id in entry_bike_ids for part in parts),
+            serviced_ts,
         )
+        await coordinator.async_refresh_bikes(entry_bike_ids)
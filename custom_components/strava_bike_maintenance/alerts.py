@@ -0,0 +1,85 @@
+"""Service-due alerts for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from typing import Dict
+
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from .components import ComponentRegistry
+from .const import DOMAIN, EVENT_SERVICE_DUE
+
+
+class ServiceAlerts:
+    """Announces wear counters crossing their component's service interval.
+
+    The wear manager reports each crossing once, when a refresh moves a
+    counter from below the interval to at or above it. Every crossing fires
+    EVENT_SERVICE_DUE and, if enabled, raises a persistent notification that
+    is dismissed again when the counter is reset.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        components: ComponentRegistry,
+        notify: bool = False,
+    ) -> None:
+        self._hass = hass
+        self._entry_id = entry_id
+        self._components = components
+        self._notify = notify
+
+    def thresholds_km(self, bike_id: str) -> Dict[str, float]:
+        """Return the service interval of every component a bike carries."""
+        intervals_km = self._components.intervals_km
+        return {part: intervals_km[part] for part in self._components.for_bike(bike_id)}
+
+    @callback
+    def async_service_due(self, bike_id: str, part: str, wear_km: float) -> None:
+        """Announce that a bike's component reached its service interval."""
+        interval_km = self._components.intervals_km[part]
+        part_name = self._components.name(part)
+        self._hass.bus.async_fire(
+            EVENT_SERVICE_DUE,
+            {
+                "entry_id": self._entry_id,
+                "bike_id": bike_id,
+                "wear_part": part,
+                "wear_part_name": part_name,
+                "wear_km": round(wear_km, 1),
+                "service_interval_km": interval_km,
+            },
+        )
+        if not self._notify:
+            return
+        persistent_notification.async_create(
+            self._hass,
+            f"{part_name} on {self._bike_name(bike_id)} reached its service "
+            f"interval of {interval_km:g} km after {wear_km:.0f} km.",
+            title="Bike service due",
+            notification_id=self._notification_id(bike_id, part),
+        )
+
+    @callback
+    def async_reset(self, bike_id: str, part: str) -> None:
+        """Dismiss the notification of a component that was serviced."""
+        if self._notify:
+            persistent_notification.async_dismiss(
+                self._hass, self._notification_id(bike_id, part)
+            )
+
+    def _bike_name(self, bike_id: str) -> str:
+        # The device name follows Strava and any rename in Home Assistant.
+        device = dr.async_get(self._hass).async_get_device(
+            identifiers={(DOMAIN, bike_id)}
+        )
+        if device is None:
+            return bike_id
+        return device.name_by_user or device.name or bike_id
+
+    def _notification_id(self, bike_id: str, part: str) -> str:
+        return f"{DOMAIN}_{self._entry_id}_{bike_id}_{part}_service_due"
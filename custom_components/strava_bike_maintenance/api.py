@@ -3,43 +3,235 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+from http import HTTPStatus
 import logging
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
-from aiohttp import ClientResponseError
+from aiohttp import ClientError, ClientResponseError, ClientTimeout
 from homeassistant.helpers import config_entry_oauth2_flow
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
-from .const import API_BASE_URL
+from .breaker import CircuitBreaker
+from .const import (
+    ACTIVITIES_PAGE_SIZE,
+    API_BASE_URL,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_REQUEST_TIMEOUT_SECONDS,
+)
+from .metrics import (
+    METRIC_API_LATENCY,
+    METRIC_PAYLOAD_SIZE,
+    METRIC_TOKEN_REFRESH,
+    RefreshMetrics,
+)
+from .scheduler import AdaptivePollScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class StravaRide:
+    """A Strava activity recorded with a piece of gear."""
+
+    activity_id: int
+    gear_id: str
+    start_ts: int
+    distance_km: float
+    sport_type: str | None = None
+    elevation_gain_m: float = 0.0
+
+
 class StravaApiClient:
     """Wraps authenticated access to Strava endpoints."""
 
-    def __init__(self, oauth_session: config_entry_oauth2_flow.OAuth2Session) -> None:
+    def __init__(
+        self,
+        oauth_session: config_entry_oauth2_flow.OAuth2Session,
+        scheduler: AdaptivePollScheduler | None = None,
+        metrics: RefreshMetrics | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         self._session = oauth_session
-        # Serialise outgoing requests so token refreshes from the session cannot race.
-        self._lock = asyncio.Lock()
+        self._scheduler = scheduler
+        self._metrics = metrics or RefreshMetrics()
+        self.breaker = breaker or CircuitBreaker()
+        # Requests run concurrently up to this bound; token refreshes are
+        # deduplicated separately so they cannot race.
+        self._semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._token_refresh: asyncio.Task[None] | None = None
 
-    async def async_get_bikes(self) -> Dict[str, Any]:
-        """Fetch the authenticated athlete's bike data."""
-        async with self._lock:
+    async def async_ensure_token_valid(self, *, force: bool = False) -> None:
+        """Refresh the access token if needed, sharing one refresh between callers.
+
+        With ``force`` the token is renewed even though it is still valid, which
+        lets it be refreshed ahead of expiry.
+        """
+        if not force and self._session.valid_token:
+            return
+        if self._token_refresh is None:
+            self._token_refresh = self._session.hass.async_create_task(
+                self._async_refresh_token()
+            )
+        # Shielded so a cancelled caller does not abort the shared refresh.
+        await asyncio.shield(self._token_refresh)
+
+    async def _async_refresh_token(self) -> None:
+        session = self._session
+        try:
+            with self._metrics.measure(METRIC_TOKEN_REFRESH):
+                token = await session.implementation.async_refresh_token(
+                    session.token
+                )
+            session.hass.config_entries.async_update_entry(
+                session.config_entry,
+                data={**session.config_entry.data, "token": token},
+            )
+        finally:
+            self._token_refresh = None
+
+    async def _async_get_json(
+        self, path: str, params: Dict[str, Any] | None = None
+    ) -> Any:
+        """Perform an authenticated GET request and decode the JSON body."""
+        data, _ = await self._async_get(path, params)
+        return data
+
+    async def _async_get(
+        self,
+        path: str,
+        params: Dict[str, Any] | None = None,
+        etag: str | None = None,
+    ) -> Tuple[Any, str | None]:
+        """Perform an authenticated GET request and return the body and its ETag.
+
+        With ``etag`` the request is conditional, and None is returned as the
+        body when Strava answers 304 Not Modified. Raises
+        StravaCircuitOpenError without sending anything while the circuit
+        breaker is open.
+        """
+        headers = {"If-None-Match": etag} if etag is not None else {}
+        async with self._semaphore:
+            self.breaker.before_request()
             try:
-                data = await self._session.async_request(
-                    "get",
-                    f"{API_BASE_URL}/athlete",
-                    raise_for_status=True,
+                await self.async_ensure_token_valid()
+                with self._metrics.measure(METRIC_API_LATENCY):
+                    # Use the token directly; going through the session would
+                    # check expiry again and could start a second refresh.
+                    response = await config_entry_oauth2_flow.async_oauth2_request(
+                        self._session.hass,
+                        self._session.token,
+                        "get",
+                        f"{API_BASE_URL}{path}",
+                        params=params,
+                        headers=headers,
+                        raise_for_status=True,
+                        timeout=ClientTimeout(total=API_REQUEST_TIMEOUT_SECONDS),
+                    )
+                    body = await response.read()
+                if self._scheduler is not None:
+                    self._scheduler.observe_headers(response.headers)
+                self._metrics.record(METRIC_PAYLOAD_SIZE, len(body))
+                data = (
+                    None
+                    if response.status == HTTPStatus.NOT_MODIFIED
+                    else json_loads(body)
                 )
             except ClientResponseError as err:
-                _LOGGER.error(
+                if self._scheduler is not None:
+                    if err.status == HTTPStatus.TOO_MANY_REQUESTS:
+                        self._scheduler.observe_rate_limited(err.headers)
+                    elif err.headers is not None:
+                        self._scheduler.observe_headers(err.headers)
+                # The breaker logs once when an outage pauses requests.
+                self.breaker.record_failure(err)
+                _LOGGER.debug(
                     "Strava API request failed: status=%s message=%s",
                     err.status,
                     err.message,
                 )
                 raise
+            except (ClientError, asyncio.TimeoutError) as err:
+                self.breaker.record_failure(err)
+                _LOGGER.debug("Strava API request failed: %s", err)
+                raise
+            except asyncio.CancelledError:
+                self.breaker.cancel_probe()
+                raise
+            self.breaker.record_success()
 
-        return data
+        return data, response.headers.get("ETag", etag)
+
+    async def async_get_bikes(self) -> Dict[str, Any]:
+        """Fetch the authenticated athlete's bike data."""
+        return await self._async_get_json("/athlete")
+
+    async def async_get_bikes_if_modified(
+        self, etag: str | None
+    ) -> Tuple[Dict[str, Any] | None, str | None]:
+        """Fetch the athlete's bike data unless it still matches ``etag``.
+
+        Returns None instead of the payload when it is unchanged, together
+        with the ETag to send next time.
+        """
+        return await self._async_get("/athlete", etag=etag)
+
+    async def async_get_activities_since(self, after: int) -> List[Dict[str, Any]]:
+        """Fetch every activity that started after the given epoch timestamp."""
+        activities: List[Dict[str, Any]] = []
+        page = 1
+        while True:
+            batch = await self._async_get_json(
+                "/athlete/activities",
+                {"after": after, "page": page, "per_page": ACTIVITIES_PAGE_SIZE},
+            )
+            if not batch:
+                break
+            activities.extend(batch)
+            # A short page means Strava has nothing further to return.
+            if len(batch) < ACTIVITIES_PAGE_SIZE:
+                break
+            page += 1
+        return activities
+
+    async def async_iter_activities_until(
+        self, until: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of activities that started at or before the timestamp, newest first.
+
+        Each page continues from the oldest activity of the previous one, so
+        only a single page is held in memory however long the history is.
+        Activities sharing that start time are repeated on the next page and
+        have to be skipped by id.
+        """
+        while True:
+            # Strava's bound is exclusive.
+            batch = await self._async_get_json(
+                "/athlete/activities",
+                {"before": until + 1, "per_page": ACTIVITIES_PAGE_SIZE},
+            )
+            if not batch:
+                return
+            yield batch
+            starts = [
+                start.timestamp()
+                for activity in batch
+                if (start := dt_util.parse_datetime(activity.get("start_date") or ""))
+            ]
+            if len(batch) < ACTIVITIES_PAGE_SIZE or not starts:
+                return
+            # A full page starting within one second would repeat forever, so
+            # step past that second instead.
+            until = min(int(min(starts)), until - 1)
+
+    async def async_get_gear(self, gear_id: str) -> Dict[str, Any]:
+        """Fetch the full details of a bike or pair of shoes."""
+        return await self._async_get_json(f"/gear/{gear_id}")
+
+    async def async_get_activity(self, activity_id: int) -> Dict[str, Any]:
+        """Fetch a single activity, e.g. after a push notification."""
+        return await self._async_get_json(f"/activities/{activity_id}")
 
     @staticmethod
     def extract_bike_distances_km(athlete_payload: Dict[str, Any]) -> Dict[str, float]:
@@ -57,3 +249,31 @@ class StravaApiClient:
                 continue
             distances[gear_id] = distance_km
         return distances
+
+    @staticmethod
+    def extract_rides(activities: List[Dict[str, Any]]) -> List[StravaRide]:
+        """Return the activities that carry gear, distance and a start time."""
+        rides: List[StravaRide] = []
+        for activity in activities:
+            activity_id = activity.get("id")
+            gear_id = activity.get("gear_id")
+            distance_meters = activity.get("distance")
+            start = dt_util.parse_datetime(activity.get("start_date") or "")
+            if None in (activity_id, gear_id, distance_meters, start):
+                continue
+            try:
+                distance_km = float(distance_meters) / 1000
+                elevation_gain_m = float(activity.get("total_elevation_gain") or 0.0)
+            except (TypeError, ValueError):
+                continue
+            rides.append(
+                StravaRide(
+                    activity_id=int(activity_id),
+                    gear_id=gear_id,
+                    start_ts=int(start.timestamp()),
+                    distance_km=distance_km,
+                    sport_type=activity.get("sport_type") or activity.get("type"),
+                    elevation_gain_m=elevation_gain_m,
+                )
+            )
+        return rides
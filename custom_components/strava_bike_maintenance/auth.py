@@ -0,0 +1,107 @@
+"""Proactive OAuth token renewal for the Strava Bike Maintenance integration."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientError, ClientResponseError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .api import StravaApiClient
+from .const import (
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    TOKEN_REFRESH_MAX_RETRY_SECONDS,
+    TOKEN_REFRESH_RETRY_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenRefreshScheduler:
+    """Renews the access token shortly before it expires.
+
+    Polls and service calls then find a valid token instead of paying for a
+    refresh round trip themselves.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, api_client: StravaApiClient
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._api_client = api_client
+        self._retry_seconds = TOKEN_REFRESH_RETRY_SECONDS
+        self._reauth_started = False
+        self._unsub_refresh: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Schedule the first renewal and return a callback that stops it."""
+        self._async_schedule(self._seconds_until_refresh())
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the pending renewal."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    def _seconds_until_refresh(self) -> float:
+        expires_at = self._entry.data.get("token", {}).get("expires_at")
+        if expires_at is None:
+            return 0.0
+        return max(float(expires_at) - TOKEN_REFRESH_MARGIN_SECONDS - time.time(), 0.0)
+
+    @callback
+    def _async_schedule(self, delay: float) -> None:
+        self.async_stop()
+        self._unsub_refresh = async_call_later(self._hass, delay, self._async_refresh)
+
+    async def _async_refresh(self, _: Any) -> None:
+        self._unsub_refresh = None
+        # A poll may have refreshed the token since this was scheduled.
+        if (delay := self._seconds_until_refresh()) > 0:
+            self._async_schedule(delay)
+            return
+
+        try:
+            await self._api_client.async_ensure_token_valid(force=True)
+        except ClientResponseError as err:
+            if err.status not in (HTTPStatus.BAD_REQUEST, HTTPStatus.UNAUTHORIZED):
+                self._async_retry(err)
+                return
+            # Strava rejected the refresh token; only the user can fix that, so
+            # stop retrying and ask for re-authentication once.
+            if not self._reauth_started:
+                _LOGGER.warning(
+                    "Strava refused to renew the access token, re-authentication required"
+                )
+                self._reauth_started = True
+                self._entry.async_start_reauth(self._hass)
+            return
+        except (ClientError, asyncio.TimeoutError) as err:
+            self._async_retry(err)
+            return
+
+        self._retry_seconds = TOKEN_REFRESH_RETRY_SECONDS
+        self._async_schedule(self._seconds_until_refresh())
+
+    @callback
+    def _async_retry(self, err: Exception) -> None:
+        _LOGGER.debug(
+            "Could not renew Strava token, retrying in %s seconds: %s",
+            self._retry_seconds,
+            err,
+        )
+        self._async_schedule(self._retry_seconds)
+        self._retry_seconds = min(
+            self._retry_seconds * 2, TOKEN_REFRESH_MAX_RETRY_SECONDS
+        )
@@ -0,0 +1,119 @@
+"""Historical activity backfill for the Strava Bike Maintenance integration."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+import logging
+
+from aiohttp import ClientError, ClientResponseError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .api import StravaApiClient
+from .const import DOMAIN
+from .coordinator import StravaDataUpdateCoordinator
+from .statistics import WearStatistics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HistoryBackfill:
+    """Streams every past ride into the wear history, one page at a time.
+
+    Runs as a background task next to regular polling. Progress is
+    checkpointed by the wear manager after each page, so an interrupted
+    backfill continues where it stopped. A completed backfill only runs
+    again when forced, e.g. after rides were moved to another bike.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api_client: StravaApiClient,
+        coordinator: StravaDataUpdateCoordinator,
+        statistics: WearStatistics | None = None,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._api_client = api_client
+        self._coordinator = coordinator
+        self._statistics = statistics
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether a backfill is in progress."""
+        return self._task is not None
+
+    @callback
+    def async_start(self, force: bool = False) -> bool:
+        """Start or resume the backfill; return False if one is already running.
+
+        With ``force`` a completed backfill starts over.
+        """
+        if self._task is not None:
+            return False
+        self._task = self._entry.async_create_background_task(
+            self._hass, self._async_run(force), f"{DOMAIN} history backfill"
+        )
+        return True
+
+    async def _async_run(self, force: bool) -> None:
+        try:
+            if force:
+                await self._coordinator.wear_manager.async_restart_backfill()
+            await self._async_backfill()
+        finally:
+            self._task = None
+
+    async def _async_backfill(self) -> None:
+        wear_manager = self._coordinator.wear_manager
+        scheduler = self._coordinator.scheduler
+        rides_read = 0
+        while (before := await wear_manager.async_begin_backfill()) is not None:
+            try:
+                async for batch in self._api_client.async_iter_activities_until(
+                    before
+                ):
+                    # A successful page ends any rate-limit backoff.
+                    scheduler.budget.observe_success()
+                    rides = StravaApiClient.extract_rides(batch)
+                    await wear_manager.async_process_backfill(rides)
+                    rides_read += len(rides)
+                    if delay := scheduler.bulk_delay():
+                        _LOGGER.debug(
+                            "Pausing history backfill for %.0f seconds to stay "
+                            "within the Strava rate limit",
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+            except ClientResponseError as err:
+                if err.status != HTTPStatus.TOO_MANY_REQUESTS:
+                    _LOGGER.warning(
+                        "History backfill stopped, will resume later: %s", err
+                    )
+                    return
+                # Resume from the checkpoint once the backoff has passed.
+                await asyncio.sleep(scheduler.bulk_delay())
+                continue
+            except (ClientError, asyncio.TimeoutError) as err:
+                # The checkpoint of the last page is kept, so the next run
+                # resumes from it.
+                _LOGGER.warning(
+                    "History backfill stopped, will resume later: %s", err
+                )
+                return
+
+            await wear_manager.async_finish_backfill()
+            _LOGGER.info("History backfill complete, %s rides read", rides_read)
+            if self._coordinator.data is not None:
+                await self._coordinator.async_refresh_bikes(self._coordinator.data)
+                if self._statistics is not None:
+                    self._statistics.async_import_history(
+                        self._coordinator.data,
+                        wear_manager.history,
+                        wear_manager.tracked_since,
+                    )
@@ -0,0 +1,144 @@
+"""Circuit breaker for Strava API requests."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+import logging
+import random
+import time
+
+from aiohttp import ClientConnectionError, ClientError, ClientResponseError
+
+from .const import (
+    CIRCUIT_BACKOFF_SECONDS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_MAX_BACKOFF_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+FAILURE_RATE_LIMITED = "rate_limited"
+FAILURE_SERVER = "server"
+FAILURE_TIMEOUT = "timeout"
+FAILURE_CONNECTION = "connection"
+FAILURE_AUTH = "auth"
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class StravaCircuitOpenError(ClientError):
+    """Raised instead of sending a request while the circuit is open."""
+
+
+def classify_failure(err: BaseException) -> str | None:
+    """Return the kind of outage an error points to, or None if request specific."""
+    if isinstance(err, ClientResponseError):
+        if err.status == HTTPStatus.TOO_MANY_REQUESTS:
+            return FAILURE_RATE_LIMITED
+        if err.status in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+            return FAILURE_AUTH
+        if err.status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return FAILURE_SERVER
+        return None
+    if isinstance(err, asyncio.TimeoutError):
+        return FAILURE_TIMEOUT
+    if isinstance(err, ClientConnectionError):
+        return FAILURE_CONNECTION
+    return None
+
+
+class CircuitBreaker:
+    """Stops calling Strava after repeated failures and probes for recovery.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive failures, or a single auth
+    failure, the circuit opens and requests fail fast. Once the backoff has
+    passed, a single half-open probe is let through. Success closes the
+    circuit; another failure reopens it for twice as long, with jitter.
+    """
+
+    def __init__(self) -> None:
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._open_until = 0.0
+        self._probing = False
+        self.last_failure: str | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the circuit state, moving from open to half-open when due."""
+        if self._state == STATE_OPEN and time.monotonic() >= self._open_until:
+            self._state = STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are currently refused."""
+        state = self.state
+        return state == STATE_OPEN or (state == STATE_HALF_OPEN and self._probing)
+
+    def retry_after(self) -> float:
+        """Return the seconds until the next request is allowed."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def before_request(self) -> None:
+        """Raise StravaCircuitOpenError unless a request may be sent now."""
+        state = self.state
+        if state == STATE_OPEN or (state == STATE_HALF_OPEN and self._probing):
+            raise StravaCircuitOpenError(
+                f"Strava circuit open after {self.last_failure} failures"
+            )
+        if state == STATE_HALF_OPEN:
+            self._probing = True
+
+    def cancel_probe(self) -> None:
+        """Allow a new probe after the current one was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self._state != STATE_CLOSED:
+            _LOGGER.info("Strava API reachable again, resuming requests")
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened = 0
+        self._probing = False
+
+    def record_failure(self, err: BaseException) -> bool:
+        """Count a failed request; return True if it opened the circuit."""
+        kind = classify_failure(err)
+        if kind is None:
+            # Request-specific errors such as 404 say nothing about Strava's health.
+            if self._probing:
+                self.record_success()
+            return False
+
+        self.last_failure = kind
+        self._failures += 1
+        was_probing = self._probing
+        self._probing = False
+        if (
+            not was_probing
+            and kind != FAILURE_AUTH
+            and self._failures < CIRCUIT_FAILURE_THRESHOLD
+        ):
+            return False
+
+        self._opened += 1
+        backoff = min(
+            CIRCUIT_BACKOFF_SECONDS * 2 ** (self._opened - 1),
+            CIRCUIT_MAX_BACKOFF_SECONDS,
+        )
+        self._open_until = time.monotonic() + random.uniform(backoff / 2, backoff)
+        opened = self._state == STATE_CLOSED
+        self._state = STATE_OPEN
+        if opened:
+            _LOGGER.warning(
+                "Pausing Strava requests after repeated %s failures: %s", kind, err
+            )
+        return opened
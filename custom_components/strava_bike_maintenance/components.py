@@ -0,0 +1,127 @@
+"""Wear component registry for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Sequence
+
+from homeassistant.util import slugify
+
+from .const import (
+    COMPONENT_CATALOG,
+    CONF_BIKE_COMPONENTS_PREFIX,
+    CONF_COMPONENTS,
+    CONF_CUSTOM_COMPONENTS,
+    CONF_SERVICE_INTERVAL_PREFIX,
+    CUSTOM_COMPONENT_INTERVAL_KM,
+    DEFAULT_COMPONENTS,
+    DEFAULT_SERVICE_INTERVALS_KM,
+)
+
+
+@dataclass(frozen=True)
+class WearComponent:
+    """A bike part whose wear is tracked by distance."""
+
+    key: str
+    name: str
+    interval_km: float
+
+
+def parse_custom_components(value: str) -> Dict[str, str]:
+    """Parse "Derailleur pulleys, Headset" into names keyed by component key.
+
+    Raises ValueError for names that clash with another component.
+    """
+    components: Dict[str, str] = {}
+    for item in value.replace("\n", ",").split(","):
+        name = item.strip()
+        if not name:
+            continue
+        key = slugify(name)
+        if not key or key in COMPONENT_CATALOG or key in components:
+            raise ValueError(f"Component '{name}' is already defined")
+        components[key] = name
+    return components
+
+
+class ComponentRegistry:
+    """The wear components of a config entry and which bike carries which.
+
+    Components come from the built-in catalog plus user-defined ones. Bikes
+    without their own selection carry every component.
+    """
+
+    def __init__(
+        self,
+        components: Sequence[WearComponent],
+        bike_components: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        self._components = {component.key: component for component in components}
+        self._bike_components = {
+            bike_id: tuple(key for key in keys if key in self._components)
+            for bike_id, keys in (bike_components or {}).items()
+        }
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> ComponentRegistry:
+        """Build the registry configured in the entry options."""
+        names: Dict[str, str] = {
+            key: COMPONENT_CATALOG[key]
+            for key in options.get(CONF_COMPONENTS, DEFAULT_COMPONENTS)
+            if key in COMPONENT_CATALOG
+        }
+        names.update(
+            parse_custom_components(options.get(CONF_CUSTOM_COMPONENTS, ""))
+        )
+        components = [
+            WearComponent(
+                key,
+                name,
+                float(
+                    options.get(
+                        f"{CONF_SERVICE_INTERVAL_PREFIX}{key}",
+                        DEFAULT_SERVICE_INTERVALS_KM.get(
+                            key, CUSTOM_COMPONENT_INTERVAL_KM
+                        ),
+                    )
+                ),
+            )
+            for key, name in names.items()
+        ]
+        bike_components = {
+            option[len(CONF_BIKE_COMPONENTS_PREFIX) :]: keys
+            for option, keys in options.items()
+            if option.startswith(CONF_BIKE_COMPONENTS_PREFIX)
+        }
+        return cls(components, bike_components)
+
+    def __iter__(self) -> Iterator[WearComponent]:
+        return iter(self._components.values())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._components
+
+    @property
+    def keys(self) -> List[str]:
+        """Return the keys of every component, in configuration order."""
+        return list(self._components)
+
+    @property
+    def intervals_km(self) -> Dict[str, float]:
+        """Return the service interval of every component."""
+        return {
+            key: component.interval_km for key, component in self._components.items()
+        }
+
+    def name(self, key: str) -> str:
+        """Return the display name of a component."""
+        component = self._components.get(key)
+        if component is None:
+            return key.replace("_", " ").title()
+        return component.name
+
+    def for_bike(self, bike_id: str) -> Sequence[str]:
+        """Return the keys of the components a bike carries."""
+        keys = self._bike_components.get(bike_id)
+        return keys if keys is not None else tuple(self._components)
@@ -11,15 +11,40 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_entry_oauth2_flow
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 
 from .const import (
     API_AUTHORIZE_URL,
     API_TOKEN_URL,
+    COMPONENT_CATALOG,
+    CONF_BIKE_COMPONENTS_PREFIX,
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
+    CONF_CLIMBING_KM_PER_1000M,
+    CONF_COMPONENTS,
+    CONF_CUSTOM_COMPONENTS,
+    CONF_FLEET_PART_SENSORS,
+    CONF_GEAR_DETAILS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_PUSH_UPDATES,
+    CONF_SENSOR_MODE,
+    CONF_SERVICE_INTERVAL_PREFIX,
+    CONF_SERVICE_NOTIFICATIONS,
+    CONF_SPORT_TYPE_FACTORS_PREFIX,
+    CONF_SYNC_MODE,
+    CONF_WEAR_JOURNAL,
+    DEFAULT_COMPONENTS,
+    DEFAULT_SENSOR_MODE,
+    DEFAULT_SYNC_MODE,
     DOMAIN,
+    SENSOR_MODE_FLEET,
+    SENSOR_MODE_PER_PART,
+    SYNC_MODE_ACTIVITIES,
+    SYNC_MODE_TOTALS,
 )
+from .components import ComponentRegistry, parse_custom_components
+from .weighting import parse_sport_type_factors
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,9 +83,6 @@ class StravaConfigFlow(
             except HomeAssistantError:
                 errors["base"] = "missing_external_url"
             else:
-                await self.async_set_unique_id(DOMAIN)
-                self._abort_if_unique_id_configured()
-
                 self._client_id = user_input[CONF_CLIENT_ID]
                 self._client_secret = user_input[CONF_CLIENT_SECRET]
 
@@ -116,9 +138,30 @@ class StravaConfigFlow(
         data[CONF_CLIENT_ID] = self._client_id
         data[CONF_CLIENT_SECRET] = self._client_secret
 
+        # Strava returns the athlete with the first token; each athlete gets
+        # one entry, so several accounts can be tracked side by side.
+        athlete = data.get("token", {}).get("athlete") or {}
+        if athlete.get("id") is None:
+            return self.async_abort(reason="missing_athlete")
+        await self.async_set_unique_id(str(athlete["id"]))
+
+        if self.source == config_entries.SOURCE_REAUTH:
+            entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+            assert entry is not None  # nosec
+            # Entries from before multi-account support still use the domain.
+            if entry.unique_id not in (self.unique_id, DOMAIN):
+                return self.async_abort(reason="wrong_account")
+            return self.async_update_reload_and_abort(
+                entry, unique_id=self.unique_id, data={**entry.data, **data}
+            )
+
+        self._abort_if_unique_id_configured()
+        name = " ".join(
+            part for part in (athlete.get("firstname"), athlete.get("lastname")) if part
+        )
+        title = "Strava Bike Maintenance"
         return self.async_create_entry(
-            title="Strava Bike Maintenance",
-            data=data,
+            title=f"{title} ({name})" if name else title, data=data
         )
 
     @staticmethod
@@ -131,20 +174,193 @@ class StravaConfigFlow(
     def extra_authorize_data(self) -> dict:
         """Additional data to append to the authorisation URL."""
         return {
-            "scope": "read",
+            # Activity sync needs to list rides, including private ones.
+            "scope": "read,activity:read_all",
             "approval_prompt": "auto",
         }
 
 
 class StravaOptionsFlow(config_entries.OptionsFlow):
-    """Placeholder for potential future options."""
+    """Handle options for Strava Bike Maintenance.
+
+    General options and the tracked components come first, then the service
+    interval and weighting of each component, then which bike carries which.
+    """
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self.config_entry = config_entry
+        self._options: dict[str, Any] = {}
 
     async def async_step_init(self, user_input=None):
         """Options flow entry point."""
-        return self.async_create_entry(title="", data={})
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                parse_custom_components(user_input.get(CONF_CUSTOM_COMPONENTS, ""))
+            except ValueError:
+                errors[CONF_CUSTOM_COMPONENTS] = "invalid_custom_components"
+            if not errors:
+                self._options.update(user_input)
+                return await self.async_step_components()
+
+        options = user_input or self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_SYNC_MODE,
+                        default=options.get(CONF_SYNC_MODE, DEFAULT_SYNC_MODE),
+                    ): vol.In([SYNC_MODE_TOTALS, SYNC_MODE_ACTIVITIES]),
+                    vol.Required(
+                        CONF_PUSH_UPDATES,
+                        default=options.get(CONF_PUSH_UPDATES, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_GEAR_DETAILS,
+                        default=options.get(CONF_GEAR_DETAILS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_LONG_TERM_STATISTICS,
+                        default=options.get(CONF_LONG_TERM_STATISTICS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_SENSOR_MODE,
+                        default=options.get(CONF_SENSOR_MODE, DEFAULT_SENSOR_MODE),
+                    ): vol.In([SENSOR_MODE_PER_PART, SENSOR_MODE_FLEET]),
+                    vol.Required(
+                        CONF_COMPONENTS,
+                        default=options.get(CONF_COMPONENTS, DEFAULT_COMPONENTS),
+                    ): cv.multi_select(COMPONENT_CATALOG),
+                    vol.Optional(
+                        CONF_CUSTOM_COMPONENTS,
+                        default=options.get(CONF_CUSTOM_COMPONENTS, ""),
+                    ): str,
+                    vol.Required(
+                        CONF_SERVICE_NOTIFICATIONS,
+                        default=options.get(CONF_SERVICE_NOTIFICATIONS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_CLIMBING_KM_PER_1000M,
+                        default=options.get(CONF_CLIMBING_KM_PER_1000M, 0.0),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Required(
+                        CONF_WEAR_JOURNAL,
+                        default=options.get(CONF_WEAR_JOURNAL, False),
+                    ): bool,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_components(self, user_input=None):
+        """Configure the service interval and weighting of each component."""
+        components = ComponentRegistry.from_options(self._options)
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            for part in components.keys:
+                key = f"{CONF_SPORT_TYPE_FACTORS_PREFIX}{part}"
+                try:
+                    parse_sport_type_factors(user_input.get(key, ""))
+                except ValueError:
+                    errors[key] = "invalid_sport_type_factors"
+            if not errors:
+                self._options.update(user_input)
+                return await self.async_step_bikes()
+
+        options = user_input or self.config_entry.options
+        service_intervals = {
+            vol.Required(
+                f"{CONF_SERVICE_INTERVAL_PREFIX}{component.key}",
+                default=options.get(
+                    f"{CONF_SERVICE_INTERVAL_PREFIX}{component.key}",
+                    component.interval_km,
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=1))
+            for component in components
+        }
+        sport_type_factors = {
+            vol.Optional(
+                f"{CONF_SPORT_TYPE_FACTORS_PREFIX}{part}",
+                default=options.get(f"{CONF_SPORT_TYPE_FACTORS_PREFIX}{part}", ""),
+            ): str
+            for part in components.keys
+        }
+        part_sensors = {}
+        if self._options[CONF_SENSOR_MODE] == SENSOR_MODE_FLEET:
+            names = {component.key: component.name for component in components}
+            part_sensors[
+                vol.Optional(
+                    CONF_FLEET_PART_SENSORS,
+                    default=[
+                        part
+                        for part in options.get(CONF_FLEET_PART_SENSORS, [])
+                        if part in names
+                    ],
+                )
+            ] = cv.multi_select(names)
+        return self.async_show_form(
+            step_id="components",
+            data_schema=vol.Schema(
+                {**service_intervals, **sport_type_factors, **part_sensors}
+            ),
+            description_placeholders={
+                "components": ", ".join(component.name for component in components)
+            },
+            errors=errors,
+        )
+
+    async def async_step_bikes(self, user_input=None):
+        """Choose which components each bike carries."""
+        components = ComponentRegistry.from_options(self._options)
+        bikes = _known_bikes(self.hass, self.config_entry)
+        if user_input is not None or not bikes or not components.keys:
+            shown = user_input or {}
+            # Keep the assignments of bikes the form did not show.
+            for option, keys in self.config_entry.options.items():
+                if (
+                    option.startswith(CONF_BIKE_COMPONENTS_PREFIX)
+                    and option not in shown
+                ):
+                    self._options[option] = keys
+            for option, keys in shown.items():
+                # Bikes carrying everything store nothing, so they pick up
+                # components added later.
+                if set(components.keys) - set(keys):
+                    self._options[option] = keys
+            return self.async_create_entry(title="", data=self._options)
+
+        options = self.config_entry.options
+        names = {component.key: component.name for component in components}
+        schema = {}
+        for gear_id in bikes:
+            key = f"{CONF_BIKE_COMPONENTS_PREFIX}{gear_id}"
+            default = [part for part in options.get(key, names) if part in names]
+            schema[vol.Required(key, default=default)] = cv.multi_select(names)
+        return self.async_show_form(
+            step_id="bikes",
+            data_schema=vol.Schema(schema),
+            description_placeholders={
+                "bikes": ", ".join(
+                    f"{gear_id}: {name}" for gear_id, name in bikes.items()
+                )
+            },
+        )
+
+
+def _known_bikes(
+    hass: HomeAssistant, config_entry: config_entries.ConfigEntry
+) -> dict[str, str]:
+    """Return the names of the bikes the running entry knows, by gear id."""
+    entry_data = hass.data.get(DOMAIN, {}).get("entries", {}).get(
+        config_entry.entry_id
+    )
+    if entry_data is None or entry_data["coordinator"].data is None:
+        return {}
+    return {
+        gear_id: bike.get("name") or gear_id
+        for gear_id, bike in entry_data["coordinator"].data.items()
+    }
 
 
 class StravaOAuth2Implementation(
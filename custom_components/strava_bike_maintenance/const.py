@@ -4,18 +4,122 @@ DOMAIN = "strava_bike_maintenance"
 
 CONF_CLIENT_ID = "client_id"
 CONF_CLIENT_SECRET = "client_secret"
+CONF_SYNC_MODE = "sync_mode"
+CONF_PUSH_UPDATES = "push_updates"
+CONF_VERIFY_TOKEN = "verify_token"
+CONF_SERVICE_INTERVAL_PREFIX = "service_interval_"
+CONF_SPORT_TYPE_FACTORS_PREFIX = "sport_type_factors_"
+CONF_CLIMBING_KM_PER_1000M = "climbing_km_per_1000m"
+CONF_GEAR_DETAILS = "gear_details"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_WEAR_JOURNAL = "wear_journal"
+CONF_COMPONENTS = "components"
+CONF_CUSTOM_COMPONENTS = "custom_components"
+CONF_BIKE_COMPONENTS_PREFIX = "bike_components_"
+CONF_SERVICE_NOTIFICATIONS = "service_notifications"
+CONF_SENSOR_MODE = "sensor_mode"
+CONF_FLEET_PART_SENSORS = "fleet_part_sensors"
+
+# Fired once each time a wear counter reaches its service interval.
+EVENT_SERVICE_DUE = f"{DOMAIN}_service_due"
 
 API_AUTHORIZE_URL = "https://www.strava.com/oauth/authorize"
 API_TOKEN_URL = "https://www.strava.com/oauth/token"
 API_BASE_URL = "https://www.strava.com/api/v3"
+API_PUSH_SUBSCRIPTIONS_URL = f"{API_BASE_URL}/push_subscriptions"
+API_MAX_CONCURRENT_REQUESTS = 4
+API_REQUEST_TIMEOUT_SECONDS = 30
 
 UPDATE_INTERVAL_SECONDS = 7200  # 2 hours
+PUSH_FALLBACK_INTERVAL_SECONDS = 6 * 3600  # safety-net polling with push updates
+MIN_UPDATE_INTERVAL_SECONDS = 900  # never poll more often than every 15 minutes
+MAX_UPDATE_INTERVAL_SECONDS = 6 * 3600
+RECENT_ACTIVITY_SECONDS = 6 * 3600  # poll faster for this long after new rides
+
+# Share of Strava's 15-minute or daily request budget at which polling slows.
+RATE_LIMIT_RELAXED_USAGE = 0.5
+RATE_LIMIT_CRITICAL_USAGE = 0.8
+RATE_LIMIT_BACKOFF_SECONDS = 900
+
+TOKEN_REFRESH_MARGIN_SECONDS = 600  # renew this long before the token expires
+TOKEN_REFRESH_RETRY_SECONDS = 60
+TOKEN_REFRESH_MAX_RETRY_SECONDS = 3600
+
+# Consecutive outage failures before requests pause, and how long they pause.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_SECONDS = 300
+CIRCUIT_MAX_BACKOFF_SECONDS = 6 * 3600
+
+# "totals" diffs the cumulative bike distances from /athlete; "activities" pages
+# through new rides and attributes each one to its bike.
+SYNC_MODE_TOTALS = "totals"
+SYNC_MODE_ACTIVITIES = "activities"
+DEFAULT_SYNC_MODE = SYNC_MODE_TOTALS
+
+# Per-part mode creates a sensor per bike and component; fleet mode creates a
+# summary sensor per bike plus one for the fleet.
+SENSOR_MODE_PER_PART = "per_part"
+SENSOR_MODE_FLEET = "fleet"
+DEFAULT_SENSOR_MODE = SENSOR_MODE_PER_PART
+
+ACTIVITIES_PAGE_SIZE = 100
+ACTIVITY_SYNC_LOOKBACK_SECONDS = 3 * 86400  # re-scan window for late uploads
+ACTIVITY_INDEX_MAX_SIZE = 500  # processed rides remembered for reconciliation
+ATHLETE_REFRESH_SECONDS = 86400  # bike metadata refresh in activities mode
 
-STORAGE_VERSION = 1
+METRICS_WINDOW = 50  # refreshes kept for rolling percentiles
+
+STORAGE_VERSION = 3
 STORAGE_KEY = f"{DOMAIN}_wear_counters"
+STORAGE_SAVE_DELAY_SECONDS = 10  # coalesce bursts of changes into one write
+JOURNAL_COMPACT_BYTES = 256 * 1024  # fold the wear journal into the document
+
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}_snapshot"
+
+GEAR_STORAGE_VERSION = 1
+GEAR_STORAGE_KEY = f"{DOMAIN}_gear_details"
+GEAR_DETAILS_TTL_SECONDS = 86400  # details are re-fetched after a day or a rename
+
+HISTORY_STORAGE_VERSION = 1
+HISTORY_STORAGE_KEY = f"{DOMAIN}_wear_history"
+HISTORY_FULL_RESOLUTION_SECONDS = 30 * 86400  # older samples keep one per day
+HISTORY_RETENTION_SECONDS = 5 * 365 * 86400
+HISTORY_COMPACT_EVERY = 256  # samples appended to a bike before downsampling
 
-WEAR_PARTS = {
+# Built-in wear components that can be enabled in the options.
+COMPONENT_CATALOG = {
     "chain": "Chain",
     "chain_waxing": "Chain Waxing",
     "tires": "Tires",
+    "cassette": "Cassette",
+    "chainrings": "Chainrings",
+    "brake_pads": "Brake Pads",
+    "brake_rotors": "Brake Rotors",
+    "tubeless_sealant": "Tubeless Sealant",
+    "bearings": "Bearings",
+    "cables": "Cables",
+    "suspension_service": "Suspension Service",
 }
+DEFAULT_COMPONENTS = ["chain", "chain_waxing", "tires"]
+
+# Distance after which a part is due for service, used for forecasts.
+DEFAULT_SERVICE_INTERVALS_KM = {
+    "chain": 3000.0,
+    "chain_waxing": 400.0,
+    "tires": 4000.0,
+    "cassette": 10000.0,
+    "chainrings": 20000.0,
+    "brake_pads": 2000.0,
+    "brake_rotors": 15000.0,
+    "tubeless_sealant": 2000.0,
+    "bearings": 10000.0,
+    "cables": 5000.0,
+    "suspension_service": 3000.0,
+}
+CUSTOM_COMPONENT_INTERVAL_KM = 5000.0
+
+FORECAST_WINDOW_SECONDS = 28 * 86400  # riding rate is averaged over this window
+FORECAST_MIN_SPAN_SECONDS = 86400  # history needed before forecasting
+FORECAST_HORIZON_DAYS = 3650  # further out than this is reported as unknown
+FORECAST_REFRESH_SECONDS = 6 * 3600  # re-forecast unchanged data this often
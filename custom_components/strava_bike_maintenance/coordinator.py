@@ -2,23 +2,83 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
+from http import HTTPStatus
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
-from aiohttp import ClientResponseError
-from homeassistant.core import HomeAssistant
+from aiohttp import ClientError, ClientResponseError
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .api import StravaApiClient
-from .const import DOMAIN, UPDATE_INTERVAL_SECONDS
+from .components import ComponentRegistry
+from .const import (
+    ACTIVITY_SYNC_LOOKBACK_SECONDS,
+    ATHLETE_REFRESH_SECONDS,
+    DOMAIN,
+    FORECAST_REFRESH_SECONDS,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    STORAGE_SAVE_DELAY_SECONDS,
+    SYNC_MODE_ACTIVITIES,
+    SYNC_MODE_TOTALS,
+)
+from .forecast import estimate_daily_km, forecast_service_dates
+from .gear import GearDetailCache
+from .metrics import (
+    METRIC_ENTITY_FANOUT,
+    METRIC_REFRESH,
+    METRIC_WEAR_PROCESSING,
+    RefreshMetrics,
+)
+from .scheduler import AdaptivePollScheduler
 from .wear import WearCounterManager
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener contexts are (gear_id, kind, part) tuples; see StravaBikeBase.
+CONTEXT_DISTANCE = "distance"
+CONTEXT_WEAR = "wear"
+CONTEXT_SERVICE_DUE = "service_due"
+# Set whenever anything of a bike changed, for entities summarising a bike.
+CONTEXT_SUMMARY = "summary"
+# Set whenever anything of any bike changed, for entities summarising the fleet.
+CONTEXT_FLEET = (None, "fleet", None)
+
+# Bike fields shown by every entity of a bike (names, device info).
+BIKE_METADATA_KEYS = (
+    "name",
+    "brand_name",
+    "model_name",
+    "frame_type",
+    "description",
+    "weight",
+    "retired",
+)
+
+
+def _athlete_fingerprint(athlete_payload: Dict[str, Any]) -> tuple[Any, ...]:
+    """Return the /athlete fields that the bike data is built from."""
+    return (
+        athlete_payload.get("id"),
+        athlete_payload.get("firstname"),
+        athlete_payload.get("lastname"),
+        tuple(
+            (bike.get("id"), bike.get("distance"))
+            + tuple(bike.get(key) for key in BIKE_METADATA_KEYS)
+            for bike in athlete_payload.get("bikes", [])
+        ),
+        tuple(shoe.get("id") for shoe in athlete_payload.get("shoes", [])),
+    )
+
 
 class StravaDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinates fetching Strava data and computing wear counters."""
@@ -26,51 +86,484 @@ class StravaDataUpdateCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     def __init__(
         self,
         hass: HomeAssistant,
+        entry_id: str,
         api_client: StravaApiClient,
         wear_manager: WearCounterManager,
+        scheduler: AdaptivePollScheduler,
+        metrics: RefreshMetrics,
+        components: ComponentRegistry,
+        sync_mode: str = SYNC_MODE_TOTALS,
+        gear_details: GearDetailCache | None = None,
     ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN} data",
-            update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+            update_interval=scheduler.next_interval(),
         )
         self._api_client = api_client
+        self.breaker = api_client.breaker
         self.wear_manager = wear_manager
+        self.scheduler = scheduler
+        self.metrics = metrics
+        self.sync_mode = sync_mode
+        self.components = components
+        self._gear_details = gear_details
         self.athlete: Dict[str, Any] | None = None
+        # Bike summaries from the last /athlete payload, keyed by gear id.
+        self._bikes: Dict[str, Dict[str, Any]] = {}
+        # The same summaries as /athlete reported them, before gear details
+        # filled them in, and whether gear details changed them since.
+        self._bike_summaries: Dict[str, Dict[str, Any]] = {}
+        self._bikes_changed = False
+        self._other_gear_ids: set[str] = set()
+        self._athlete_fetched_at: float | None = None
+        # Identify the last processed /athlete document so an unchanged one
+        # can be skipped; the fingerprint covers responses without an ETag.
+        self._athlete_etag: str | None = None
+        self._athlete_fingerprint: tuple[Any, ...] | None = None
+        self._forecasted_at: float | None = None
+        # Listener contexts (or whole gear ids) affected by the pending update;
+        # None notifies every listener.
+        self._changed_contexts: set[Any] | None = None
+        # Bikes whose distance, wear or metadata changed in the update being
+        # notified; None means every bike.
+        self.changed_bike_ids: set[str] | None = None
+        self._notified_success: bool | None = None
+        # Bike and athlete metadata persisted so startup need not wait on Strava.
+        self._snapshot_store = Store[dict[str, Any]](
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            f"{SNAPSHOT_STORAGE_KEY}.{entry_id}",
+            private=True,
+        )
+        self._snapshot_dirty = False
+
+    async def async_restore_snapshot(self) -> bool:
+        """Populate data from the last persisted snapshot without calling Strava.
+
+        Returns False when there is nothing to restore, e.g. on first setup.
+        """
+        snapshot = await self._snapshot_store.async_load()
+        if not snapshot or not snapshot.get("bikes"):
+            return False
+
+        self._bikes = snapshot["bikes"]
+        self.athlete = snapshot.get("athlete")
+        data = self._build_data(
+            await self.wear_manager.async_get_total_distances(),
+            await self.wear_manager.async_get_all_wear_snapshots(),
+        )
+        self._attach_forecasts(data)
+        self.data = data
+        return True
+
+    async def async_flush_snapshot(self) -> None:
+        """Write a pending snapshot now, e.g. before the entry is unloaded."""
+        if self._snapshot_dirty:
+            await self._snapshot_store.async_save(self._snapshot_to_save())
+
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        self._snapshot_dirty = False
+        return {"athlete": self.athlete, "bikes": self._bikes}
 
     async def _async_update_data(self) -> Dict[str, Any]:
         try:
-            athlete_payload = await self._api_client.async_get_bikes()
-        except ClientResponseError as err:
+            with self.metrics.measure(METRIC_REFRESH):
+                if self.sync_mode == SYNC_MODE_ACTIVITIES:
+                    data = await self._async_update_from_activities()
+                else:
+                    data = await self._async_update_from_athlete()
+        except (ClientError, asyncio.TimeoutError) as err:
+            # The scheduler has already seen the failed response's headers.
+            self.update_interval = max(
+                self.scheduler.next_interval(),
+                timedelta(seconds=self.breaker.retry_after()),
+            )
+            if (
+                isinstance(err, ClientResponseError)
+                and err.status == HTTPStatus.UNAUTHORIZED
+            ):
+                raise ConfigEntryAuthFailed("Strava rejected the access token") from err
+            if self.breaker.is_open and self.data is not None:
+                # Strava is down; keep serving the last good data until it recovers.
+                _LOGGER.debug(
+                    "Serving cached data while Strava is unavailable: %s", err
+                )
+                self._changed_contexts = set()
+                return self.data
             raise UpdateFailed(f"Error communicating with Strava API: {err}") from err
 
+        if data is None:
+            # Nothing changed on Strava, so there is nothing to process or save.
+            self.scheduler.observe_refresh(False)
+            self.update_interval = self.scheduler.next_interval()
+            return self._unchanged_data()
+
+        self._attach_forecasts(data)
+        self._changed_contexts = self._diff_contexts(data)
+        self.scheduler.observe_refresh(
+            self.data is not None and self._distances_changed(data)
+        )
+        self.update_interval = self.scheduler.next_interval()
+        return data
+
+    def _unchanged_data(self) -> Dict[str, Any]:
+        """Return the previous data, re-forecasting it when the forecast is old.
+
+        Riding rates decay while nobody rides, so forecasts are refreshed
+        every FORECAST_REFRESH_SECONDS even if Strava reports no change.
+        """
+        now = dt_util.utcnow().timestamp()
+        if (
+            self._forecasted_at is not None
+            and now - self._forecasted_at < FORECAST_REFRESH_SECONDS
+            and not self._bikes_changed
+        ):
+            self._changed_contexts = set()
+            return self.data
+        data = {gear_id: dict(bike) for gear_id, bike in self.data.items()}
+        if self._bikes_changed:
+            self._bikes_changed = False
+            for gear_id, bike in data.items():
+                if (metadata := self._bikes.get(gear_id)) is not None:
+                    bike.update(metadata)
+                    bike["name"] = metadata.get("name") or gear_id
+        self._attach_forecasts(data)
+        self._changed_contexts = self._diff_contexts(data)
+        return data
+
+    def _distances_changed(self, data: Dict[str, Any]) -> bool:
+        """Return whether any bike was ridden since the previous refresh."""
+        return any(
+            bike["distance_km"] != self.data.get(gear_id, {}).get("distance_km")
+            for gear_id, bike in data.items()
+        )
+
+    async def _async_update_from_athlete(self) -> Dict[str, Any] | None:
+        """Diff cumulative bike totals from the /athlete document.
+
+        Returns None when the document is unchanged since the last refresh.
+        """
+        athlete_payload = await self._async_fetch_athlete()
+        if athlete_payload is None:
+            return None
+
         # Convert Strava's cumulative metre counts into kilometres per bike.
         bike_distances_km = StravaApiClient.extract_bike_distances_km(athlete_payload)
         # Feed the totals through the wear manager so counters grow with distance.
-        wear_snapshot = await self.wear_manager.async_process_bikes(bike_distances_km)
+        with self.metrics.measure(METRIC_WEAR_PROCESSING):
+            wear_snapshot = await self.wear_manager.async_process_bikes(
+                bike_distances_km
+            )
 
-        data: Dict[str, Any] = {}
-        for bike in athlete_payload.get("bikes", []):
-            gear_id = bike.get("id")
-            if gear_id is None:
+        return self._build_data(bike_distances_km, wear_snapshot)
+
+    async def _async_update_from_activities(self) -> Dict[str, Any]:
+        """Attribute each new ride since the persisted cursor to its bike.
+
+        Bike totals are re-read from /athlete daily and whenever a ride uses
+        unknown gear. Those totals already include the rides fetched here, so
+        they only become the baseline once the rides have been applied.
+        """
+        now = dt_util.utcnow().timestamp()
+        athlete_totals: Dict[str, float] | None = None
+        if (
+            self._athlete_fetched_at is None
+            or now - self._athlete_fetched_at >= ATHLETE_REFRESH_SECONDS
+        ):
+            athlete_totals = await self._async_fetch_athlete_totals()
+
+        # Rides only count from the moment incremental sync was first enabled.
+        await self.wear_manager.async_start_activity_sync(int(now))
+        cursor = self.wear_manager.activity_cursor or int(now)
+        activities = await self._api_client.async_get_activities_since(
+            cursor - ACTIVITY_SYNC_LOOKBACK_SECONDS
+        )
+        rides = StravaApiClient.extract_rides(activities)
+
+        unknown_gear = {
+            ride.gear_id
+            for ride in rides
+            if ride.gear_id not in self._bikes
+            and ride.gear_id not in self._other_gear_ids
+        }
+        if unknown_gear:
+            # A ride used gear we have not seen yet, so pick up the new bike.
+            athlete_totals = await self._async_fetch_athlete_totals() or athlete_totals
+            # Anything still unknown (e.g. retired gear) is not asked about again.
+            self._other_gear_ids.update(unknown_gear - self._bikes.keys())
+
+        with self.metrics.measure(METRIC_WEAR_PROCESSING):
+            wear_snapshot = await self.wear_manager.async_process_activities(
+                ride for ride in rides if ride.gear_id in self._bikes
+            )
+        if athlete_totals is not None:
+            await self.wear_manager.async_process_bikes(athlete_totals, accrue=False)
+        bike_distances_km = await self.wear_manager.async_get_total_distances()
+        return self._build_data(bike_distances_km, wear_snapshot)
+
+    async def async_handle_activity_event(
+        self, activity_id: int, aspect_type: str
+    ) -> None:
+        """Apply a pushed activity change to the affected bike only."""
+        previous_gear_id = self.wear_manager.activity_gear_id(activity_id)
+        if (
+            self.sync_mode == SYNC_MODE_TOTALS
+            and aspect_type != "create"
+            and previous_gear_id is None
+        ):
+            # The totals already include rides that were not pushed as new,
+            # so an edit to one of them must not count it again.
+            return
+        try:
+            if aspect_type == "delete":
+                await self.wear_manager.async_remove_activity(activity_id)
+                affected = {previous_gear_id}
+            else:
+                payload = await self._api_client.async_get_activity(activity_id)
+                rides = StravaApiClient.extract_rides([payload])
+                if any(ride.gear_id not in self._bikes for ride in rides):
+                    if not any(ride.gear_id in self._other_gear_ids for ride in rides):
+                        # Possibly a brand-new bike, so fall back to a full refresh.
+                        await self.async_request_refresh()
+                    return
+                if rides:
+                    await self.wear_manager.async_process_activities(rides)
+                else:
+                    # The ride no longer has a bike assigned.
+                    await self.wear_manager.async_remove_activity(activity_id)
+                affected = {previous_gear_id, *(ride.gear_id for ride in rides)}
+        except (ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.warning("Could not apply Strava activity %s: %s", activity_id, err)
+            return
+
+        await self.async_refresh_bikes(
+            gear_id for gear_id in affected if gear_id is not None
+        )
+
+    async def async_refresh_bikes(self, bike_ids: Iterable[str]) -> None:
+        """Publish the current counters of the given bikes without polling."""
+        if self.data is None:
+            return
+
+        bike_distances_km = await self.wear_manager.async_get_total_distances()
+        data = dict(self.data)
+        refreshed: list[str] = []
+        for gear_id in bike_ids:
+            if gear_id not in data:
                 continue
+            bike = dict(data[gear_id])
+            bike["distance_km"] = bike_distances_km.get(gear_id, bike["distance_km"])
+            bike["wear_counters"] = self._bike_wear(
+                gear_id, await self.wear_manager.async_get_wear_snapshot(gear_id)
+            )
+            data[gear_id] = bike
+            refreshed.append(gear_id)
 
-            data[gear_id] = {
-                "gear_id": gear_id,
-                "name": bike.get("name") or gear_id,
-                "brand_name": bike.get("brand_name"),
-                "model_name": bike.get("model_name"),
-                "frame_type": bike.get("frame_type"),
-                "distance_km": bike_distances_km.get(gear_id, 0.0),
-                "wear_counters": wear_snapshot.get(gear_id, {}),
+        self._attach_forecasts(data, refreshed)
+        self._changed_contexts = self._diff_contexts(data)
+        self.async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose values changed in this update."""
+        changed = self._changed_contexts
+        self._changed_contexts = None
+        self.changed_bike_ids = (
+            None
+            if changed is None
+            else {
+                context if isinstance(context, str) else context[0]
+                for context in changed
+                if isinstance(context, str)
+                or context[1] in (CONTEXT_DISTANCE, CONTEXT_WEAR)
             }
+        )
+        if self._notified_success != self.last_update_success:
+            # Availability flipped, so every entity has to write its state.
+            changed = None
+        self._notified_success = self.last_update_success
+
+        fanout = 0
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                changed is None
+                or context is None
+                or context in changed
+                or context[0] in changed
+            ):
+                update_callback()
+                fanout += 1
+        self.metrics.record(METRIC_ENTITY_FANOUT, fanout)
+
+    def _diff_contexts(self, data: Dict[str, Any]) -> set[Any] | None:
+        """Return the listener contexts whose values differ from the last data."""
+        if self.data is None:
+            return None
+
+        changed: set[Any] = set()
+        for gear_id, bike in data.items():
+            previous = self.data.get(gear_id)
+            if previous is None or any(
+                previous.get(key) != bike.get(key) for key in BIKE_METADATA_KEYS
+            ):
+                changed.add(gear_id)
+                continue
+            changed_before = len(changed)
+            if previous.get("distance_km") != bike.get("distance_km"):
+                changed.add((gear_id, CONTEXT_DISTANCE, None))
+            previous_wear = previous.get("wear_counters", {})
+            for part, value in bike.get("wear_counters", {}).items():
+                if previous_wear.get(part) != value:
+                    changed.add((gear_id, CONTEXT_WEAR, part))
+            rate_changed = previous.get("daily_km") != bike.get("daily_km")
+            previous_due = previous.get("service_due", {})
+            for part, due in bike.get("service_due", {}).items():
+                if rate_changed or previous_due.get(part) != due:
+                    changed.add((gear_id, CONTEXT_SERVICE_DUE, part))
+            if len(changed) > changed_before:
+                changed.add((gear_id, CONTEXT_SUMMARY, None))
+        if changed or self.data.keys() != data.keys():
+            changed.add(CONTEXT_FLEET)
+        return changed
+
+    def _attach_forecasts(
+        self, data: Dict[str, Any], bike_ids: Iterable[str] | None = None
+    ) -> None:
+        """Add riding rate and service forecasts to bikes in one batched pass."""
+        now = dt_util.utcnow()
+        if bike_ids is None:
+            self._forecasted_at = now.timestamp()
+        gear_ids = list(data) if bike_ids is None else list(bike_ids)
+        daily_km = {
+            gear_id: estimate_daily_km(
+                self.wear_manager.history.get(gear_id), now.timestamp()
+            )
+            for gear_id in gear_ids
+        }
+        service_due = forecast_service_dates(
+            {gear_id: data[gear_id]["wear_counters"] for gear_id in gear_ids},
+            daily_km,
+            self.components.intervals_km,
+            now,
+        )
+        for gear_id in gear_ids:
+            data[gear_id]["daily_km"] = daily_km[gear_id]
+            data[gear_id]["service_due"] = service_due[gear_id]
+
+    async def _async_fetch_athlete_totals(self) -> Dict[str, float] | None:
+        """Refresh bike metadata and return the bike totals to align with.
+
+        Returns None when the /athlete document is unchanged.
+        """
+        athlete_payload = await self._async_fetch_athlete()
+        if athlete_payload is None:
+            return None
+        return StravaApiClient.extract_bike_distances_km(athlete_payload)
+
+    async def _async_fetch_athlete(self) -> Dict[str, Any] | None:
+        """Fetch /athlete and remember the bike summaries and athlete info.
+
+        Returns None when the document is unchanged since the last fetch,
+        either because Strava answered the ETag with 304 Not Modified or
+        because the bike fields fingerprint the same.
+        """
+        # Only ask for a 304 when there is a processed document to fall back to.
+        etag = self._athlete_etag if self._athlete_fingerprint is not None else None
+        athlete_payload, self._athlete_etag = (
+            await self._api_client.async_get_bikes_if_modified(etag)
+        )
+        fingerprint = (
+            None if athlete_payload is None else _athlete_fingerprint(athlete_payload)
+        )
+        if athlete_payload is None or fingerprint == self._athlete_fingerprint:
+            self._athlete_fetched_at = dt_util.utcnow().timestamp()
+            if self._gear_details is not None and self._gear_details.has_stale(
+                self._bike_summaries
+            ):
+                # The document is unchanged but cached gear details expired.
+                bikes = await self._async_add_gear_details(self._bike_summaries)
+                if bikes != self._bikes:
+                    self._bikes_changed = True
+                    self._async_set_metadata(bikes, self.athlete)
+            return None
+
+        # Only the metadata is kept; distances are owned by the wear manager.
+        summaries = {
+            bike["id"]: {key: bike.get(key) for key in BIKE_METADATA_KEYS}
+            for bike in athlete_payload.get("bikes", [])
+            if bike.get("id") is not None
+        }
+        bikes = await self._async_add_gear_details(summaries)
+        self._other_gear_ids = {
+            shoe["id"]
+            for shoe in athlete_payload.get("shoes", [])
+            if shoe.get("id") is not None
+        }
+        self._athlete_fetched_at = dt_util.utcnow().timestamp()
 
         # Store minimal athlete info so entities can expose it as device metadata.
-        self.athlete = {
+        athlete = {
             "id": athlete_payload.get("id"),
             "firstname": athlete_payload.get("firstname"),
             "lastname": athlete_payload.get("lastname"),
         }
 
+        self._async_set_metadata(bikes, athlete)
+        self._bike_summaries = summaries
+        self._athlete_fingerprint = fingerprint
+        return athlete_payload
+
+    async def _async_add_gear_details(
+        self, summaries: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the bike summaries with missing fields filled from /gear."""
+        bikes = {gear_id: dict(summary) for gear_id, summary in summaries.items()}
+        if self._gear_details is not None:
+            # The /athlete summaries lack most fields; fill them from /gear.
+            details = await self._gear_details.async_get_details(summaries)
+            for gear_id, detail in details.items():
+                bike = bikes[gear_id]
+                for key in BIKE_METADATA_KEYS:
+                    if bike.get(key) is None:
+                        bike[key] = detail.get(key)
+        return bikes
+
+    @callback
+    def _async_set_metadata(
+        self, bikes: Dict[str, Dict[str, Any]], athlete: Dict[str, Any] | None
+    ) -> None:
+        """Keep the bike and athlete metadata, persisting it when it changed."""
+        if bikes != self._bikes or athlete != self.athlete:
+            self._snapshot_dirty = True
+            self._snapshot_store.async_delay_save(
+                self._snapshot_to_save, STORAGE_SAVE_DELAY_SECONDS
+            )
+        self._bikes = bikes
+        self.athlete = athlete
+
+    def _build_data(
+        self,
+        bike_distances_km: Dict[str, float],
+        wear_snapshot: Dict[str, Dict[str, float]],
+    ) -> Dict[str, Any]:
+        """Assemble the per-bike data exposed to entities."""
+        data: Dict[str, Any] = {}
+        for gear_id, bike in self._bikes.items():
+            data[gear_id] = {
+                "gear_id": gear_id,
+                **{key: bike.get(key) for key in BIKE_METADATA_KEYS},
+                "name": bike.get("name") or gear_id,
+                "distance_km": bike_distances_km.get(gear_id, 0.0),
+                "wear_counters": self._bike_wear(
+                    gear_id, wear_snapshot.get(gear_id, {})
+                ),
+            }
         return data
+
+    def _bike_wear(self, gear_id: str, wear: Dict[str, float]) -> Dict[str, float]:
+        """Return the counters of the components the bike carries."""
+        return {
+            key: wear.get(key, 0.0) for key in self.components.for_bike(gear_id)
+        }
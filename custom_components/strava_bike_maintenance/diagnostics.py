@@ -0,0 +1,56 @@
+"""Diagnostics support for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CLIENT_SECRET, CONF_VERIFY_TOKEN, DOMAIN
+from .coordinator import StravaDataUpdateCoordinator
+
+TO_REDACT = {
+    "token",
+    CONF_CLIENT_SECRET,
+    CONF_VERIFY_TOKEN,
+    CONF_WEBHOOK_ID,
+    "firstname",
+    "lastname",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return refresh metrics and coordinator state for a config entry."""
+    entry_data = hass.data[DOMAIN]["entries"][entry.entry_id]
+    coordinator: StravaDataUpdateCoordinator = entry_data["coordinator"]
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "sync_mode": coordinator.sync_mode,
+            "last_update_success": coordinator.last_update_success,
+            "update_interval_seconds": (
+                coordinator.update_interval.total_seconds()
+                if coordinator.update_interval
+                else None
+            ),
+            "rate_limit_usage": coordinator.scheduler.usage_ratio,
+            "poll_slot": coordinator.scheduler.budget.slot(entry.entry_id),
+            "circuit": {
+                "state": coordinator.breaker.state,
+                "last_failure": coordinator.breaker.last_failure,
+                "retry_after_seconds": coordinator.breaker.retry_after(),
+            },
+            "bike_count": len(coordinator.data or {}),
+            "athlete": async_redact_data(coordinator.athlete or {}, TO_REDACT),
+        },
+        "metrics": coordinator.metrics.as_dict(),
+    }
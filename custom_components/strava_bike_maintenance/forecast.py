@@ -0,0 +1,75 @@
+"""Service date forecasting for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    FORECAST_HORIZON_DAYS,
+    FORECAST_MIN_SPAN_SECONDS,
+    FORECAST_WINDOW_SECONDS,
+)
+from .history import BikeHistory
+
+
+def estimate_daily_km(history: BikeHistory | None, now: float) -> float | None:
+    """Estimate how far a bike is ridden per day from its recent history."""
+    if history is None or not history.timestamps:
+        return None
+
+    window_start = now - FORECAST_WINDOW_SECONDS
+    start_total = history.total_at(window_start)
+    if start_total is None:
+        # Not enough history yet; use everything that was recorded.
+        start_ts = history.timestamps[0]
+        start_total = history.totals_km[0]
+    else:
+        start_ts = window_start
+
+    span = now - start_ts
+    if span < FORECAST_MIN_SPAN_SECONDS:
+        return None
+    daily_km = max(history.totals_km[-1] - start_total, 0.0) / (span / 86400)
+    # Rounded so a sliding window alone does not produce a new value each poll.
+    return round(daily_km, 1)
+
+
+def forecast_service_dates(
+    wear_counters: Dict[str, Dict[str, float]],
+    daily_km: Dict[str, float | None],
+    service_intervals_km: Dict[str, float],
+    now: datetime,
+) -> Dict[str, Dict[str, datetime | None]]:
+    """Predict when each part of each bike reaches its service interval.
+
+    All bikes and parts are handled in one pass so callers can refresh the
+    whole fleet at once instead of per entity. Dates are truncated to the
+    start of the local day, which is all the precision a forecast has.
+    """
+    today = dt_util.start_of_local_day(now)
+    forecasts: Dict[str, Dict[str, datetime | None]] = {}
+    for bike_id, counters in wear_counters.items():
+        rate = daily_km.get(bike_id)
+        bike_forecast: Dict[str, datetime | None] = {}
+        for part, wear_km in counters.items():
+            interval_km = service_intervals_km.get(part)
+            if interval_km is None:
+                continue
+            remaining_km = interval_km - wear_km
+            if remaining_km <= 0:
+                bike_forecast[part] = today
+                continue
+            if not rate:
+                bike_forecast[part] = None
+                continue
+            days = remaining_km / rate
+            bike_forecast[part] = (
+                dt_util.start_of_local_day(now + timedelta(days=days))
+                if days <= FORECAST_HORIZON_DAYS
+                else None
+            )
+        forecasts[bike_id] = bike_forecast
+    return forecasts
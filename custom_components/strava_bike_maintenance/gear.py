@@ -0,0 +1,122 @@
+"""Cached gear details for the Strava Bike Maintenance integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Mapping
+
+from aiohttp import ClientError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import StravaApiClient
+from .const import (
+    GEAR_DETAILS_TTL_SECONDS,
+    GEAR_STORAGE_KEY,
+    GEAR_STORAGE_VERSION,
+    STORAGE_SAVE_DELAY_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields of /gear/{id} kept in the cache.
+GEAR_DETAIL_KEYS = (
+    "name",
+    "brand_name",
+    "model_name",
+    "frame_type",
+    "description",
+    "weight",
+    "retired",
+)
+
+
+class GearDetailCache:
+    """Fetches /gear/{id} for each bike and caches the result in storage.
+
+    Details are fetched again only once they are older than a day or when the
+    bike's name in the /athlete summary no longer matches, so the number of
+    requests stays flat however often /athlete is polled.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, api_client: StravaApiClient
+    ) -> None:
+        self._api_client = api_client
+        self._store = Store[dict[str, Any]](
+            hass, GEAR_STORAGE_VERSION, f"{GEAR_STORAGE_KEY}.{entry_id}", private=True
+        )
+        # Gear id -> {"fetched_at": epoch seconds, "detail": {...}}.
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
+
+    async def async_get_details(
+        self, bikes: Mapping[str, Mapping[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the details of the given bikes, refreshing stale ones.
+
+        ``bikes`` maps gear ids to their /athlete summaries. Bikes whose fetch
+        fails keep their previous details, if any.
+        """
+        if not self._loaded:
+            self._entries = (await self._store.async_load() or {}).get("gear", {})
+            self._loaded = True
+
+        now = dt_util.utcnow().timestamp()
+        stale = [
+            gear_id
+            for gear_id, summary in bikes.items()
+            if self._is_stale(gear_id, summary, now)
+        ]
+        changed = any(gear_id not in bikes for gear_id in self._entries)
+        self._entries = {
+            gear_id: entry
+            for gear_id, entry in self._entries.items()
+            if gear_id in bikes
+        }
+
+        if stale:
+            # The API client bounds how many of these run at once.
+            results = await asyncio.gather(
+                *(self._api_client.async_get_gear(gear_id) for gear_id in stale),
+                return_exceptions=True,
+            )
+            for gear_id, result in zip(stale, results):
+                # An open circuit breaker raises a ClientError as well.
+                if isinstance(result, (ClientError, asyncio.TimeoutError)):
+                    _LOGGER.debug("Could not fetch details of %s: %s", gear_id, result)
+                    continue
+                if isinstance(result, BaseException):
+                    raise result
+                self._entries[gear_id] = {
+                    "fetched_at": now,
+                    "detail": {key: result.get(key) for key in GEAR_DETAIL_KEYS},
+                }
+                changed = True
+
+        if changed:
+            self._store.async_delay_save(
+                lambda: {"gear": self._entries}, STORAGE_SAVE_DELAY_SECONDS
+            )
+
+        return {gear_id: entry["detail"] for gear_id, entry in self._entries.items()}
+
+    def has_stale(self, bikes: Mapping[str, Mapping[str, Any]]) -> bool:
+        """Return whether any of the given bikes' details are due for a fetch."""
+        if not self._loaded:
+            return bool(bikes)
+        now = dt_util.utcnow().timestamp()
+        return any(
+            self._is_stale(gear_id, summary, now) for gear_id, summary in bikes.items()
+        )
+
+    def _is_stale(
+        self, gear_id: str, summary: Mapping[str, Any], now: float
+    ) -> bool:
+        entry = self._entries.get(gear_id)
+        if entry is None or now - entry["fetched_at"] >= GEAR_DETAILS_TTL_SECONDS:
+            return True
+        return summary.get("name") != entry["detail"].get("name")
@@ -0,0 +1,278 @@
+"""Compact per-bike wear history for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from array import array
+import base64
+from bisect import bisect_left, bisect_right
+import sys
+from typing import Any, Dict, Iterable, List
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    HISTORY_COMPACT_EVERY,
+    HISTORY_FULL_RESOLUTION_SECONDS,
+    HISTORY_RETENTION_SECONDS,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    STORAGE_SAVE_DELAY_SECONDS,
+)
+
+DAY_SECONDS = 86400
+
+
+def _encode(values: array) -> str:
+    """Encode an array as little-endian base64."""
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(typecode: str, encoded: str | None) -> array:
+    """Decode a little-endian base64 string into an array."""
+    values = array(typecode)
+    if encoded:
+        values.frombytes(base64.b64decode(encoded))
+        if sys.byteorder != "little":
+            values.byteswap()
+    return values
+
+
+class BikeHistory:
+    """Odometer samples and reset events for one bike, kept in flat arrays.
+
+    Timestamps are epoch seconds and stay sorted so lookups can bisect.
+    """
+
+    __slots__ = (
+        "timestamps",
+        "totals_km",
+        "reset_timestamps",
+        "reset_parts",
+        "_appended",
+    )
+
+    def __init__(self) -> None:
+        self.timestamps = array("d")
+        self.totals_km = array("d")
+        self.reset_timestamps = array("d")
+        # Index into WearHistoryStore's interned part names.
+        self.reset_parts = array("H")
+        self._appended = 0
+
+    def add_sample(self, timestamp: float, total_km: float) -> bool:
+        """Record the bike's total at a point in time; skip unchanged totals."""
+        if self.timestamps and timestamp >= self.timestamps[-1]:
+            if self.totals_km[-1] == total_km:
+                return False
+            self.timestamps.append(timestamp)
+            self.totals_km.append(total_km)
+        else:
+            index = bisect_right(self.timestamps, timestamp)
+            if index and self.timestamps[index - 1] == timestamp:
+                # Already sampled, e.g. by an interrupted backfill.
+                return False
+            self.timestamps.insert(index, timestamp)
+            self.totals_km.insert(index, total_km)
+        self._appended += 1
+        return True
+
+    def drop_samples_before(self, timestamp: float) -> bool:
+        """Remove the samples older than the timestamp; return whether any were."""
+        index = bisect_left(self.timestamps, timestamp)
+        del self.timestamps[:index]
+        del self.totals_km[:index]
+        return index > 0
+
+    def add_reset(self, timestamp: float, part_index: int) -> None:
+        """Record that a part was serviced."""
+        index = bisect_right(self.reset_timestamps, timestamp)
+        self.reset_timestamps.insert(index, timestamp)
+        self.reset_parts.insert(index, part_index)
+
+    def total_at(self, timestamp: float) -> float | None:
+        """Return the last recorded total at or before the timestamp."""
+        index = bisect_right(self.timestamps, timestamp)
+        if index == 0:
+            return None
+        return self.totals_km[index - 1]
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Return whether enough samples were added to warrant downsampling."""
+        return self._appended >= HISTORY_COMPACT_EVERY
+
+    def compact(self, now: float) -> None:
+        """Keep one sample per day beyond the full-resolution window and drop
+        anything older than the retention period."""
+        retention_start = now - HISTORY_RETENTION_SECONDS
+        full_resolution_start = now - HISTORY_FULL_RESOLUTION_SECONDS
+
+        timestamps = array("d")
+        totals_km = array("d")
+        count = len(self.timestamps)
+        for index in range(count):
+            timestamp = self.timestamps[index]
+            if timestamp < retention_start:
+                continue
+            if (
+                timestamp < full_resolution_start
+                and index + 1 < count
+                and self.timestamps[index + 1] // DAY_SECONDS
+                == timestamp // DAY_SECONDS
+            ):
+                # A later sample from the same day supersedes this one.
+                continue
+            timestamps.append(timestamp)
+            totals_km.append(self.totals_km[index])
+        self.timestamps = timestamps
+        self.totals_km = totals_km
+
+        keep = bisect_right(self.reset_timestamps, retention_start)
+        self.reset_timestamps = self.reset_timestamps[keep:]
+        self.reset_parts = self.reset_parts[keep:]
+        self._appended = 0
+
+    def as_dict(self) -> Dict[str, str]:
+        """Serialise the arrays for storage."""
+        return {
+            "t": _encode(self.timestamps),
+            "km": _encode(self.totals_km),
+            "reset_t": _encode(self.reset_timestamps),
+            "reset_part": _encode(self.reset_parts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> BikeHistory:
+        """Restore a history serialised with as_dict."""
+        history = cls()
+        history.timestamps = _decode("d", data.get("t"))
+        history.totals_km = _decode("d", data.get("km"))
+        history.reset_timestamps = _decode("d", data.get("reset_t"))
+        history.reset_parts = _decode("H", data.get("reset_part"))
+        return history
+
+
+class WearHistoryStore:
+    """Persists the wear history of every bike in a separate storage file.
+
+    Each bike's encoded arrays are kept between writes, so a write only
+    re-encodes the bikes whose history changed since the previous one.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store[dict[str, Any]](
+            hass,
+            HISTORY_STORAGE_VERSION,
+            f"{HISTORY_STORAGE_KEY}.{entry_id}",
+            private=True,
+        )
+        self._bikes: Dict[str, BikeHistory] = {}
+        self._part_names: List[str] = []
+        self._encoded: Dict[str, Dict[str, str]] = {}
+        self._dirty_bikes: set[str] = set()
+        self._loaded = False
+
+    async def async_load(self, now: float) -> None:
+        """Load persisted history and apply retention."""
+        if self._loaded:
+            return
+
+        data = await self._store.async_load() or {}
+        self._part_names = list(data.get("parts", []))
+        self._encoded = dict(data.get("bikes", {}))
+        self._bikes = {
+            bike_id: BikeHistory.from_dict(persisted)
+            for bike_id, persisted in self._encoded.items()
+        }
+        for bike_id, history in self._bikes.items():
+            count = len(history.timestamps) + len(history.reset_timestamps)
+            history.compact(now)
+            if len(history.timestamps) + len(history.reset_timestamps) != count:
+                self._dirty_bikes.add(bike_id)
+        self._loaded = True
+
+    def get(self, bike_id: str) -> BikeHistory | None:
+        """Return the history of a bike, if any was recorded."""
+        return self._bikes.get(bike_id)
+
+    def part_name(self, part_index: int) -> str:
+        """Return the part name behind a reset event's part index."""
+        return self._part_names[part_index]
+
+    def resets(self, bike_id: str) -> Iterable[tuple[float, str]]:
+        """Yield (timestamp, part) for each recorded reset of a bike."""
+        history = self._bikes.get(bike_id)
+        if history is None:
+            return
+        for timestamp, part_index in zip(
+            history.reset_timestamps, history.reset_parts
+        ):
+            yield timestamp, self._part_names[part_index]
+
+    @callback
+    def async_record_totals(
+        self, bike_distances_km: Dict[str, float], timestamp: float
+    ) -> None:
+        """Record the current total of each bike."""
+        for bike_id, total_km in bike_distances_km.items():
+            history = self._bikes.setdefault(bike_id, BikeHistory())
+            if history.add_sample(timestamp, total_km):
+                self._dirty_bikes.add(bike_id)
+            if history.needs_compaction:
+                history.compact(timestamp)
+        self._async_schedule_save()
+
+    @callback
+    def async_record_samples(
+        self, bike_id: str, samples: Iterable[tuple[float, float]]
+    ) -> None:
+        """Record (timestamp, total) samples of one bike, e.g. from a backfill."""
+        history = self._bikes.setdefault(bike_id, BikeHistory())
+        for timestamp, total_km in samples:
+            if history.add_sample(timestamp, total_km):
+                self._dirty_bikes.add(bike_id)
+        if history.needs_compaction:
+            history.compact(dt_util.utcnow().timestamp())
+        self._async_schedule_save()
+
+    @callback
+    def async_drop_samples_before(self, timestamp: float) -> None:
+        """Remove every bike's samples older than the timestamp; resets stay."""
+        for bike_id, history in self._bikes.items():
+            if history.drop_samples_before(timestamp):
+                self._dirty_bikes.add(bike_id)
+        self._async_schedule_save()
+
+    @callback
+    def async_record_reset(self, bike_id: str, part: str, timestamp: float) -> None:
+        """Record a reset event for a bike part."""
+        if part not in self._part_names:
+            self._part_names.append(part)
+        history = self._bikes.setdefault(bike_id, BikeHistory())
+        history.add_reset(timestamp, self._part_names.index(part))
+        self._dirty_bikes.add(bike_id)
+        self._async_schedule_save()
+
+    async def async_flush(self) -> None:
+        """Write pending history now."""
+        if self._dirty_bikes:
+            await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        if self._dirty_bikes:
+            self._store.async_delay_save(
+                self._data_to_save, STORAGE_SAVE_DELAY_SECONDS
+            )
+
+    def _data_to_save(self) -> dict[str, Any]:
+        for bike_id in self._dirty_bikes:
+            self._encoded[bike_id] = self._bikes[bike_id].as_dict()
+        self._dirty_bikes.clear()
+        # Copies, since the store may serialise them after later changes.
+        return {"parts": list(self._part_names), "bikes": dict(self._encoded)}
@@ -0,0 +1,133 @@
+"""Append-only journal storage for Strava Bike Maintenance wear counters."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+# Parts tracked by every bike before components became configurable.
+LEGACY_PARTS = ("chain", "chain_waxing", "tires")
+
+
+class WearStore(Store[dict[str, Any]]):
+    """Store of the wear counter document, migrating older formats."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Migrate the wear counter document to the current version."""
+        if old_major_version == STORAGE_VERSION:
+            # Minor versions only add fields older code ignores.
+            return old_data
+        if old_major_version > STORAGE_VERSION:
+            raise HomeAssistantError(
+                f"Wear counters in {self.key} were saved by a newer version "
+                f"(format {old_major_version}) and cannot be read"
+            )
+        data = dict(old_data)
+        if old_major_version == 1:
+            # Version 2 numbers each document so journal records written
+            # against an older one are not replayed on top of it.
+            data["generation"] = 0
+        # Version 3 keeps counters in slots instead of a dict per bike; older
+        # documents always tracked the same three parts.
+        data["slots"] = list(LEGACY_PARTS)
+        data["bikes"] = {
+            bike_id: {
+                **bike,
+                "counters": [
+                    float(bike.get("counters", {}).get(part, 0.0))
+                    for part in LEGACY_PARTS
+                ],
+            }
+            for bike_id, bike in data.get("bikes", {}).items()
+        }
+        return data
+
+
+class WearJournal:
+    """Append-only file of wear records on top of the wear counter document.
+
+    Each write appends one JSON record per line and is synced to disk before
+    returning. Records carry the generation of the document they apply to,
+    so records left over from before a compaction are skipped on replay, and
+    a record torn by a crash is dropped together with anything after it.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        self._hass = hass
+        self._path = hass.config.path(STORAGE_DIR, f"{key}.journal")
+        self.size = 0
+
+    async def async_read(self, generation: int) -> List[Dict[str, Any]]:
+        """Return the records written against the given document generation."""
+        records, self.size = await self._hass.async_add_executor_job(
+            self._read, generation
+        )
+        return records
+
+    async def async_append(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records durably."""
+        text = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        )
+        if text:
+            self.size += await self._hass.async_add_executor_job(self._append, text)
+
+    async def async_clear(self) -> None:
+        """Remove the journal once its records are part of the document."""
+        await self._hass.async_add_executor_job(self._remove)
+        self.size = 0
+
+    def _read(self, generation: int) -> tuple[List[Dict[str, Any]], int]:
+        try:
+            with open(self._path, encoding="utf-8", newline="\n") as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            return [], 0
+
+        records: List[Dict[str, Any]] = []
+        size = 0
+        for line in lines:
+            try:
+                if not line.endswith("\n"):
+                    raise ValueError("record not terminated")
+                record = json.loads(line)
+            except ValueError:
+                # Cut the torn record off so later appends start on a new line.
+                _LOGGER.warning(
+                    "Dropping incomplete wear journal record in %s", self._path
+                )
+                os.truncate(self._path, size)
+                break
+            size += len(line.encode("utf-8"))
+            if record.get("g") == generation:
+                records.append(record)
+        return records, size
+
+    def _append(self, text: str) -> int:
+        data = text.encode("utf-8")
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        descriptor = os.open(
+            self._path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+        )
+        with os.fdopen(descriptor, "ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        return len(data)
+
+    def _remove(self) -> None:
+        with suppress(FileNotFoundError):
+            os.remove(self._path)
@@ -0,0 +1,79 @@
+"""Refresh pipeline instrumentation for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+import time
+from typing import Any, Deque, Dict, Iterator
+
+from .const import METRICS_WINDOW
+
+METRIC_REFRESH = "refresh_ms"
+METRIC_API_LATENCY = "api_latency_ms"
+METRIC_PAYLOAD_SIZE = "payload_bytes"
+METRIC_TOKEN_REFRESH = "token_refresh_ms"
+METRIC_WEAR_PROCESSING = "wear_processing_ms"
+METRIC_STORE_SAVE = "store_save_ms"
+METRIC_ENTITY_FANOUT = "entity_fanout"
+
+METRICS = (
+    METRIC_REFRESH,
+    METRIC_API_LATENCY,
+    METRIC_PAYLOAD_SIZE,
+    METRIC_TOKEN_REFRESH,
+    METRIC_WEAR_PROCESSING,
+    METRIC_STORE_SAVE,
+    METRIC_ENTITY_FANOUT,
+)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class RefreshMetrics:
+    """Keeps the most recent samples of each metric for rolling percentiles."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self._samples: Dict[str, Deque[float]] = {
+            name: deque(maxlen=window) for name in METRICS
+        }
+
+    def record(self, name: str, value: float) -> None:
+        """Add a sample to a metric."""
+        self._samples[name].append(value)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Record the wall time of the enclosed block in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def last(self, name: str) -> float | None:
+        """Return the most recent sample of a metric."""
+        samples = self._samples[name]
+        return samples[-1] if samples else None
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        """Return last value, percentiles and sample count of a metric."""
+        samples = self._samples[name]
+        if not samples:
+            return {"count": 0}
+        ordered = sorted(samples)
+        return {
+            "count": len(ordered),
+            "last": round(samples[-1], 2),
+            "p50": round(_percentile(ordered, 0.5), 2),
+            "p95": round(_percentile(ordered, 0.95), 2),
+            "max": round(ordered[-1], 2),
+        }
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the summary of every metric."""
+        return {name: self.summary(name) for name in METRICS}
@@ -0,0 +1,212 @@
+"""Strava push subscription (webhook) support."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from http import HTTPStatus
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Mapping
+
+from aiohttp import web
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import API_PUSH_SUBSCRIPTIONS_URL
+
+if TYPE_CHECKING:
+    from .coordinator import StravaDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StravaPushEvent:
+    """An event delivered by Strava's push subscription."""
+
+    object_type: str
+    object_id: int
+    aspect_type: str
+    owner_id: int
+    updates: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any]) -> StravaPushEvent | None:
+        """Parse a webhook body, returning None when it is malformed."""
+        try:
+            return cls(
+                object_type=str(payload["object_type"]),
+                object_id=int(payload["object_id"]),
+                aspect_type=str(payload["aspect_type"]),
+                owner_id=int(payload["owner_id"]),
+                updates=dict(payload.get("updates") or {}),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def subscription_challenge_response(
+    query: Mapping[str, str], verify_token: str
+) -> Dict[str, str] | None:
+    """Return the body answering Strava's subscription validation request."""
+    if query.get("hub.mode") != "subscribe":
+        return None
+    if query.get("hub.verify_token") != verify_token:
+        return None
+    challenge = query.get("hub.challenge")
+    if challenge is None:
+        return None
+    return {"hub.challenge": challenge}
+
+
+@dataclass(frozen=True)
+class StravaPushTarget:
+    """The config entry an athlete's events are delivered to."""
+
+    coordinator: StravaDataUpdateCoordinator
+    on_deauthorized: Callable[[], None]
+
+
+class StravaPushHandler:
+    """Receives Strava webhook requests and forwards them to the coordinator.
+
+    Strava allows one subscription per API application, so events of every
+    athlete using the app arrive here and are routed by their owner id.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        verify_token: str,
+        resolve_target: Callable[[int], StravaPushTarget | None],
+    ) -> None:
+        self._hass = hass
+        self._verify_token = verify_token
+        self._resolve_target = resolve_target
+
+    async def async_handle_webhook(
+        self, hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response:
+        """Answer the validation handshake or accept an event."""
+        if request.method == "GET":
+            body = subscription_challenge_response(request.query, self._verify_token)
+            if body is None:
+                return web.Response(status=HTTPStatus.FORBIDDEN)
+            return web.json_response(body)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        event = StravaPushEvent.from_payload(payload)
+        if event is None:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        self.async_dispatch(event)
+        # Strava expects the acknowledgement within two seconds, so the actual
+        # processing runs in the background.
+        return web.Response(status=HTTPStatus.OK)
+
+    @callback
+    def async_dispatch(self, event: StravaPushEvent) -> None:
+        """Route a parsed event to the coordinator of its athlete."""
+        target = self._resolve_target(event.owner_id)
+        if target is None:
+            _LOGGER.debug("Ignoring Strava event for athlete %s", event.owner_id)
+            return
+
+        if event.object_type == "athlete":
+            if event.updates.get("authorized") == "false":
+                target.on_deauthorized()
+            return
+
+        if event.object_type != "activity":
+            return
+
+        self._hass.async_create_task(
+            target.coordinator.async_handle_activity_event(
+                event.object_id, event.aspect_type
+            )
+        )
+
+
+async def async_ensure_push_subscription(
+    hass: HomeAssistant,
+    client_id: str,
+    client_secret: str,
+    callback_url: str,
+    verify_token: str,
+    shared_callback_urls: Iterable[str] = (),
+) -> int | None:
+    """Create the app's push subscription unless it already points here.
+
+    A subscription to one of ``shared_callback_urls``, the webhooks of other
+    entries using the same app, is accepted as well since those route events
+    by athlete.
+    """
+    session = async_get_clientsession(hass)
+    credentials = {"client_id": client_id, "client_secret": client_secret}
+
+    async with session.get(
+        API_PUSH_SUBSCRIPTIONS_URL, params=credentials, raise_for_status=True
+    ) as response:
+        subscriptions = await response.json()
+
+    accepted = {callback_url, *shared_callback_urls}
+    for subscription in subscriptions:
+        if subscription.get("callback_url") in accepted:
+            return subscription.get("id")
+
+    if subscriptions:
+        # Strava allows a single subscription per API application.
+        _LOGGER.warning(
+            "Strava application already pushes to %s; staying on polling",
+            subscriptions[0].get("callback_url"),
+        )
+        return None
+
+    # Strava validates the callback synchronously, so the webhook must already
+    # be registered when this request is made.
+    async with session.post(
+        API_PUSH_SUBSCRIPTIONS_URL,
+        data={
+            **credentials,
+            "callback_url": callback_url,
+            "verify_token": verify_token,
+        },
+        raise_for_status=True,
+    ) as response:
+        created = await response.json()
+
+    return created.get("id")
+
+
+async def async_delete_push_subscription(
+    hass: HomeAssistant,
+    client_id: str,
+    client_secret: str,
+    callback_url: str,
+) -> bool:
+    """Delete the app's push subscription if it points at ``callback_url``.
+
+    Returns whether a subscription was deleted.
+    """
+    session = async_get_clientsession(hass)
+    credentials = {"client_id": client_id, "client_secret": client_secret}
+
+    async with session.get(
+        API_PUSH_SUBSCRIPTIONS_URL, params=credentials, raise_for_status=True
+    ) as response:
+        subscriptions = await response.json()
+
+    deleted = False
+    for subscription in subscriptions:
+        if subscription.get("callback_url") != callback_url:
+            continue
+        async with session.delete(
+            f"{API_PUSH_SUBSCRIPTIONS_URL}/{subscription['id']}",
+            params=credentials,
+            raise_for_status=True,
+        ):
+            deleted = True
+    return deleted
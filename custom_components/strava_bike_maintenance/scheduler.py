@@ -0,0 +1,246 @@
+"""Rate-limit-aware poll scheduling for the Strava Bike Maintenance integration."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import math
+import random
+from typing import Mapping
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    MAX_UPDATE_INTERVAL_SECONDS,
+    MIN_UPDATE_INTERVAL_SECONDS,
+    RATE_LIMIT_BACKOFF_SECONDS,
+    RATE_LIMIT_CRITICAL_USAGE,
+    RATE_LIMIT_RELAXED_USAGE,
+    RECENT_ACTIVITY_SECONDS,
+    UPDATE_INTERVAL_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SHORT_WINDOW_SECONDS = 900
+DAY_SECONDS = 86400
+
+
+def _parse_pair(value: str | None) -> tuple[int, int] | None:
+    """Parse a Strava "<15 minute>,<daily>" header value."""
+    if not value:
+        return None
+    try:
+        short, daily = (int(part) for part in value.split(","))
+    except ValueError:
+        return None
+    return short, daily
+
+
+class RateLimitBudget:
+    """Rate-limit state of one Strava API application.
+
+    Strava counts requests per application, so every config entry using the
+    same client id draws on one budget. The budget also hands each entry a
+    slot so their polls can be spread across the interval.
+    """
+
+    def __init__(self) -> None:
+        self._limits: tuple[int, int] | None = None
+        self._usage: tuple[int, int] | None = None
+        self._retry_after: float | None = None
+        self._consecutive_limited = 0
+        self._entry_ids: list[str] = []
+
+    @property
+    def usage_ratio(self) -> tuple[float, float] | None:
+        """Fraction of the 15-minute and daily budgets already used."""
+        if self._limits is None or self._usage is None:
+            return None
+        return tuple(  # type: ignore[return-value]
+            used / limit if limit else 1.0
+            for used, limit in zip(self._usage, self._limits)
+        )
+
+    @property
+    def rate_limited(self) -> bool:
+        """Return whether the last request was answered with a 429."""
+        return self._consecutive_limited > 0
+
+    @property
+    def entry_ids(self) -> list[str]:
+        """Return the config entries sharing this budget."""
+        return list(self._entry_ids)
+
+    def add_entry(self, entry_id: str) -> None:
+        """Give a config entry a polling slot."""
+        if entry_id not in self._entry_ids:
+            self._entry_ids.append(entry_id)
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Release a config entry's polling slot."""
+        if entry_id in self._entry_ids:
+            self._entry_ids.remove(entry_id)
+
+    def slot(self, entry_id: str) -> tuple[int, int]:
+        """Return the entry's slot index and the number of slots."""
+        if entry_id not in self._entry_ids:
+            return 0, 1
+        return self._entry_ids.index(entry_id), len(self._entry_ids)
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Record the rate-limit state reported with a Strava response."""
+        limits = _parse_pair(headers.get("X-RateLimit-Limit"))
+        usage = _parse_pair(headers.get("X-RateLimit-Usage"))
+        if limits is not None and usage is not None:
+            self._limits = limits
+            self._usage = usage
+
+    def observe_rate_limited(self, headers: Mapping[str, str] | None) -> None:
+        """Record a 429 response and honour its Retry-After header."""
+        self._consecutive_limited += 1
+        self._retry_after = None
+        if headers is None:
+            return
+        self.observe_headers(headers)
+        try:
+            self._retry_after = float(headers.get("Retry-After", ""))
+        except ValueError:
+            pass
+
+    def observe_success(self) -> None:
+        """Record that requests are accepted again."""
+        self._consecutive_limited = 0
+        self._retry_after = None
+
+    def backoff_seconds(self) -> float:
+        """Exponential backoff with jitter, never shorter than Retry-After."""
+        backoff = min(
+            RATE_LIMIT_BACKOFF_SECONDS * 2 ** (self._consecutive_limited - 1),
+            MAX_UPDATE_INTERVAL_SECONDS,
+        )
+        # Jitter keeps instances sharing one Strava app from retrying in step.
+        delay = random.uniform(backoff / 2, backoff)
+        if self._retry_after is not None:
+            delay = max(delay, self._retry_after)
+        return delay
+
+
+class AdaptivePollScheduler:
+    """Derives the next poll interval from Strava's rate-limit headers.
+
+    Strava reports the application's usage across all of its clients, so the
+    headers also reflect requests made by other config entries and Home
+    Assistant instances that share the same API application.
+    """
+
+    def __init__(
+        self,
+        base_interval_seconds: int = UPDATE_INTERVAL_SECONDS,
+        *,
+        boost_on_activity: bool = True,
+        budget: RateLimitBudget | None = None,
+        entry_id: str | None = None,
+    ) -> None:
+        self._base_interval_seconds = base_interval_seconds
+        # Push updates already deliver new rides, so polling need not speed up.
+        self._boost_on_activity = boost_on_activity
+        self.budget = budget or RateLimitBudget()
+        # Entries sharing a budget take turns; None polls without staggering.
+        self._entry_id = entry_id
+        self._last_activity: datetime | None = None
+
+    @property
+    def usage_ratio(self) -> tuple[float, float] | None:
+        """Fraction of the 15-minute and daily budgets already used."""
+        return self.budget.usage_ratio
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Record the rate-limit state reported with a Strava response."""
+        self.budget.observe_headers(headers)
+
+    def observe_rate_limited(self, headers: Mapping[str, str] | None) -> None:
+        """Record a 429 response and honour its Retry-After header."""
+        self.budget.observe_rate_limited(headers)
+
+    def observe_refresh(self, has_new_data: bool) -> None:
+        """Record a successful refresh and whether it brought new rides."""
+        self.budget.observe_success()
+        if has_new_data:
+            self._last_activity = dt_util.utcnow()
+
+    def next_interval(self) -> timedelta:
+        """Return how long to wait before the next poll."""
+        if self.budget.rate_limited:
+            return timedelta(seconds=self.budget.backoff_seconds())
+
+        ratio = self.usage_ratio
+        if ratio is not None:
+            short_usage, daily_usage = ratio
+            if daily_usage >= RATE_LIMIT_CRITICAL_USAGE:
+                # The daily budget resets at midnight UTC; spread what remains.
+                return timedelta(seconds=MAX_UPDATE_INTERVAL_SECONDS)
+            if short_usage >= RATE_LIMIT_CRITICAL_USAGE:
+                # Wait for the next quarter-hour window with some spread.
+                return timedelta(
+                    seconds=max(
+                        self._seconds_to_next_short_window(),
+                        MIN_UPDATE_INTERVAL_SECONDS,
+                    )
+                    + random.uniform(0, 60)
+                )
+            if max(ratio) >= RATE_LIMIT_RELAXED_USAGE:
+                return self._staggered(self._base_interval_seconds)
+
+        if self._boost_on_activity and self._recently_active():
+            return self._staggered(MIN_UPDATE_INTERVAL_SECONDS)
+        return self._staggered(self._base_interval_seconds)
+
+    def bulk_delay(self) -> float:
+        """Return how long bulk work such as a backfill should pause before its
+        next request.
+
+        Bulk requests only use the budget below the relaxed threshold, leaving
+        the rest to regular polling.
+        """
+        if self.budget.rate_limited:
+            return self.budget.backoff_seconds()
+        ratio = self.usage_ratio
+        if ratio is None:
+            return 0.0
+        short_usage, daily_usage = ratio
+        if daily_usage >= RATE_LIMIT_RELAXED_USAGE:
+            # The daily budget resets at midnight UTC.
+            now = dt_util.utcnow().timestamp()
+            return DAY_SECONDS - (now % DAY_SECONDS) + random.uniform(0, 60)
+        if short_usage >= RATE_LIMIT_RELAXED_USAGE:
+            return self._seconds_to_next_short_window() + random.uniform(0, 60)
+        return 0.0
+
+    def _staggered(self, seconds: float) -> timedelta:
+        """Place the poll in this entry's slot of a grid of ``seconds`` steps.
+
+        Entries sharing a budget then poll in turn instead of together. The
+        next grid point at least half an interval away is used, so steady
+        polling keeps the full interval.
+        """
+        if self._entry_id is None:
+            return timedelta(seconds=seconds)
+        index, count = self.budget.slot(self._entry_id)
+        if count < 2:
+            return timedelta(seconds=seconds)
+        now = dt_util.utcnow().timestamp()
+        phase = seconds * index / count
+        target = math.ceil((now + seconds / 2 - phase) / seconds) * seconds + phase
+        return timedelta(seconds=target - now)
+
+    def _recently_active(self) -> bool:
+        if self._last_activity is None:
+            return False
+        elapsed = (dt_util.utcnow() - self._last_activity).total_seconds()
+        return elapsed < RECENT_ACTIVITY_SECONDS
+
+    @staticmethod
+    def _seconds_to_next_short_window() -> float:
+        now = dt_util.utcnow().timestamp()
+        return SHORT_WINDOW_SECONDS - (now % SHORT_WINDOW_SECONDS)
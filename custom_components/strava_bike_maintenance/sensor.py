@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Dict, List
 
 from homeassistant.components.sensor import (
@@ -9,19 +10,95 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfLength
+from homeassistant.const import (
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfLength,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, WEAR_PARTS
-from .coordinator import StravaDataUpdateCoordinator
+from .const import (
+    CONF_FLEET_PART_SENSORS,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_SENSOR_MODE,
+    DEFAULT_SENSOR_MODE,
+    DOMAIN,
+    SENSOR_MODE_FLEET,
+)
+from .coordinator import (
+    CONTEXT_DISTANCE,
+    CONTEXT_FLEET,
+    CONTEXT_SERVICE_DUE,
+    CONTEXT_SUMMARY,
+    CONTEXT_WEAR,
+    StravaDataUpdateCoordinator,
+)
+from .metrics import (
+    METRIC_API_LATENCY,
+    METRIC_ENTITY_FANOUT,
+    METRIC_PAYLOAD_SIZE,
+    METRIC_REFRESH,
+    METRIC_STORE_SAVE,
+    METRIC_TOKEN_REFRESH,
+    METRIC_WEAR_PROCESSING,
+)
 
 WEAR_ICONS = {
     "chain": "mdi:link-variant",
     "chain_waxing": "mdi:candle",
     "tires": "mdi:tire",
+    "cassette": "mdi:cog",
+    "chainrings": "mdi:cog-outline",
+    "brake_pads": "mdi:car-brake-alert",
+    "brake_rotors": "mdi:disc",
+    "tubeless_sealant": "mdi:water",
+    "bearings": "mdi:circle-double",
+    "cables": "mdi:cable-data",
+    "suspension_service": "mdi:arrow-collapse-vertical",
+}
+
+# Bikes and parts listed by name in the fleet sensor's attributes, at most.
+FLEET_DUE_LIST_LIMIT = 100
+
+# Metric -> (name, unit, device class) for the refresh diagnostics sensors.
+METRIC_SENSORS = {
+    METRIC_REFRESH: (
+        "Refresh Duration",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    METRIC_API_LATENCY: (
+        "API Latency",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    METRIC_PAYLOAD_SIZE: (
+        "API Payload Size",
+        UnitOfInformation.BYTES,
+        SensorDeviceClass.DATA_SIZE,
+    ),
+    METRIC_TOKEN_REFRESH: (
+        "Token Refresh Duration",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    METRIC_WEAR_PROCESSING: (
+        "Wear Processing Duration",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    METRIC_STORE_SAVE: (
+        "Storage Save Duration",
+        UnitOfTime.MILLISECONDS,
+        SensorDeviceClass.DURATION,
+    ),
+    METRIC_ENTITY_FANOUT: ("Entity Updates", None, None),
 }
 
 
@@ -31,10 +108,17 @@ async def async_setup_entry(
     async_add_entities,
 ) -> None:
     """Set up Strava Bike Maintenance sensors."""
-    entry_data = hass.data[DOMAIN][entry.entry_id]
+    entry_data = hass.data[DOMAIN]["entries"][entry.entry_id]
     coordinator: StravaDataUpdateCoordinator = entry_data["coordinator"]
 
+    long_term_statistics = entry.options.get(CONF_LONG_TERM_STATISTICS, False)
+    fleet_mode = (
+        entry.options.get(CONF_SENSOR_MODE, DEFAULT_SENSOR_MODE) == SENSOR_MODE_FLEET
+    )
+    # Fleet mode only creates per-part sensors for the components asked for.
+    part_sensors = entry.options.get(CONF_FLEET_PART_SENSORS, [])
     known_bikes: set[str] = set()
+    unique_ids: set[str] = set()
 
     @callback
     def _add_new_bike_entities() -> None:
@@ -44,21 +128,81 @@ async def async_setup_entry(
             if gear_id in known_bikes:
                 continue
             known_bikes.add(gear_id)
-            new_entities.append(StravaBikeDistanceSensor(coordinator, gear_id))
-            for part in WEAR_PARTS:
-                new_entities.append(StravaBikeWearSensor(coordinator, gear_id, part))
+            if fleet_mode:
+                new_entities.append(
+                    StravaBikeSummarySensor(
+                        coordinator, gear_id, long_term_statistics
+                    )
+                )
+            else:
+                new_entities.append(
+                    StravaBikeDistanceSensor(
+                        coordinator, gear_id, long_term_statistics
+                    )
+                )
+            for part in coordinator.components.for_bike(gear_id):
+                if fleet_mode and part not in part_sensors:
+                    continue
+                new_entities.append(
+                    StravaBikeWearSensor(
+                        coordinator, gear_id, part, long_term_statistics
+                    )
+                )
+                new_entities.append(
+                    StravaBikeServiceDueSensor(coordinator, gear_id, part)
+                )
+        unique_ids.update(entity.unique_id for entity in new_entities)
         if new_entities:
             async_add_entities(new_entities)
 
+    async_add_entities(
+        StravaRefreshMetricSensor(coordinator, entry.entry_id, metric)
+        for metric in METRIC_SENSORS
+    )
+    if fleet_mode:
+        async_add_entities([StravaFleetSensor(coordinator, entry.entry_id)])
+
     _add_new_bike_entities()
-    coordinator.async_add_listener(_add_new_bike_entities)
+    _async_remove_stale_bike_entities(hass, entry.entry_id, coordinator, unique_ids)
+    entry.async_on_unload(coordinator.async_add_listener(_add_new_bike_entities))
+
+
+@callback
+def _async_remove_stale_bike_entities(
+    hass: HomeAssistant,
+    entry_id: str,
+    coordinator: StravaDataUpdateCoordinator,
+    unique_ids: set[str],
+) -> None:
+    """Remove sensors of known bikes that the current options no longer create.
+
+    This covers components taken off a bike and the sensors replaced when
+    switching sensor modes. Wear counters are kept, so re-enabling a
+    component restores its count.
+    """
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, entry_id):
+        # Bike sensor unique ids start with the gear id, e.g. "b123_wear_chain".
+        gear_id = entity.unique_id.partition("_")[0]
+        if gear_id in coordinator.data and entity.unique_id not in unique_ids:
+            registry.async_remove(entity.entity_id)
 
 
 class StravaBikeBase(CoordinatorEntity[Dict[str, Dict[str, Any]]]):
-    """Base entity shared between bike sensors."""
+    """Base entity shared between bike sensors.
 
-    def __init__(self, coordinator: StravaDataUpdateCoordinator, gear_id: str) -> None:
-        super().__init__(coordinator)
+    The listener context tells the coordinator which value the entity shows,
+    so it is only asked to write its state when that value changed.
+    """
+
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        gear_id: str,
+        kind: str,
+        part: str | None = None,
+    ) -> None:
+        super().__init__(coordinator, context=(gear_id, kind, part))
         self._gear_id = gear_id
 
     @property
@@ -73,6 +217,8 @@ class StravaBikeBase(CoordinatorEntity[Dict[str, Dict[str, Any]]]):
             manufacturer=bike.get("brand_name") or "Strava",
             name=bike.get("name") or f"Strava Bike {self._gear_id}",
             model=bike.get("model_name"),
+            # Strava gear ids are the bike's numeric id prefixed with "b".
+            configuration_url=f"https://www.strava.com/bikes/{self._gear_id[1:]}",
         )
 
 
@@ -83,8 +229,16 @@ class StravaBikeDistanceSensor(StravaBikeBase, SensorEntity):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
 
-    def __init__(self, coordinator: StravaDataUpdateCoordinator, gear_id: str) -> None:
-        super().__init__(coordinator, gear_id)
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        gear_id: str,
+        long_term_statistics: bool = False,
+    ) -> None:
+        super().__init__(coordinator, gear_id, CONTEXT_DISTANCE)
+        if long_term_statistics:
+            # The integration imports this statistic itself.
+            self._attr_state_class = None
         bike = self._bike_data or {}
         bike_name = bike.get("name") or gear_id
         self._attr_name = f"Strava {bike_name} Total Distance"
@@ -106,6 +260,63 @@ class StravaBikeDistanceSensor(StravaBikeBase, SensorEntity):
             "bike_id": self._gear_id,
             "brand": bike.get("brand_name"),
             "model": bike.get("model_name"),
+            "description": bike.get("description"),
+            "weight_kg": bike.get("weight"),
+            "retired": bike.get("retired"),
+        }
+
+
+class StravaBikeSummarySensor(StravaBikeBase, SensorEntity):
+    """Sensor reporting a bike's distance with every wear counter as attributes.
+
+    Used in fleet mode in place of the distance sensor and the per-part sensors.
+    """
+
+    _attr_device_class = SensorDeviceClass.DISTANCE
+    _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:bicycle"
+
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        gear_id: str,
+        long_term_statistics: bool = False,
+    ) -> None:
+        super().__init__(coordinator, gear_id, CONTEXT_SUMMARY)
+        if long_term_statistics:
+            # The integration imports this statistic itself.
+            self._attr_state_class = None
+        bike = self._bike_data or {}
+        bike_name = bike.get("name") or gear_id
+        self._attr_name = f"Strava {bike_name}"
+        self._attr_unique_id = f"{gear_id}_summary"
+
+    @property
+    def native_value(self) -> float | None:
+        bike = self._bike_data
+        if bike is None:
+            return None
+        return bike.get("distance_km")
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        bike = self._bike_data
+        if bike is None:
+            return None
+        intervals_km = self.coordinator.components.intervals_km
+        wear_counters = bike.get("wear_counters", {})
+        return {
+            "bike_id": self._gear_id,
+            "brand": bike.get("brand_name"),
+            "model": bike.get("model_name"),
+            "retired": bike.get("retired"),
+            "wear_km": wear_counters,
+            "service_interval_km": {
+                part: intervals_km.get(part) for part in wear_counters
+            },
+            "service_due": bike.get("service_due", {}),
+            "daily_km": bike.get("daily_km"),
         }
 
 
@@ -121,12 +332,16 @@ class StravaBikeWearSensor(StravaBikeBase, SensorEntity):
         coordinator: StravaDataUpdateCoordinator,
         gear_id: str,
         part: str,
+        long_term_statistics: bool = False,
     ) -> None:
-        super().__init__(coordinator, gear_id)
+        super().__init__(coordinator, gear_id, CONTEXT_WEAR, part)
         self._part = part
+        if long_term_statistics:
+            # The integration imports this statistic itself.
+            self._attr_state_class = None
         bike = self._bike_data or {}
         bike_name = bike.get("name") or gear_id
-        part_label = WEAR_PARTS.get(part, part.title())
+        part_label = coordinator.components.name(part)
         self._attr_name = f"Strava {bike_name} {part_label}"
         self._attr_unique_id = f"{gear_id}_wear_{part}"
         self._attr_icon = WEAR_ICONS.get(part, "mdi:gauge")
@@ -145,3 +360,137 @@ class StravaBikeWearSensor(StravaBikeBase, SensorEntity):
             "bike_id": self._gear_id,
             "wear_part": self._part,
         }
+
+
+class StravaBikeServiceDueSensor(StravaBikeBase, SensorEntity):
+    """Sensor forecasting when a wear part reaches its service interval."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        gear_id: str,
+        part: str,
+    ) -> None:
+        super().__init__(coordinator, gear_id, CONTEXT_SERVICE_DUE, part)
+        self._part = part
+        bike = self._bike_data or {}
+        bike_name = bike.get("name") or gear_id
+        part_label = coordinator.components.name(part)
+        self._attr_name = f"Strava {bike_name} {part_label} Service Due"
+        self._attr_unique_id = f"{gear_id}_service_due_{part}"
+        self._attr_icon = "mdi:calendar-clock"
+
+    @property
+    def native_value(self) -> datetime | None:
+        bike = self._bike_data
+        if bike is None:
+            return None
+        return bike.get("service_due", {}).get(self._part)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        bike = self._bike_data or {}
+        return {
+            "bike_id": self._gear_id,
+            "wear_part": self._part,
+            "service_interval_km": self.coordinator.components.intervals_km.get(
+                self._part
+            ),
+            "daily_km": bike.get("daily_km"),
+        }
+
+
+class StravaFleetSensor(
+    CoordinatorEntity[Dict[str, Dict[str, Any]]], SensorEntity
+):
+    """Sensor counting the components across all bikes that are due for service."""
+
+    _attr_icon = "mdi:tools"
+    _attr_native_unit_of_measurement = "components"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    # The due list can be long and is derived from the bike sensors anyway.
+    _unrecorded_attributes = frozenset({"components_due"})
+
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        entry_id: str,
+    ) -> None:
+        super().__init__(coordinator, context=CONTEXT_FLEET)
+        self._attr_name = "Strava Fleet Service Due"
+        self._attr_unique_id = f"{entry_id}_fleet"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer="Strava",
+            name="Strava Bike Maintenance",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    def _components_due(self) -> List[tuple[str, str]]:
+        """Return the (gear id, part) pairs at or past their service interval."""
+        intervals_km = self.coordinator.components.intervals_km
+        return [
+            (gear_id, part)
+            for gear_id, bike in self.coordinator.data.items()
+            for part, wear_km in bike.get("wear_counters", {}).items()
+            if wear_km >= intervals_km.get(part, float("inf"))
+        ]
+
+    @property
+    def native_value(self) -> int:
+        return len(self._components_due())
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        data = self.coordinator.data
+        components = self.coordinator.components
+        return {
+            "bikes": len(data),
+            "total_distance_km": round(
+                sum(bike.get("distance_km") or 0.0 for bike in data.values()), 1
+            ),
+            "components_due": [
+                f"{data[gear_id].get('name') or gear_id}: {components.name(part)}"
+                for gear_id, part in self._components_due()[:FLEET_DUE_LIST_LIMIT]
+            ],
+        }
+
+
+class StravaRefreshMetricSensor(
+    CoordinatorEntity[Dict[str, Dict[str, Any]]], SensorEntity
+):
+    """Diagnostic sensor reporting one refresh pipeline metric."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: StravaDataUpdateCoordinator,
+        entry_id: str,
+        metric: str,
+    ) -> None:
+        super().__init__(coordinator)
+        self._metric = metric
+        name, unit, device_class = METRIC_SENSORS[metric]
+        self._attr_name = f"Strava {name}"
+        self._attr_unique_id = f"{entry_id}_metric_{metric}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            manufacturer="Strava",
+            name="Strava Bike Maintenance",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        value = self.coordinator.metrics.last(self._metric)
+        return round(value, 2) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        return self.coordinator.metrics.summary(self._metric)
@@ -0,0 +1,176 @@
+"""Recorder long-term statistics for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, List
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfLength
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .components import ComponentRegistry
+from .const import DOMAIN
+from .history import BikeHistory, WearHistoryStore
+
+HOUR_SECONDS = 3600
+
+
+def distance_statistic_id(gear_id: str) -> str:
+    """Return the external statistic id of a bike's total distance."""
+    return f"{DOMAIN}:{gear_id.lower()}_distance"
+
+
+def wear_statistic_id(gear_id: str, part: str) -> str:
+    """Return the external statistic id of a wear counter."""
+    return f"{DOMAIN}:{gear_id.lower()}_{part}_wear"
+
+
+def _hour_start(timestamp: float) -> datetime:
+    return dt_util.utc_from_timestamp(timestamp - timestamp % HOUR_SECONDS)
+
+
+class WearStatistics:
+    """Imports bike distance and wear into long-term statistics.
+
+    Each refresh adds an hourly data point to the statistics of the bikes it
+    changed, and a backfill imports the whole recorded history in one batch,
+    so long-range charts read hourly aggregates instead of sensor state rows.
+    """
+
+    def __init__(self, hass: HomeAssistant, components: ComponentRegistry) -> None:
+        self._hass = hass
+        self._components = components
+
+    @callback
+    def async_record(self, data: Dict[str, Any]) -> None:
+        """Import the current distance and wear of the given bikes."""
+        start = _hour_start(dt_util.utcnow().timestamp())
+        for gear_id, bike in data.items():
+            total_km = bike["distance_km"]
+            self._async_import_distance(
+                gear_id,
+                bike["name"],
+                [StatisticData(start=start, state=total_km, sum=total_km)],
+            )
+            for part, wear_km in bike.get("wear_counters", {}).items():
+                self._async_import_wear(
+                    gear_id,
+                    bike["name"],
+                    part,
+                    [
+                        StatisticData(
+                            start=start,
+                            state=wear_km,
+                            mean=wear_km,
+                            min=wear_km,
+                            max=wear_km,
+                        )
+                    ],
+                )
+
+    @callback
+    def async_import_history(
+        self,
+        data: Dict[str, Any],
+        history_store: WearHistoryStore,
+        tracked_since: Dict[str, float],
+    ) -> None:
+        """Import the recorded odometer history of every bike.
+
+        Past wear is derived from the odometer and reset events, so it does
+        not include ride weighting. Parts never reset count from when tracking
+        of the bike began, like their live counters.
+        """
+        for gear_id, bike in data.items():
+            history = history_store.get(gear_id)
+            if history is None or not history.timestamps:
+                continue
+            tracked_km = None
+            if gear_id in tracked_since:
+                tracked_km = history.total_at(tracked_since[gear_id])
+            if tracked_km is None:
+                tracked_km = history.totals_km[0]
+            hourly = self._hourly_totals(history)
+            self._async_import_distance(
+                gear_id,
+                bike["name"],
+                [
+                    StatisticData(start=start, state=total_km, sum=total_km)
+                    for start, total_km in hourly
+                ],
+            )
+
+            # Reset timestamps per part, sorted like the history's arrays.
+            resets: Dict[str, List[float]] = {}
+            for timestamp, part in history_store.resets(gear_id):
+                resets.setdefault(part, []).append(timestamp)
+            for part in bike.get("wear_counters", {}):
+                part_resets = resets.get(part, [])
+                statistics: List[StatisticData] = []
+                for start, total_km in hourly:
+                    # Wear is the distance since the last reset before the hour
+                    # ends, or since tracking began.
+                    hour_end = start.timestamp() + HOUR_SECONDS
+                    index = bisect_left(part_resets, hour_end)
+                    base_km = (
+                        history.total_at(part_resets[index - 1]) if index else None
+                    )
+                    if base_km is None:
+                        base_km = tracked_km
+                    wear_km = max(total_km - base_km, 0.0)
+                    statistics.append(
+                        StatisticData(
+                            start=start,
+                            state=wear_km,
+                            mean=wear_km,
+                            min=wear_km,
+                            max=wear_km,
+                        )
+                    )
+                self._async_import_wear(gear_id, bike["name"], part, statistics)
+
+    @staticmethod
+    def _hourly_totals(history: BikeHistory) -> List[tuple[datetime, float]]:
+        """Return the last total recorded in each hour that has samples."""
+        hourly: List[tuple[datetime, float]] = []
+        last_hour: float | None = None
+        for timestamp, total_km in zip(history.timestamps, history.totals_km):
+            hour = timestamp - timestamp % HOUR_SECONDS
+            if hour == last_hour:
+                hourly[-1] = (hourly[-1][0], total_km)
+            else:
+                hourly.append((_hour_start(timestamp), total_km))
+                last_hour = hour
+        return hourly
+
+    @callback
+    def _async_import_distance(
+        self, gear_id: str, name: str, statistics: List[StatisticData]
+    ) -> None:
+        metadata = StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=f"{name} distance",
+            source=DOMAIN,
+            statistic_id=distance_statistic_id(gear_id),
+            unit_of_measurement=UnitOfLength.KILOMETERS,
+        )
+        async_add_external_statistics(self._hass, metadata, statistics)
+
+    @callback
+    def _async_import_wear(
+        self, gear_id: str, name: str, part: str, statistics: List[StatisticData]
+    ) -> None:
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=f"{name} {self._components.name(part)} wear",
+            source=DOMAIN,
+            statistic_id=wear_statistic_id(gear_id, part),
+            unit_of_measurement=UnitOfLength.KILOMETERS,
+        )
+        async_add_external_statistics(self._hass, metadata, statistics)
@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict
+from array import array
+import asyncio
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Sequence
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
-from .const import STORAGE_KEY, STORAGE_VERSION, WEAR_PARTS
+from .alerts import ServiceAlerts
+from .api import StravaRide
+from .const import (
+    ACTIVITY_INDEX_MAX_SIZE,
+    ACTIVITY_SYNC_LOOKBACK_SECONDS,
+    DEFAULT_COMPONENTS,
+    DOMAIN,
+    JOURNAL_COMPACT_BYTES,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+)
+from .history import WearHistoryStore
+from .journal import WearJournal, WearStore
+from .metrics import METRIC_STORE_SAVE, RefreshMetrics
+from .weighting import WearWeighting
 
 
 @dataclass
@@ -16,19 +35,165 @@ class BikeWearState:
     """In-memory representation of wear data for a single bike."""
 
     last_total_distance_km: float | None
-    counters_km: Dict[str, float]
+    # One counter per component slot; see WearCounterManager._slots.
+    counters_km: array[float]
+
+
+@dataclass
+class ActivitySyncState:
+    """Cursor and recently processed activity ids for incremental sync."""
+
+    cursor: int | None = None
+    # When the cursor was first seeded; the totals baseline already includes
+    # older rides, so they are only remembered, never counted.
+    started_at: int | None = None
+    # Activity id -> ride as last applied, pruned to the lookback window so
+    # re-fetched or edited rides can be reconciled instead of double counted.
+    recent: Dict[int, StravaRide] = field(default_factory=dict)
+
+
+@dataclass
+class BackfillState:
+    """Checkpoint of the historical backfill, which walks back from the newest ride."""
+
+    # Rides starting after this timestamp have been folded in, and so have
+    # those in boundary_ids, which started exactly at it.
+    before: int
+    boundary_ids: list[int] = field(default_factory=list)
+    # Each bike's total just after the next (older) ride to fold in.
+    remaining_km: Dict[str, float] = field(default_factory=dict)
+    # When live counting of each bike began; older rides were never counted.
+    tracked_since: Dict[str, float] = field(default_factory=dict)
+    # A rerun rebuilds the history only; the first run already counted wear.
+    count_wear: bool = True
+    complete: bool = False
+
+
+def _ride_from_list(entry: list[Any]) -> StravaRide | None:
+    """Restore a processed ride stored as a list."""
+    # Older index entries only held the id and start time; drop them.
+    if len(entry) < 4:
+        return None
+    activity_id, gear_id, start_ts, distance_km, *weighting = entry
+    sport_type, elevation_gain_m = weighting or (None, 0.0)
+    return StravaRide(
+        activity_id=int(activity_id),
+        gear_id=gear_id,
+        start_ts=int(start_ts),
+        distance_km=float(distance_km),
+        sport_type=sport_type,
+        elevation_gain_m=float(elevation_gain_m),
+    )
+
+
+def _ride_to_list(ride: StravaRide) -> list[Any]:
+    return [
+        ride.activity_id,
+        ride.gear_id,
+        ride.start_ts,
+        ride.distance_km,
+        ride.sport_type,
+        ride.elevation_gain_m,
+    ]
+
+
+def _backfill_from_dict(backfill: Dict[str, Any] | None) -> BackfillState | None:
+    if backfill is None:
+        return None
+    if "boundary_ids" not in backfill:
+        # Checkpoints from before boundary ids excluded their timestamp.
+        return BackfillState(
+            before=backfill["before"] - 1,
+            remaining_km=backfill.get("remaining_km", {}),
+            tracked_since=backfill.get("tracked_since", {}),
+            count_wear=backfill.get("count_wear", True),
+            complete=backfill.get("complete", False),
+        )
+    return BackfillState(
+        before=backfill["before"],
+        boundary_ids=backfill["boundary_ids"],
+        remaining_km=backfill.get("remaining_km", {}),
+        tracked_since=backfill.get("tracked_since", {}),
+        count_wear=backfill.get("count_wear", True),
+        complete=backfill.get("complete", False),
+    )
 
 
 class WearCounterManager:
-    """Synchronises wear counters between Strava updates and Home Assistant."""
+    """Synchronises wear counters between Strava updates and Home Assistant.
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    Each bike's counters are a flat array with one slot per component. Slots
+    are only ever appended, so a component that is switched off and on again
+    keeps its count.
+
+    By default every write replaces the whole wear document. With ``journal``
+    enabled, writes append only the changed bikes and rides to a journal,
+    which is folded back into the document in the background once it grows
+    past JOURNAL_COMPACT_BYTES.
+
+    With ``alerts`` set, each update compares the counters it touched with
+    their values before it and reports every counter that crossed its service
+    interval, so an alert fires once per crossing.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        metrics: RefreshMetrics | None = None,
+        weighting: WearWeighting | None = None,
+        journal: bool = False,
+        components: Sequence[str] = DEFAULT_COMPONENTS,
+        alerts: ServiceAlerts | None = None,
+    ) -> None:
         self._hass = hass
-        self._store = Store[dict[str, Any]](
-            hass, STORAGE_VERSION, STORAGE_KEY, private=True
+        self._metrics = metrics or RefreshMetrics()
+        # Only rides seen individually (activity sync, backfill) can be weighted.
+        self._weighting = weighting or WearWeighting()
+        self._store = WearStore(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}", private=True
         )
+        # The journal is always replayed, so switching it off loses nothing.
+        self._journal = WearJournal(hass, f"{STORAGE_KEY}.{entry_id}")
+        self._use_journal = journal
+        # Journal records only apply to the document generation they name.
+        self._generation = 0
+        self._write_lock = asyncio.Lock()
+        self._compaction: asyncio.Task[None] | None = None
+        self._components = tuple(components)
+        # Component key of each counter slot, and the slots of the components
+        # currently tracked, in configuration order.
+        self._slots: list[str] = []
+        self._slot_index: Dict[str, int] = {}
+        self._component_slots: list[int] = []
+        self._slots_dirty = False
         self._states: Dict[str, BikeWearState] = {}
+        self._alerts = alerts
+        # Counters of the bikes changed by the running update, as they were
+        # before it, to detect service interval crossings.
+        self._counters_before: Dict[str, array[float]] = {}
+        self._sync = ActivitySyncState()
+        self._backfill: BackfillState | None = None
+        self.history = WearHistoryStore(hass, entry_id)
         self._loaded = False
+        # Bikes, processed rides and sync state changed since the last write.
+        self._dirty_bikes: set[str] = set()
+        self._dirty_rides: set[int] = set()
+        self._sync_dirty = False
+        self._unsub_delayed_save: CALLBACK_TYPE | None = None
+        self._unsub_final_write: CALLBACK_TYPE | None = None
+
+    @property
+    def activity_cursor(self) -> int | None:
+        """Start timestamp of the newest ride folded into the counters."""
+        return self._sync.cursor
+
+    @property
+    def tracked_since(self) -> Dict[str, float]:
+        """When live counting of each bike began, as recorded by the backfill."""
+        if self._backfill is None:
+            return {}
+        return dict(self._backfill.tracked_since)
 
     async def async_load(self) -> None:
         """Load persisted wear counter data."""
@@ -36,90 +201,657 @@ class WearCounterManager:
             return
 
         data = await self._store.async_load() or {}
-        bikes: Dict[str, BikeWearState] = {}
-        for bike_id, persisted in data.get("bikes", {}).items():
-            last_total = persisted.get("last_total_distance_km")
-            counters = {
-                part: float(persisted.get("counters", {}).get(part, 0.0))
-                for part in WEAR_PARTS
-            }
-            bikes[bike_id] = BikeWearState(last_total, counters)
-        self._states = bikes
+        await self.history.async_load(dt_util.utcnow().timestamp())
+        self._generation = data.get("generation", 0)
+        self._slots = list(data.get("slots", []))
+        self._slot_index = {key: slot for slot, key in enumerate(self._slots)}
+        self._states = {
+            bike_id: self._bike_state_from_dict(persisted)
+            for bike_id, persisted in data.get("bikes", {}).items()
+        }
+
+        sync = data.get("activity_sync", {})
+        recent: Dict[int, StravaRide] = {}
+        for entry in sync.get("recent", []):
+            if (ride := _ride_from_list(entry)) is not None:
+                recent[ride.activity_id] = ride
+        self._sync = ActivitySyncState(
+            cursor=sync.get("cursor"), started_at=sync.get("started_at"), recent=recent
+        )
+        self._backfill = _backfill_from_dict(data.get("backfill"))
+
+        records = await self._journal.async_read(self._generation)
+        for record in records:
+            self._replay(record)
+        self._add_component_slots()
         self._loaded = True
+        if records and not self._use_journal:
+            # Fold a journal left from before the option was turned off.
+            self._dirty_bikes.update(self._states)
+            self._async_schedule_save()
+
+    def _add_component_slots(self) -> None:
+        """Give newly configured components a slot on every bike."""
+        for key in self._components:
+            if key not in self._slot_index:
+                self._slot_index[key] = len(self._slots)
+                self._slots.append(key)
+                # Journal records cannot change the slot layout, so the next
+                # write has to be the whole document.
+                self._slots_dirty = True
+        for state in self._states.values():
+            state.counters_km.extend(
+                [0.0] * (len(self._slots) - len(state.counters_km))
+            )
+        self._component_slots = [self._slot_index[key] for key in self._components]
+
+    def _new_bike_state(self) -> BikeWearState:
+        return BikeWearState(None, array("d", [0.0]) * len(self._slots))
+
+    def _bike_state_from_dict(self, persisted: Dict[str, Any]) -> BikeWearState:
+        """Restore a bike's wear state from the document or a journal record."""
+        counters = persisted.get("counters") or []
+        if isinstance(counters, dict):
+            # Journal records from before slots keyed the counters by part.
+            counters = [counters.get(key, 0.0) for key in self._slots]
+        values = array("d", (float(value) for value in counters))
+        values.extend([0.0] * (len(self._slots) - len(values)))
+        return BikeWearState(persisted.get("last_total_distance_km"), values)
+
+    def _wear_snapshot(self, state: BikeWearState) -> Dict[str, float]:
+        """Return the counters of the tracked components keyed by component."""
+        counters = state.counters_km
+        return {
+            key: counters[slot]
+            for key, slot in zip(self._components, self._component_slots)
+        }
+
+    def _replay(self, record: Dict[str, Any]) -> None:
+        """Apply one journal record on top of the loaded document."""
+        op = record.get("op")
+        if op == "bike":
+            self._states[record["id"]] = self._bike_state_from_dict(record)
+        elif op == "ride":
+            if (ride := _ride_from_list(record["ride"])) is not None:
+                self._sync.recent[ride.activity_id] = ride
+        elif op == "drop":
+            self._sync.recent.pop(record["id"], None)
+        elif op == "sync":
+            self._sync.cursor = record.get("cursor")
+            self._sync.started_at = record.get("started_at")
+            self._backfill = _backfill_from_dict(record.get("backfill"))
+
+    @property
+    def backfill_pending(self) -> bool:
+        """Return whether a started backfill has not completed yet."""
+        return self._backfill is not None and not self._backfill.complete
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Return whether there are changes that have not been written yet."""
+        return (
+            bool(self._dirty_bikes)
+            or bool(self._dirty_rides)
+            or self._sync_dirty
+            or self._slots_dirty
+        )
 
     async def async_save(self) -> None:
-        """Persist wear counter data."""
-        await self._store.async_save(
+        """Persist wear counter data immediately."""
+        self._async_cancel_delayed_save()
+        async with self._write_lock:
+            with self._metrics.measure(METRIC_STORE_SAVE):
+                if self._use_journal and not self._slots_dirty:
+                    await self._journal.async_append(self._records_to_append())
+                else:
+                    await self._async_write_document()
+        if (
+            self._use_journal
+            and self._journal.size >= JOURNAL_COMPACT_BYTES
+            and self._compaction is None
+        ):
+            self._compaction = self._hass.async_create_background_task(
+                self._async_compact(), f"{DOMAIN} wear journal compaction"
+            )
+
+    async def async_flush(self) -> None:
+        """Write pending changes now, e.g. before the entry is unloaded."""
+        if self.has_pending_changes:
+            await self.async_save()
+        if self._compaction is not None:
+            # A reloaded manager must not read the files mid-compaction.
+            await self._compaction
+        await self.history.async_flush()
+
+    async def _async_compact(self) -> None:
+        """Fold the journal into the document."""
+        try:
+            async with self._write_lock:
+                await self._async_write_document()
+        finally:
+            self._compaction = None
+
+    async def _async_write_document(self) -> None:
+        """Write the whole document as a new generation and drop the journal.
+
+        Until the journal is removed, its records name the old generation
+        and are skipped, so a crash in between loses nothing.
+        """
+        self._generation += 1
+        await self._store.async_save(self._data_to_save())
+        if self._journal.size:
+            await self._journal.async_clear()
+
+    def _records_to_append(self) -> list[Dict[str, Any]]:
+        """Return journal records for the changes since the last write."""
+        generation = self._generation
+        records: list[Dict[str, Any]] = [
             {
-                "bikes": {
-                    bike_id: {
-                        "last_total_distance_km": state.last_total_distance_km,
-                        "counters": state.counters_km,
-                    }
-                    for bike_id, state in self._states.items()
-                }
+                "g": generation,
+                "op": "bike",
+                "id": bike_id,
+                "last_total_distance_km": state.last_total_distance_km,
+                "counters": state.counters_km.tolist(),
             }
+            for bike_id in self._dirty_bikes
+            if (state := self._states.get(bike_id)) is not None
+        ]
+        for activity_id in self._dirty_rides:
+            ride = self._sync.recent.get(activity_id)
+            if ride is None:
+                records.append({"g": generation, "op": "drop", "id": activity_id})
+            else:
+                records.append(
+                    {"g": generation, "op": "ride", "ride": _ride_to_list(ride)}
+                )
+        if self._sync_dirty:
+            records.append(
+                {
+                    "g": generation,
+                    "op": "sync",
+                    "cursor": self._sync.cursor,
+                    "started_at": self._sync.started_at,
+                    "backfill": (
+                        asdict(self._backfill) if self._backfill is not None else None
+                    ),
+                }
+            )
+        self._dirty_bikes.clear()
+        self._dirty_rides.clear()
+        self._sync_dirty = False
+        return records
+
+    @callback
+    def _async_record_history(self) -> None:
+        """Sample the totals of bikes changed since the last write."""
+        self.history.async_record_totals(
+            {
+                bike_id: self._states[bike_id].last_total_distance_km
+                for bike_id in self._dirty_bikes
+                if self._states[bike_id].last_total_distance_km is not None
+            },
+            dt_util.utcnow().timestamp(),
         )
 
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Coalesce pending changes into a single delayed write.
+
+        The write is timed by this manager rather than Store.async_delay_save so
+        its duration can be measured; pending changes are still flushed when
+        Home Assistant shuts down.
+        """
+        if not self.has_pending_changes or self._unsub_delayed_save is not None:
+            return
+        self._unsub_delayed_save = async_call_later(
+            self._hass, STORAGE_SAVE_DELAY_SECONDS, self._async_delayed_save
+        )
+        if self._unsub_final_write is None:
+            self._unsub_final_write = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+            )
+
+    async def _async_delayed_save(self, _: Any) -> None:
+        self._unsub_delayed_save = None
+        if self.has_pending_changes:
+            await self.async_save()
+
+    async def _async_final_write(self, _: Event) -> None:
+        self._unsub_final_write = None
+        await self.async_flush()
+
+    @callback
+    def _async_cancel_delayed_save(self) -> None:
+        if self._unsub_delayed_save is not None:
+            self._unsub_delayed_save()
+            self._unsub_delayed_save = None
+        if self._unsub_final_write is not None:
+            self._unsub_final_write()
+            self._unsub_final_write = None
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Serialise all wear data for a write of the whole document."""
+        self._dirty_bikes.clear()
+        self._dirty_rides.clear()
+        self._sync_dirty = False
+        self._slots_dirty = False
+        return {
+            "generation": self._generation,
+            "slots": self._slots,
+            "bikes": {
+                bike_id: {
+                    "last_total_distance_km": state.last_total_distance_km,
+                    "counters": state.counters_km.tolist(),
+                }
+                for bike_id, state in self._states.items()
+            },
+            "activity_sync": {
+                "cursor": self._sync.cursor,
+                "started_at": self._sync.started_at,
+                "recent": [
+                    _ride_to_list(ride) for ride in self._sync.recent.values()
+                ],
+            },
+            "backfill": asdict(self._backfill) if self._backfill is not None else None,
+        }
+
     async def async_process_bikes(
-        self, bike_distances_km: Dict[str, float]
+        self, bike_distances_km: Dict[str, float], *, accrue: bool = True
     ) -> Dict[str, Dict[str, float]]:
-        """Update counters based on fresh bike distances and return wear data."""
+        """Update counters based on fresh bike distances and return wear data.
+
+        With ``accrue`` disabled the totals only move the per-bike baseline; this
+        is used when rides are attributed individually by activity sync.
+        """
         await self.async_load()
 
+        if accrue and self._sync.cursor is not None:
+            # Totals own the accounting, so activity sync restarts when re-enabled.
+            self._sync.cursor = None
+            self._sync.started_at = None
+            self._sync_dirty = True
+
         wear_snapshot: Dict[str, Dict[str, float]] = {}
 
         for bike_id, total_km in bike_distances_km.items():
-            state = self._states.get(
-                bike_id,
-                BikeWearState(last_total_distance_km=None, counters_km={}),
-            )
+            state = self._states.get(bike_id)
+            if state is None:
+                state = self._new_bike_state()
 
-            # Ensure counters exist for all wear parts
-            for part in WEAR_PARTS:
-                state.counters_km.setdefault(part, 0.0)
-
-            if state.last_total_distance_km is None:
+            if state.last_total_distance_km == total_km:
+                # Nothing ridden since the last refresh; leave the bike clean.
+                pass
+            elif state.last_total_distance_km is None or not accrue:
                 # First observation - treat as baseline with no accrued wear.
                 state.last_total_distance_km = total_km
+                self._dirty_bikes.add(bike_id)
             else:
                 # Strava can only increase cumulative distance, so ignore non-positive deltas.
                 delta = total_km - state.last_total_distance_km
                 if delta > 0:
-                    for part in WEAR_PARTS:
-                        state.counters_km[part] += delta
+                    self._remember_counters(bike_id, state)
+                    counters = state.counters_km
+                    for slot in self._component_slots:
+                        counters[slot] += delta
                 state.last_total_distance_km = total_km
+                self._dirty_bikes.add(bike_id)
 
             self._states[bike_id] = state
-            wear_snapshot[bike_id] = dict(state.counters_km)
+            wear_snapshot[bike_id] = self._wear_snapshot(state)
 
-        await self.async_save()
+        self._async_report_crossings()
+        self._async_record_history()
+        self._async_schedule_save()
         return wear_snapshot
 
-    async def async_reset_counter(self, bike_id: str, part: str) -> None:
-        """Reset a wear counter for a bike and persist the change."""
+    def _remember_counters(self, bike_id: str, state: BikeWearState) -> None:
+        """Keep a bike's counters from before the running update changes them."""
+        if self._alerts is not None and bike_id not in self._counters_before:
+            self._counters_before[bike_id] = array("d", state.counters_km)
+
+    @callback
+    def _async_report_crossings(self) -> None:
+        """Report counters the running update moved past their service interval.
+
+        Comparing against the values before the update, rather than each
+        ride, keeps an edited ride that is taken out and re-applied from
+        alerting twice.
+        """
+        if self._alerts is None:
+            return
+        for bike_id, before in self._counters_before.items():
+            counters = self._states[bike_id].counters_km
+            for part, threshold_km in self._alerts.thresholds_km(bike_id).items():
+                slot = self._slot_index[part]
+                if before[slot] < threshold_km <= counters[slot]:
+                    self._alerts.async_service_due(bike_id, part, counters[slot])
+        self._counters_before.clear()
+
+    async def async_start_activity_sync(self, cursor: int) -> None:
+        """Begin incremental sync at the given timestamp if not yet started."""
+        await self.async_load()
+        if self._sync.cursor is None:
+            self._sync.cursor = self._sync.started_at = cursor
+            self._sync_dirty = True
+            self._async_schedule_save()
+
+    async def async_process_activities(
+        self, rides: Iterable[StravaRide]
+    ) -> Dict[str, Dict[str, float]]:
+        """Add the weighted distance of each unseen ride to its bike's counters.
+
+        Rides that were already applied are reconciled, so an edited distance or
+        a ride moved to another bike only changes the counters by the difference.
+        Returns the wear data of every bike.
+        """
+        await self.async_load()
+
+        for ride in rides:
+            previous = self._sync.recent.get(ride.activity_id)
+            if previous is not None:
+                if previous == ride:
+                    continue
+                self._unapply_ride(previous)
+            elif (
+                self._sync.cursor is not None
+                and ride.start_ts < self._sync.cursor - ACTIVITY_SYNC_LOOKBACK_SECONDS
+            ):
+                # Rides older than the cursor's lookback were either processed or
+                # predate the sync start, so they must not be counted again.
+                continue
+            elif (
+                self._sync.started_at is not None
+                and ride.start_ts < self._sync.started_at
+            ):
+                # The totals baseline already includes the ride; remember it
+                # so a later edit or delete is reconciled against it.
+                self._sync.recent[ride.activity_id] = ride
+                self._dirty_rides.add(ride.activity_id)
+                continue
+
+            self._apply_ride(ride)
+            if self._sync.cursor is None or ride.start_ts > self._sync.cursor:
+                self._sync.cursor = ride.start_ts
+                self._sync_dirty = True
+
+        self._prune_recent()
+        self._async_report_crossings()
+        self._async_record_history()
+        self._async_schedule_save()
+        return self._all_wear_snapshots()
+
+    async def async_remove_activity(self, activity_id: int) -> str | None:
+        """Take a deleted ride back out of its bike and return the bike id."""
+        await self.async_load()
+        ride = self._sync.recent.get(activity_id)
+        if ride is None:
+            return None
+        self._unapply_ride(ride)
+        self._async_report_crossings()
+        self._async_record_history()
+        self._async_schedule_save()
+        return ride.gear_id
+
+    def activity_gear_id(self, activity_id: int) -> str | None:
+        """Return the bike a recently processed ride was attributed to."""
+        ride = self._sync.recent.get(activity_id)
+        return ride.gear_id if ride is not None else None
+
+    def _apply_ride(self, ride: StravaRide) -> None:
+        state = self._states.get(ride.gear_id)
+        if state is None:
+            state = self._states[ride.gear_id] = self._new_bike_state()
+        self._remember_counters(ride.gear_id, state)
+        for part, wear_km in self._weighting.part_distances_km(ride).items():
+            state.counters_km[self._slot_index[part]] += wear_km
+        # Keep the baseline in step so the next totals diff does not count it again.
+        if state.last_total_distance_km is not None:
+            state.last_total_distance_km += ride.distance_km
+        self._sync.recent[ride.activity_id] = ride
+        self._dirty_bikes.add(ride.gear_id)
+        self._dirty_rides.add(ride.activity_id)
+
+    def _unapply_ride(self, ride: StravaRide) -> None:
+        self._sync.recent.pop(ride.activity_id, None)
+        self._dirty_rides.add(ride.activity_id)
+        state = self._states.get(ride.gear_id)
+        if state is None:
+            return
+        self._dirty_bikes.add(ride.gear_id)
+        self._remember_counters(ride.gear_id, state)
+        for part, wear_km in self._weighting.part_distances_km(ride).items():
+            # A reset after the ride may already have cleared part of it.
+            slot = self._slot_index[part]
+            state.counters_km[slot] = max(state.counters_km[slot] - wear_km, 0.0)
+        if state.last_total_distance_km is not None:
+            state.last_total_distance_km -= ride.distance_km
+
+    def _prune_recent(self) -> None:
+        """Bound the processed-ride index to the lookback window or its size cap."""
+        recent = self._sync.recent
+        if self._sync.cursor is not None:
+            horizon = self._sync.cursor - ACTIVITY_SYNC_LOOKBACK_SECONDS
+            recent = {
+                activity_id: ride
+                for activity_id, ride in recent.items()
+                if ride.start_ts >= horizon
+            }
+        if len(recent) > ACTIVITY_INDEX_MAX_SIZE:
+            newest = sorted(recent.values(), key=lambda ride: ride.start_ts)[
+                -ACTIVITY_INDEX_MAX_SIZE:
+            ]
+            recent = {ride.activity_id: ride for ride in newest}
+        self._dirty_rides.update(self._sync.recent.keys() - recent.keys())
+        self._sync.recent = recent
+
+    async def async_begin_backfill(self) -> int | None:
+        """Return the timestamp the backfill continues from, inclusive.
+
+        The first call checkpoints the current totals; None means the backfill
+        already completed.
+        """
+        await self.async_load()
+        if self._backfill is None:
+            self._start_backfill(rerun=False)
+        if self._backfill.complete:
+            return None
+        return self._backfill.before
+
+    async def async_restart_backfill(self) -> None:
+        """Start a completed backfill over, e.g. after rides moved to another bike.
+
+        The first run already added the older rides to the counters, so a
+        rerun only rebuilds the odometer history.
+        """
+        await self.async_load()
+        if self._backfill is not None and self._backfill.complete:
+            self._start_backfill(rerun=True)
+
+    def _start_backfill(self, rerun: bool) -> None:
+        """Checkpoint the current totals as the start of a new backfill."""
+        now = int(dt_util.utcnow().timestamp())
+        previous = self._backfill
+        backfill = BackfillState(before=now, count_wear=not rerun)
+        for bike_id, state in self._states.items():
+            if state.last_total_distance_km is None:
+                continue
+            backfill.remaining_km[bike_id] = state.last_total_distance_km
+            if previous is not None and bike_id in previous.tracked_since:
+                backfill.tracked_since[bike_id] = previous.tracked_since[bike_id]
+                continue
+            if rerun:
+                # The history already reaches back past when tracking began.
+                continue
+            history = self.history.get(bike_id)
+            backfill.tracked_since[bike_id] = (
+                history.timestamps[0]
+                if history is not None and history.timestamps
+                else now
+            )
+        if rerun:
+            # Samples of rides that moved bikes would otherwise stay behind.
+            self.history.async_drop_samples_before(now)
+        self._backfill = backfill
+        self._sync_dirty = True
+        self._async_schedule_save()
+
+    async def async_process_backfill(self, rides: Iterable[StravaRide]) -> None:
+        """Fold a page of older rides into history and counters.
+
+        Each ride becomes an odometer sample. Rides from before a bike was
+        tracked are also added to the counters of parts reset before the ride;
+        parts without a known reset keep counting from when tracking began.
+        The oldest ride is checkpointed as where the next page continues.
+        """
         await self.async_load()
+        backfill = self._backfill
+        if backfill is None or backfill.complete:
+            return
+
+        samples: Dict[str, list[tuple[float, float]]] = {}
+        last_resets: Dict[str, Dict[str, float]] = {}
+        boundary_ids = set(backfill.boundary_ids)
+        for ride in sorted(rides, key=lambda ride: ride.start_ts, reverse=True):
+            if ride.start_ts > backfill.before or ride.activity_id in boundary_ids:
+                continue
+            if ride.start_ts < backfill.before:
+                backfill.before = ride.start_ts
+                boundary_ids.clear()
+            boundary_ids.add(ride.activity_id)
+
+            remaining_km = backfill.remaining_km.get(ride.gear_id)
+            if remaining_km is None:
+                continue
+            samples.setdefault(ride.gear_id, []).append((ride.start_ts, remaining_km))
+            backfill.remaining_km[ride.gear_id] = max(
+                remaining_km - ride.distance_km, 0.0
+            )
 
-        if part not in WEAR_PARTS:
-            raise ValueError(f"Unknown wear part '{part}'")
+            if (
+                not backfill.count_wear
+                or ride.start_ts >= backfill.tracked_since[ride.gear_id]
+                or ride.activity_id in self._sync.recent
+            ):
+                continue
+            if ride.gear_id not in last_resets:
+                resets: Dict[str, float] = {}
+                for timestamp, part in self.history.resets(ride.gear_id):
+                    resets[part] = timestamp
+                last_resets[ride.gear_id] = resets
+            state = self._states[ride.gear_id]
+            wear_km = self._weighting.part_distances_km(ride)
+            for part, reset_ts in last_resets[ride.gear_id].items():
+                if reset_ts <= ride.start_ts and part in wear_km:
+                    self._remember_counters(ride.gear_id, state)
+                    state.counters_km[self._slot_index[part]] += wear_km[part]
+                    self._dirty_bikes.add(ride.gear_id)
 
-        state = self._states.setdefault(
-            bike_id,
-            BikeWearState(last_total_distance_km=None, counters_km={}),
+        for bike_id, bike_samples in samples.items():
+            self.history.async_record_samples(bike_id, bike_samples)
+        self._async_report_crossings()
+        backfill.boundary_ids = sorted(boundary_ids)
+        self._sync_dirty = True
+        self._async_schedule_save()
+
+    async def async_finish_backfill(self) -> None:
+        """Mark the backfill complete and drop its per-bike checkpoint.
+
+        When tracking began is kept as the baseline of imported wear history.
+        """
+        await self.async_load()
+        if self._backfill is None:
+            return
+        self._backfill = BackfillState(
+            before=self._backfill.before,
+            tracked_since=self._backfill.tracked_since,
+            complete=True,
         )
-        state.counters_km.setdefault(part, 0.0)
-        state.counters_km[part] = 0.0
+        self._sync_dirty = True
+        self._async_schedule_save()
 
-        self._states[bike_id] = state
-        await self.async_save()
+    async def async_get_total_distances(self) -> Dict[str, float]:
+        """Return the last known cumulative distance of every tracked bike."""
+        await self.async_load()
+        return {
+            bike_id: state.last_total_distance_km
+            for bike_id, state in self._states.items()
+            if state.last_total_distance_km is not None
+        }
+
+    async def async_get_all_wear_snapshots(self) -> Dict[str, Dict[str, float]]:
+        """Return the current wear counters of every tracked bike."""
+        await self.async_load()
+        return self._all_wear_snapshots()
+
+    def _all_wear_snapshots(self) -> Dict[str, Dict[str, float]]:
+        """Return the counters of every tracked bike."""
+        return {
+            bike_id: self._wear_snapshot(state)
+            for bike_id, state in self._states.items()
+        }
+
+    async def async_reset_counter(
+        self, bike_id: str, part: str, serviced_at: float | None = None
+    ) -> None:
+        """Reset a wear counter for a bike and schedule the write."""
+        await self.async_reset_counters([(bike_id, part)], serviced_at)
+
+    async def async_reset_counters(
+        self, resets: Iterable[tuple[str, str]], serviced_at: float | None = None
+    ) -> None:
+        """Reset several (bike, part) counters with a single scheduled write.
+
+        With ``serviced_at`` (epoch seconds) each counter is set to the distance
+        ridden since then, looked up in the bike's odometer history.
+        """
+        await self.async_load()
+
+        resets = list(resets)
+        for _, part in resets:
+            if part not in self._components:
+                raise ValueError(f"Unknown wear part '{part}'")
+
+        now = dt_util.utcnow().timestamp()
+        if serviced_at is not None and serviced_at > now:
+            raise ValueError("The service date cannot be in the future")
+
+        for bike_id, part in resets:
+            state = self._states.get(bike_id)
+            if state is None:
+                state = self._states[bike_id] = self._new_bike_state()
+            state.counters_km[self._slot_index[part]] = (
+                0.0
+                if serviced_at is None
+                else self._distance_since(bike_id, serviced_at)
+            )
+            self._dirty_bikes.add(bike_id)
+            self.history.async_record_reset(
+                bike_id, part, now if serviced_at is None else serviced_at
+            )
+            if self._alerts is not None:
+                self._alerts.async_reset(bike_id, part)
+
+        self._async_schedule_save()
+
+    def _distance_since(self, bike_id: str, timestamp: float) -> float:
+        """Return the distance a bike covered since the timestamp.
+
+        Dates before the recorded history count from its first sample, so the
+        result then covers only the tracked part of the period.
+        """
+        total_km = self._states[bike_id].last_total_distance_km
+        history = self.history.get(bike_id)
+        if total_km is None or history is None or not history.totals_km:
+            return 0.0
+        total_then = history.total_at(timestamp)
+        if total_then is None:
+            total_then = history.totals_km[0]
+        return max(total_km - total_then, 0.0)
 
     async def async_get_wear_snapshot(self, bike_id: str) -> Dict[str, float]:
         """Return the current wear counters for a bike."""
         await self.async_load()
-        state = self._states.get(
-            bike_id,
-            BikeWearState(last_total_distance_km=None, counters_km={}),
-        )
-        for part in WEAR_PARTS:
-            state.counters_km.setdefault(part, 0.0)
-        return dict(state.counters_km)
+        state = self._states.get(bike_id)
+        if state is None:
+            return dict.fromkeys(self._components, 0.0)
+        return self._wear_snapshot(state)
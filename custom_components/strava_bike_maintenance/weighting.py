@@ -0,0 +1,71 @@
+"""Ride-dependent wear weighting for Strava Bike Maintenance."""
+
+from __future__ import annotations
+
+from typing import Dict, Mapping, Sequence
+
+from .api import StravaRide
+from .const import DEFAULT_COMPONENTS
+
+
+def parse_sport_type_factors(value: str) -> Dict[str, float]:
+    """Parse "GravelRide: 1.5, MountainBikeRide: 2" into a factor per sport type.
+
+    Raises ValueError for malformed entries or non-positive factors.
+    """
+    factors: Dict[str, float] = {}
+    for item in value.replace("\n", ",").split(","):
+        if not item.strip():
+            continue
+        sport_type, separator, factor_text = item.partition(":")
+        sport_type = sport_type.strip()
+        if not separator or not sport_type:
+            raise ValueError(f"Expected '<sport type>: <factor>', got '{item.strip()}'")
+        factor = float(factor_text)
+        if factor <= 0:
+            raise ValueError(f"Factor for '{sport_type}' must be positive")
+        factors[sport_type] = factor
+    return factors
+
+
+class WearWeighting:
+    """Turns a ride into the wear it puts on each part, in kilometres.
+
+    A ride's distance is scaled by a per-part factor for its sport type, and
+    climbing adds a fixed number of kilometres per 1000 m of elevation gain.
+    With no factors and no climbing weight every part wears by the distance.
+    """
+
+    def __init__(
+        self,
+        sport_type_factors: Mapping[str, Mapping[str, float]] | None = None,
+        climbing_km_per_1000m: float = 0.0,
+        parts: Sequence[str] = DEFAULT_COMPONENTS,
+    ) -> None:
+        self._parts = tuple(parts)
+        # Part -> sport type -> factor; unlisted sport types count once.
+        self._sport_type_factors = {
+            part: dict(factors)
+            for part, factors in (sport_type_factors or {}).items()
+            if factors
+        }
+        self._climbing_km_per_1000m = climbing_km_per_1000m
+
+    @property
+    def is_uniform(self) -> bool:
+        """Return whether every part simply wears by the ridden distance."""
+        return not self._sport_type_factors and not self._climbing_km_per_1000m
+
+    def part_distances_km(self, ride: StravaRide) -> Dict[str, float]:
+        """Return the weighted wear of one ride for every part."""
+        climbing_km = ride.elevation_gain_m / 1000 * self._climbing_km_per_1000m
+        wear: Dict[str, float] = {}
+        for part in self._parts:
+            factors = self._sport_type_factors.get(part)
+            factor = (
+                factors.get(ride.sport_type, 1.0)
+                if factors is not None and ride.sport_type is not None
+                else 1.0
+            )
+            wear[part] = ride.distance_km * factor + climbing_km
+        return wear
@@ -0,0 +1 @@
+"""Tests for the Strava Bike Maintenance integration."""
@@ -0,0 +1,110 @@
+"""Tests for the Strava Bike Maintenance circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import patch
+
+from aiohttp import ClientResponseError, RequestInfo
+import pytest
+from yarl import URL
+
+from custom_components.strava_bike_maintenance import breaker
+from custom_components.strava_bike_maintenance.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    StravaCircuitOpenError,
+)
+from custom_components.strava_bike_maintenance.const import (
+    CIRCUIT_BACKOFF_SECONDS,
+    CIRCUIT_FAILURE_THRESHOLD,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the breaker's clock and take the jitter out of its backoff."""
+    fake = FakeClock()
+    with patch.object(breaker.time, "monotonic", fake), patch.object(
+        breaker.random, "uniform", lambda low, high: high
+    ):
+        yield fake
+
+
+def _response_error(status: HTTPStatus) -> ClientResponseError:
+    request_info = RequestInfo(URL("https://www.strava.com/api/v3"), "GET", {})
+    return ClientResponseError(request_info, (), status=status)
+
+
+def test_opens_after_repeated_failures(clock: FakeClock) -> None:
+    """Consecutive outage failures open the circuit and refuse requests."""
+    circuit = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        assert not circuit.record_failure(asyncio.TimeoutError())
+    assert circuit.state == STATE_CLOSED
+
+    assert circuit.record_failure(asyncio.TimeoutError())
+    assert circuit.state == STATE_OPEN
+    assert circuit.retry_after() == CIRCUIT_BACKOFF_SECONDS
+    with pytest.raises(StravaCircuitOpenError):
+        circuit.before_request()
+
+
+def test_request_errors_do_not_count(clock: FakeClock) -> None:
+    """Errors specific to one request say nothing about Strava's health."""
+    circuit = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        circuit.record_failure(_response_error(HTTPStatus.NOT_FOUND))
+    assert circuit.state == STATE_CLOSED
+
+
+def test_auth_failure_opens_immediately(clock: FakeClock) -> None:
+    """A rejected token opens the circuit on the first failure."""
+    circuit = CircuitBreaker()
+    assert circuit.record_failure(_response_error(HTTPStatus.UNAUTHORIZED))
+    assert circuit.state == STATE_OPEN
+
+
+def test_half_open_probe_closes(clock: FakeClock) -> None:
+    """After the backoff a single probe is let through; success closes."""
+    circuit = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        circuit.record_failure(asyncio.TimeoutError())
+
+    clock.now += CIRCUIT_BACKOFF_SECONDS
+    assert circuit.state == STATE_HALF_OPEN
+    circuit.before_request()
+    # Only one probe at a time.
+    with pytest.raises(StravaCircuitOpenError):
+        circuit.before_request()
+
+    circuit.record_success()
+    assert circuit.state == STATE_CLOSED
+    circuit.before_request()
+
+
+def test_failed_probe_reopens_longer(clock: FakeClock) -> None:
+    """A failed probe reopens the circuit for twice the backoff."""
+    circuit = CircuitBreaker()
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        circuit.record_failure(asyncio.TimeoutError())
+    clock.now += CIRCUIT_BACKOFF_SECONDS
+    circuit.before_request()
+
+    circuit.record_failure(asyncio.TimeoutError())
+
+    assert circuit.state == STATE_OPEN
+    assert circuit.retry_after() == 2 * CIRCUIT_BACKOFF_SECONDS
@@ -0,0 +1,87 @@
+"""Tests for the Strava Bike Maintenance options flow."""
+
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.strava_bike_maintenance.const import (
+    CONF_BIKE_COMPONENTS_PREFIX,
+    CONF_CLIMBING_KM_PER_1000M,
+    CONF_FLEET_PART_SENSORS,
+    CONF_SENSOR_MODE,
+    DEFAULT_COMPONENTS,
+    DOMAIN,
+    SENSOR_MODE_FLEET,
+)
+
+
+def _add_entry(
+    hass: HomeAssistant,
+    bikes: dict[str, dict] | None = None,
+    options: dict | None = None,
+):
+    entry = MockConfigEntry(
+        domain=DOMAIN, unique_id="1", data={}, options=options or {}
+    )
+    entry.add_to_hass(hass)
+    if bikes is not None:
+        coordinator = SimpleNamespace(data=bikes)
+        hass.data.setdefault(DOMAIN, {}).setdefault("entries", {})[
+            entry.entry_id
+        ] = {"coordinator": coordinator}
+    return entry
+
+
+async def test_options_flow_builds_every_step(hass: HomeAssistant) -> None:
+    """Each options step renders its form and the flow stores the options."""
+    entry = _add_entry(hass, {"b1": {"name": "Road"}, "b2": {"name": "Gravel"}})
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+    assert CONF_CLIMBING_KM_PER_1000M in result["data_schema"].schema
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {CONF_SENSOR_MODE: SENSOR_MODE_FLEET, CONF_CLIMBING_KM_PER_1000M: 12.5},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "components"
+    assert CONF_FLEET_PART_SENSORS in result["data_schema"].schema
+
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "bikes"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            f"{CONF_BIKE_COMPONENTS_PREFIX}b1": DEFAULT_COMPONENTS,
+            f"{CONF_BIKE_COMPONENTS_PREFIX}b2": DEFAULT_COMPONENTS[:1],
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_CLIMBING_KM_PER_1000M] == 12.5
+    assert f"{CONF_BIKE_COMPONENTS_PREFIX}b1" not in entry.options
+    assert entry.options[f"{CONF_BIKE_COMPONENTS_PREFIX}b2"] == DEFAULT_COMPONENTS[:1]
+
+
+async def test_options_flow_skips_bikes_without_coordinator(
+    hass: HomeAssistant,
+) -> None:
+    """Without known bikes the flow finishes after the components step."""
+    assignment = {f"{CONF_BIKE_COMPONENTS_PREFIX}b1": DEFAULT_COMPONENTS[:1]}
+    entry = _add_entry(hass, options=assignment)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {})
+    assert result["step_id"] == "components"
+    assert CONF_FLEET_PART_SENSORS not in result["data_schema"].schema
+
+    result = await hass.config_entries.options.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_CLIMBING_KM_PER_1000M] == 0.0
+    # Assignments of bikes the flow could not show are kept.
+    assert entry.options[f"{CONF_BIKE_COMPONENTS_PREFIX}b1"] == DEFAULT_COMPONENTS[:1]
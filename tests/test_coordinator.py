@@ -0,0 +1,84 @@
+"""Tests for the Strava Bike Maintenance data coordinator."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.strava_bike_maintenance.breaker import CircuitBreaker
+from custom_components.strava_bike_maintenance.components import ComponentRegistry
+from custom_components.strava_bike_maintenance.const import SYNC_MODE_ACTIVITIES
+from custom_components.strava_bike_maintenance.coordinator import (
+    StravaDataUpdateCoordinator,
+)
+from custom_components.strava_bike_maintenance.metrics import RefreshMetrics
+from custom_components.strava_bike_maintenance.scheduler import (
+    AdaptivePollScheduler,
+)
+from custom_components.strava_bike_maintenance.wear import WearCounterManager
+
+
+class FakeApiClient:
+    """Serves prepared /athlete and activity payloads instead of Strava."""
+
+    def __init__(self, bike_distance_m: float) -> None:
+        self.breaker = CircuitBreaker()
+        self.bike_distance_m = bike_distance_m
+        self.activities: List[Dict[str, Any]] = []
+
+    async def async_get_bikes_if_modified(
+        self, etag: str | None
+    ) -> tuple[Dict[str, Any], None]:
+        return {
+            "id": 1,
+            "bikes": [{"id": "b1", "name": "Road", "distance": self.bike_distance_m}],
+            "shoes": [],
+        }, None
+
+    async def async_get_activities_since(self, after: int) -> List[Dict[str, Any]]:
+        return self.activities
+
+
+def _activity(activity_id: int, start_ts: int, distance_m: float) -> Dict[str, Any]:
+    return {
+        "id": activity_id,
+        "gear_id": "b1",
+        "distance": distance_m,
+        "start_date": dt_util.utc_from_timestamp(start_ts).isoformat(),
+        "sport_type": "Ride",
+    }
+
+
+async def test_rebaseline_counts_new_ride_once(hass: HomeAssistant) -> None:
+    """A ride already in the re-read /athlete total is not added to it again."""
+    api_client = FakeApiClient(100_000)
+    metrics = RefreshMetrics()
+    wear_manager = WearCounterManager(hass, "entry", metrics)
+    coordinator = StravaDataUpdateCoordinator(
+        hass,
+        "entry",
+        api_client,  # type: ignore[arg-type]
+        wear_manager,
+        AdaptivePollScheduler(),
+        metrics,
+        ComponentRegistry.from_options({}),
+        sync_mode=SYNC_MODE_ACTIVITIES,
+    )
+    coordinator.data = await coordinator._async_update_data()
+    assert coordinator.data["b1"]["distance_km"] == 100.0
+
+    # A 20 km ride was uploaded while Home Assistant was down; after the
+    # restart both the /athlete total and the activity list include it.
+    api_client.bike_distance_m = 120_000
+    api_client.activities = [
+        _activity(1, wear_manager.activity_cursor + 60, 20_000)
+    ]
+    coordinator._athlete_fetched_at = None
+
+    data = await coordinator._async_update_data()
+
+    assert data["b1"]["distance_km"] == 120.0
+    assert data["b1"]["wear_counters"]["chain"] == 20.0
+    await wear_manager.async_flush()
@@ -0,0 +1,74 @@
+"""Tests for the Strava Bike Maintenance wear history."""
+
+from __future__ import annotations
+
+from custom_components.strava_bike_maintenance.const import (
+    HISTORY_FULL_RESOLUTION_SECONDS,
+    HISTORY_RETENTION_SECONDS,
+)
+from custom_components.strava_bike_maintenance.history import DAY_SECONDS, BikeHistory
+
+NOW = 2_000_000_000.0
+
+
+def test_total_at() -> None:
+    """Lookups return the last total at or before the timestamp."""
+    history = BikeHistory()
+    history.add_sample(100.0, 10.0)
+    history.add_sample(300.0, 30.0)
+    # Out-of-order samples, e.g. from a backfill, are inserted in place.
+    history.add_sample(200.0, 20.0)
+
+    assert history.total_at(50.0) is None
+    assert history.total_at(100.0) == 10.0
+    assert history.total_at(250.0) == 20.0
+    assert history.total_at(1000.0) == 30.0
+
+
+def test_add_sample_skips_duplicates() -> None:
+    """Unchanged totals and already sampled timestamps add nothing."""
+    history = BikeHistory()
+
+    assert history.add_sample(100.0, 10.0)
+    assert not history.add_sample(200.0, 10.0)
+    assert history.add_sample(300.0, 20.0)
+    assert not history.add_sample(100.0, 5.0)
+    assert list(history.timestamps) == [100.0, 300.0]
+
+
+def test_compact() -> None:
+    """Old samples are thinned to one per day and expired ones dropped."""
+    history = BikeHistory()
+    expired = NOW - HISTORY_RETENTION_SECONDS - DAY_SECONDS
+    old_day = (NOW - HISTORY_FULL_RESOLUTION_SECONDS - 10 * DAY_SECONDS) // DAY_SECONDS
+    old_morning = old_day * DAY_SECONDS + 3600
+    recent = NOW - DAY_SECONDS
+    history.add_sample(expired, 1.0)
+    history.add_sample(old_morning, 2.0)
+    history.add_sample(old_morning + 3600, 3.0)
+    history.add_sample(recent, 4.0)
+    history.add_sample(recent + 60, 5.0)
+    history.add_reset(expired, 0)
+    history.add_reset(recent, 0)
+
+    history.compact(NOW)
+
+    assert list(history.timestamps) == [old_morning + 3600, recent, recent + 60]
+    assert list(history.totals_km) == [3.0, 4.0, 5.0]
+    assert list(history.reset_timestamps) == [recent]
+
+
+def test_round_trip() -> None:
+    """Serialised arrays decode to the same values."""
+    history = BikeHistory()
+    history.add_sample(100.5, 12.25)
+    history.add_sample(200.5, 24.75)
+    history.add_reset(150.0, 3)
+
+    restored = BikeHistory.from_dict(history.as_dict())
+
+    assert restored.timestamps == history.timestamps
+    assert restored.totals_km == history.totals_km
+    assert restored.reset_timestamps == history.reset_timestamps
+    assert restored.reset_parts == history.reset_parts
+    assert BikeHistory.from_dict({}).timestamps.tolist() == []
@@ -0,0 +1,125 @@
+"""Tests for the Strava Bike Maintenance wear journal and document migration."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+import pytest
+
+from custom_components.strava_bike_maintenance.const import (
+    STORAGE_KEY,
+    STORAGE_VERSION,
+)
+from custom_components.strava_bike_maintenance.journal import (
+    LEGACY_PARTS,
+    WearJournal,
+    WearStore,
+)
+from custom_components.strava_bike_maintenance.wear import WearCounterManager
+
+
+@pytest.fixture(autouse=True)
+def config_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Keep journal files in a per-test directory."""
+    hass.config.config_dir = str(tmp_path)
+    return tmp_path
+
+
+async def test_torn_final_record_dropped(hass: HomeAssistant) -> None:
+    """A record cut short by a crash is dropped and cut off the file."""
+    journal = WearJournal(hass, "test")
+    await journal.async_append([{"g": 0, "n": 1}, {"g": 0, "n": 2}])
+    complete_size = journal.size
+    with open(hass.config.path(".storage", "test.journal"), "a") as file:
+        file.write('{"g":0,"n":')
+
+    records = await journal.async_read(0)
+
+    assert records == [{"g": 0, "n": 1}, {"g": 0, "n": 2}]
+    assert journal.size == complete_size
+    assert os.path.getsize(hass.config.path(".storage", "test.journal")) == (
+        complete_size
+    )
+    # Later appends start on a fresh line.
+    await journal.async_append([{"g": 0, "n": 3}])
+    assert [record["n"] for record in await journal.async_read(0)] == [1, 2, 3]
+
+
+async def test_records_of_other_generations_skipped(hass: HomeAssistant) -> None:
+    """Only records written against the loaded generation are replayed."""
+    journal = WearJournal(hass, "test")
+    await journal.async_append([{"g": 1, "n": 1}, {"g": 2, "n": 2}])
+
+    assert await journal.async_read(2) == [{"g": 2, "n": 2}]
+
+
+async def test_compaction_skips_leftover_records(hass: HomeAssistant) -> None:
+    """Records left behind by a crash during compaction are not replayed."""
+    manager = WearCounterManager(hass, "entry", journal=True)
+    await manager.async_process_bikes({"b1": 100.0})
+    await manager.async_save()
+    await manager.async_process_bikes({"b1": 110.0})
+    await manager.async_save()
+    await manager.async_process_bikes({"b1": 120.0})
+
+    # The document of the next generation is written, but the journal of the
+    # previous one is never removed.
+    with patch.object(WearJournal, "async_clear", AsyncMock()):
+        await manager._async_compact()
+
+    reloaded = WearCounterManager(hass, "entry", journal=True)
+    assert (await reloaded.async_get_wear_snapshot("b1"))["chain"] == 20.0
+    assert (await reloaded.async_get_total_distances())["b1"] == 120.0
+    # Cancels the delayed write the last update scheduled.
+    await manager.async_save()
+
+
+def _stored(version: int, data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "version": version,
+        "minor_version": 1,
+        "key": f"{STORAGE_KEY}.entry",
+        "data": data,
+    }
+
+
+@pytest.mark.parametrize("version", [1, 2])
+async def test_migrate_to_slots(
+    hass: HomeAssistant, hass_storage: dict[str, Any], version: int
+) -> None:
+    """Version 1 and 2 documents load with counters in the legacy slots."""
+    data: dict[str, Any] = {
+        "bikes": {
+            "b1": {
+                "counters": {"chain": 12.5, "tires": 40.0},
+                "last_total_distance_km": 100.0,
+            }
+        }
+    }
+    if version == 2:
+        data["generation"] = 4
+    hass_storage[f"{STORAGE_KEY}.entry"] = _stored(version, data)
+
+    migrated = await WearStore(
+        hass, STORAGE_VERSION, f"{STORAGE_KEY}.entry"
+    ).async_load()
+
+    assert migrated["generation"] == (0 if version == 1 else 4)
+    assert migrated["slots"] == list(LEGACY_PARTS)
+    assert migrated["bikes"]["b1"]["counters"] == [12.5, 0.0, 40.0]
+    assert migrated["bikes"]["b1"]["last_total_distance_km"] == 100.0
+
+
+async def test_newer_version_refused(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """A document written by a newer release is not silently misread."""
+    hass_storage[f"{STORAGE_KEY}.entry"] = _stored(STORAGE_VERSION + 1, {})
+
+    with pytest.raises(HomeAssistantError):
+        await WearStore(hass, STORAGE_VERSION, f"{STORAGE_KEY}.entry").async_load()
@@ -0,0 +1,184 @@
+"""Tests for the Strava Bike Maintenance push subscription."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import json
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+from yarl import URL
+
+from custom_components.strava_bike_maintenance import async_remove_entry
+from custom_components.strava_bike_maintenance.const import (
+    API_PUSH_SUBSCRIPTIONS_URL,
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_PUSH_UPDATES,
+    CONF_VERIFY_TOKEN,
+    DOMAIN,
+)
+from custom_components.strava_bike_maintenance.push import (
+    StravaPushHandler,
+    StravaPushTarget,
+)
+
+ATHLETE_ID = 42
+
+
+def _handler(hass: HomeAssistant, coordinator: Any = None) -> StravaPushHandler:
+    target = StravaPushTarget(coordinator, MagicMock())
+    return StravaPushHandler(
+        hass,
+        "secret-token",
+        lambda owner_id: target if owner_id == ATHLETE_ID else None,
+    )
+
+
+def _get_request(query: Dict[str, str]) -> MagicMock:
+    return MagicMock(method="GET", query=query)
+
+
+def _post_request(payload: Dict[str, Any]) -> MagicMock:
+    return MagicMock(method="POST", json=AsyncMock(return_value=payload))
+
+
+async def test_challenge_echoed(hass: HomeAssistant) -> None:
+    """Strava's validation request gets its challenge back."""
+    response = await _handler(hass).async_handle_webhook(
+        hass,
+        "hook",
+        _get_request(
+            {
+                "hub.mode": "subscribe",
+                "hub.verify_token": "secret-token",
+                "hub.challenge": "abc123",
+            }
+        ),
+    )
+
+    assert response.status == HTTPStatus.OK
+    assert json.loads(response.body) == {"hub.challenge": "abc123"}
+
+
+async def test_challenge_with_wrong_token_refused(hass: HomeAssistant) -> None:
+    """A validation request with another verify token is refused."""
+    response = await _handler(hass).async_handle_webhook(
+        hass,
+        "hook",
+        _get_request(
+            {
+                "hub.mode": "subscribe",
+                "hub.verify_token": "other-token",
+                "hub.challenge": "abc123",
+            }
+        ),
+    )
+
+    assert response.status == HTTPStatus.FORBIDDEN
+
+
+async def test_activity_events_reach_coordinator(hass: HomeAssistant) -> None:
+    """Created, updated and deleted activities are forwarded by aspect."""
+    coordinator = MagicMock(async_handle_activity_event=AsyncMock())
+    handler = _handler(hass, coordinator)
+
+    for activity_id, aspect_type in ((1, "create"), (2, "update"), (3, "delete")):
+        response = await handler.async_handle_webhook(
+            hass,
+            "hook",
+            _post_request(
+                {
+                    "object_type": "activity",
+                    "object_id": activity_id,
+                    "aspect_type": aspect_type,
+                    "owner_id": ATHLETE_ID,
+                }
+            ),
+        )
+        assert response.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+
+    calls = coordinator.async_handle_activity_event.mock_calls
+    assert [call.args for call in calls] == [
+        (1, "create"),
+        (2, "update"),
+        (3, "delete"),
+    ]
+
+
+async def test_other_events_not_forwarded(hass: HomeAssistant) -> None:
+    """Malformed bodies and events of unknown athletes are not forwarded."""
+    coordinator = MagicMock(async_handle_activity_event=AsyncMock())
+    handler = _handler(hass, coordinator)
+
+    malformed = await handler.async_handle_webhook(
+        hass, "hook", _post_request({"object_type": "activity"})
+    )
+    await handler.async_handle_webhook(
+        hass,
+        "hook",
+        _post_request(
+            {
+                "object_type": "activity",
+                "object_id": 1,
+                "aspect_type": "create",
+                "owner_id": ATHLETE_ID + 1,
+            }
+        ),
+    )
+    await hass.async_block_till_done()
+
+    assert malformed.status == HTTPStatus.BAD_REQUEST
+    coordinator.async_handle_activity_event.assert_not_called()
+
+
+async def test_remove_entry_moves_subscription(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Removing the entry owning the subscription hands it to another entry."""
+    hass.config.external_url = "https://example.com"
+    credentials = {CONF_CLIENT_ID: "app", CONF_CLIENT_SECRET: "app-secret"}
+    removed = MockConfigEntry(
+        domain=DOMAIN,
+        data={**credentials, CONF_WEBHOOK_ID: "old", CONF_VERIFY_TOKEN: "t1"},
+        options={CONF_PUSH_UPDATES: True},
+    )
+    remaining = MockConfigEntry(
+        domain=DOMAIN,
+        data={**credentials, CONF_WEBHOOK_ID: "new", CONF_VERIFY_TOKEN: "t2"},
+        options={CONF_PUSH_UPDATES: True},
+    )
+    removed.add_to_hass(hass)
+    remaining.add_to_hass(hass)
+    hass.data[DOMAIN] = {"entries": {remaining.entry_id: {}}}
+    subscriptions = [
+        {"id": 7, "callback_url": webhook.async_generate_url(hass, "old")}
+    ]
+
+    async def _list(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        return AiohttpClientMockResponse(method, url, json=list(subscriptions))
+
+    async def _delete(method: str, url: URL, data: Any) -> AiohttpClientMockResponse:
+        subscriptions.clear()
+        return AiohttpClientMockResponse(method, url)
+
+    aioclient_mock.get(API_PUSH_SUBSCRIPTIONS_URL, side_effect=_list)
+    aioclient_mock.delete(f"{API_PUSH_SUBSCRIPTIONS_URL}/7", side_effect=_delete)
+    aioclient_mock.post(API_PUSH_SUBSCRIPTIONS_URL, json={"id": 8})
+
+    await async_remove_entry(hass, removed)
+
+    assert not subscriptions
+    method, _, data, _ = aioclient_mock.mock_calls[-1]
+    assert method == "POST"
+    assert data["callback_url"] == webhook.async_generate_url(hass, "new")
+    assert data["verify_token"] == "t2"
@@ -0,0 +1,72 @@
+"""Tests for the Strava Bike Maintenance poll scheduler."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.strava_bike_maintenance import scheduler as scheduler_module
+from custom_components.strava_bike_maintenance.const import (
+    MAX_UPDATE_INTERVAL_SECONDS,
+    RATE_LIMIT_BACKOFF_SECONDS,
+    UPDATE_INTERVAL_SECONDS,
+)
+from custom_components.strava_bike_maintenance.scheduler import (
+    AdaptivePollScheduler,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_jitter():
+    """Take the upper bound of every jittered delay."""
+    with patch.object(scheduler_module.random, "uniform", lambda low, high: high):
+        yield
+
+
+def test_backoff_after_rate_limit() -> None:
+    """Each consecutive 429 doubles the wait, up to the maximum interval."""
+    scheduler = AdaptivePollScheduler()
+
+    scheduler.observe_rate_limited(None)
+    assert scheduler.next_interval() == timedelta(seconds=RATE_LIMIT_BACKOFF_SECONDS)
+
+    scheduler.observe_rate_limited(None)
+    assert scheduler.next_interval() == timedelta(
+        seconds=2 * RATE_LIMIT_BACKOFF_SECONDS
+    )
+
+    for _ in range(10):
+        scheduler.observe_rate_limited(None)
+    assert scheduler.next_interval() == timedelta(seconds=MAX_UPDATE_INTERVAL_SECONDS)
+
+
+def test_backoff_honours_retry_after() -> None:
+    """Retry-After is a lower bound for the backoff."""
+    scheduler = AdaptivePollScheduler()
+
+    scheduler.observe_rate_limited({"Retry-After": "5000"})
+
+    assert scheduler.next_interval() == timedelta(seconds=5000)
+
+
+def test_success_ends_backoff() -> None:
+    """A successful refresh returns to the normal interval."""
+    scheduler = AdaptivePollScheduler()
+    scheduler.observe_rate_limited(None)
+
+    scheduler.observe_refresh(False)
+
+    assert scheduler.next_interval() == timedelta(seconds=UPDATE_INTERVAL_SECONDS)
+
+
+def test_critical_daily_usage_slows_down() -> None:
+    """Nearly exhausting the daily budget polls at the longest interval."""
+    scheduler = AdaptivePollScheduler()
+
+    scheduler.observe_headers(
+        {"X-RateLimit-Limit": "100,1000", "X-RateLimit-Usage": "1,990"}
+    )
+
+    assert scheduler.next_interval() == timedelta(seconds=MAX_UPDATE_INTERVAL_SECONDS)
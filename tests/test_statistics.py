@@ -0,0 +1,81 @@
+"""Tests for the Strava Bike Maintenance long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.strava_bike_maintenance import statistics
+from custom_components.strava_bike_maintenance.api import StravaRide
+from custom_components.strava_bike_maintenance.components import ComponentRegistry
+from custom_components.strava_bike_maintenance.statistics import (
+    WearStatistics,
+    wear_statistic_id,
+)
+from custom_components.strava_bike_maintenance.wear import WearCounterManager
+
+DAY_SECONDS = 86400
+
+
+async def test_imported_wear_matches_live_counter(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Wear imported after a backfill ends at the live counter's value."""
+    freezer.move_to("2026-06-01 12:00:00+00:00")
+    tracked_since = dt_util.utcnow().timestamp()
+    manager = WearCounterManager(hass, "entry", components=("chain",))
+    await manager.async_process_bikes({"b1": 100.0})
+    freezer.tick(timedelta(days=1))
+    wear = await manager.async_process_bikes({"b1": 130.0})
+
+    # The backfill walks back through every ride, including the tracked one.
+    rides = [
+        StravaRide(
+            activity_id=activity_id,
+            gear_id="b1",
+            start_ts=int(start_ts),
+            distance_km=distance_km,
+        )
+        for activity_id, start_ts, distance_km in (
+            (3, tracked_since + 3600, 30.0),
+            (2, tracked_since - 2 * DAY_SECONDS, 40.0),
+            (1, tracked_since - 5 * DAY_SECONDS, 60.0),
+        )
+    ]
+    await manager.async_begin_backfill()
+    await manager.async_process_backfill(rides)
+    await manager.async_finish_backfill()
+    # A rerun keeps when tracking began and leaves the counters alone.
+    await manager.async_restart_backfill()
+    await manager.async_process_backfill(rides)
+    await manager.async_finish_backfill()
+
+    data = {
+        "b1": {
+            "name": "Road bike",
+            "distance_km": 130.0,
+            "wear_counters": wear["b1"],
+        }
+    }
+    imported = {}
+    with patch.object(
+        statistics,
+        "async_add_external_statistics",
+        lambda hass, metadata, rows: imported.update(
+            {metadata["statistic_id"]: rows}
+        ),
+    ):
+        WearStatistics(hass, ComponentRegistry.from_options({})).async_import_history(
+            data, manager.history, manager.tracked_since
+        )
+
+    assert manager.tracked_since == {"b1": tracked_since}
+    assert wear["b1"]["chain"] == 30.0
+    assert (await manager.async_get_wear_snapshot("b1"))["chain"] == 30.0
+    assert imported[wear_statistic_id("b1", "chain")][-1]["state"] == 30.0
+    await manager.async_flush()
@@ -0,0 +1,92 @@
+"""Tests for the Strava Bike Maintenance wear counters."""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.strava_bike_maintenance.api import StravaRide
+from custom_components.strava_bike_maintenance.wear import WearCounterManager
+
+START_TS = 1_700_000_000
+
+
+def _ride(activity_id: int = 1, distance_km: float = 25.0) -> StravaRide:
+    return StravaRide(
+        activity_id=activity_id,
+        gear_id="b1",
+        start_ts=START_TS + 3600,
+        distance_km=distance_km,
+        sport_type="Ride",
+    )
+
+
+async def _synced_manager(hass: HomeAssistant) -> WearCounterManager:
+    manager = WearCounterManager(hass, "entry")
+    await manager.async_process_bikes({"b1": 100.0}, accrue=False)
+    await manager.async_start_activity_sync(START_TS)
+    return manager
+
+
+async def test_ride_applied_once(hass: HomeAssistant) -> None:
+    """Fetching the same ride again does not count it twice."""
+    manager = await _synced_manager(hass)
+
+    await manager.async_process_activities([_ride()])
+    snapshot = await manager.async_process_activities([_ride()])
+
+    assert snapshot["b1"]["chain"] == 25.0
+    assert (await manager.async_get_total_distances())["b1"] == 125.0
+    assert manager.activity_cursor == START_TS + 3600
+    await manager.async_flush()
+
+
+async def test_edited_ride_counts_difference(hass: HomeAssistant) -> None:
+    """An edited distance only changes the counters by the difference."""
+    manager = await _synced_manager(hass)
+
+    await manager.async_process_activities([_ride(distance_km=25.0)])
+    snapshot = await manager.async_process_activities([_ride(distance_km=30.0)])
+
+    assert snapshot["b1"]["chain"] == 30.0
+    assert (await manager.async_get_total_distances())["b1"] == 130.0
+    await manager.async_flush()
+
+
+async def test_deleted_ride_unapplied(hass: HomeAssistant) -> None:
+    """Deleting a ride takes its distance back out of the bike."""
+    manager = await _synced_manager(hass)
+    await manager.async_process_activities([_ride()])
+
+    assert await manager.async_remove_activity(1) == "b1"
+    assert await manager.async_remove_activity(1) is None
+
+    assert (await manager.async_get_wear_snapshot("b1"))["chain"] == 0.0
+    assert (await manager.async_get_total_distances())["b1"] == 100.0
+    await manager.async_flush()
+
+
+async def test_rides_before_sync_start_not_counted(hass: HomeAssistant) -> None:
+    """Rides from before sync started are already part of the totals."""
+    manager = await _synced_manager(hass)
+    older = StravaRide(
+        activity_id=2, gear_id="b1", start_ts=START_TS - 3600, distance_km=40.0
+    )
+
+    snapshot = await manager.async_process_activities([older])
+
+    assert snapshot["b1"]["chain"] == 0.0
+    assert (await manager.async_get_total_distances())["b1"] == 100.0
+    assert manager.activity_gear_id(2) == "b1"
+    await manager.async_flush()
+
+
+async def test_totals_accrue_delta(hass: HomeAssistant) -> None:
+    """Totals mode adds each increase of the lifetime distance."""
+    manager = WearCounterManager(hass, "entry")
+
+    first = await manager.async_process_bikes({"b1": 100.0})
+    second = await manager.async_process_bikes({"b1": 112.5})
+
+    assert first["b1"]["chain"] == 0.0
+    assert second["b1"]["chain"] == 12.5
+    await manager.async_flush()